@@ -23,7 +23,12 @@ Jupyter/Colab 한글 폰트 및 pandas 확장 모듈
     helper.cache_save(key, model)                           # 모델 저장
     model = helper.cache_load(key)                          # 모델 로드
     helper.cache_exists(key)                                # 키 존재 확인
+    helper.cache_save_stream(key, chunks)                   # 청크 단위 스트리밍 저장
+    for chunk in helper.cache_load(key, stream=True): ...   # 청크 단위 로드
     helper.cache_info()                                     # 캐시 정보
+    helper.cache_verify()                                   # 레코드별 체크섬 검증
+    helper.cache_stats()                                    # 항목별 크기/접근 시간 (DataFrame)
+    helper.cache_gc(max_bytes=1024**3)                      # 부속 파일 정리 및 용량 제한
     helper.cache_clear()                                    # 캐시 초기화
 
 🆕 v2.2.0 개선사항:
@@ -41,19 +46,34 @@ Jupyter/Colab 한글 폰트 및 pandas 확장 모듈
 # =============================================================================
 
 # Standard library imports
+import abc
+import bisect
+import contextlib
+import copy
 import datetime
+import functools
 import gzip
 import hashlib
 import json
+import lzma
 import os
 import pickle
+import random
+import re
 import shutil
+import socket
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+import tracemalloc
 import urllib.request
+import uuid
 import warnings
-import datetime
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # Third-party imports
 import matplotlib.font_manager
@@ -76,6 +96,18 @@ try:
 except ImportError:
     COLAB_AVAILABLE = False
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import fsspec
+    FSSPEC_AVAILABLE = True
+except ImportError:
+    FSSPEC_AVAILABLE = False
+
 
 # =============================================================================
 # CONSTANTS AND GLOBAL VARIABLES
@@ -87,12 +119,55 @@ __version__ = "2.4.0"
 __font_path = ""
 is_colab = False
 
+# Cache memory accounting
+__DEEP_SIZEOF_SAMPLE = 1000  # object 배열 원소가 이보다 많으면 표본만 재서 전체 크기를 추정
+
 # Pandas commit system
 __COMMIT_META_FILE = "pandas_df.json"
+__COLUMNAR_MAGIC = b"HCOL1\x00\x00\x00"
+__COLUMNAR_ROW_GROUP_ROWS = 131072  # row group 크기 (부분 읽기 단위)
+__CHECKOUT_CACHE_BYTES = 512 * 1024 ** 2  # 체크아웃 메모리 캐시 기본 용량
+__mmap_cache_dir = None  # memory-map 캐시 디렉토리 (None이면 로컬 임시 디렉토리, mmap_cache_set_dir)
+__mmap_cache_bytes = 4 * 1024 ** 3  # memory-map 캐시 용량 (넘으면 오래 안 쓴 파일부터 삭제)
+__commit_compression = "balanced"  # 커밋 블록 압축 수준 ('fast' | 'balanced' | 'small')
+__CODEC_TAGS = {"zlib": b"z", "lzma": b"x", "zstd": b"s", "none": b"n"}  # 블록 payload 헤더의 코덱 표시
 __pd_root_base = None
 __last_setup_time = None  # 모듈 전역 변수로 선언 (출력 메시지 컨트롤)
 __is_setup_print_log = False
 
+# Local staging (write-back)
+__staging = None
+
+# 커밋 메타데이터 인덱스 캐시 {메타 파일 경로: (파일 시그니처, _CommitIndex)}
+__commit_index_cache = {}
+
+# 커밋 메타데이터 잠금 (스레드별로 이미 잡은 잠금 {메타 파일 경로: 중첩 횟수})
+__commit_lock_held = threading.local()
+__COMMIT_LOCK_TIMEOUT = 60.0  # 잠금 대기 최대 시간 (초)
+__COMMIT_LOCK_STALE = 300.0   # 이보다 오래 갱신되지 않은 잠금 파일은 비정상 종료로 남은 것으로 간주 (초)
+__COMMIT_LOCK_HEARTBEAT = 30.0  # 잠금을 잡고 있는 동안 잠금 파일 mtime을 갱신하는 주기 (초)
+
+# pd_commit_list 기본 컬럼 (지문/계측값 같은 내부 필드는 stats=True 또는 commit_stats로 확인)
+__COMMIT_LIST_COLUMNS = ("index", "hash", "datetime", "msg", "file", "rows", "cols", "size", "mtime", "type", "tags")
+
+# 객체 팩 인덱스 캐시 {팩 디렉토리: (.idx 파일 이름 집합, {객체 해시: (팩 파일 경로, offset, length)})}
+__pack_index_cache = {}
+
+# 커밋 계측: 메모리 추적(tracemalloc) 사용자 수/시작 횟수와 세션 중 체크아웃 읽기 기록 {커밋 해시: [횟수, 초, 바이트]}
+__commit_trace = {"users": 0, "owner": False, "starts": 0}
+__commit_trace_lock = threading.Lock()
+__commit_trace_local = threading.local()
+__checkout_reads = {}
+
+# 블록 압축/해제 스레드 풀 (zlib/lzma/zstd 모두 GIL을 풀고 동작)
+__codec_executor = None
+__codec_lock = threading.Lock()
+
+# 백그라운드 커밋 (단일 작업자로 제출 순서대로 기록)
+__commit_executor = None
+__commit_futures = []
+__commit_lock = threading.Lock()
+
 # __DEBUG_ON = True
 __DEBUG_ON = False
 
@@ -129,6 +204,53 @@ def _format_value(value):
         # 예외 발생 시 안전하게 문자열로 변환
         return str(value)
 
+def _deep_sizeof(obj):
+    """
+    객체의 실제 메모리 사용량(bytes)을 추정합니다.
+    ndarray는 nbytes, DataFrame/Series/Index는 memory_usage(deep=True)를 사용하고
+    컨테이너는 내부 항목까지 따라가며 합산합니다. 같은 객체(순환 참조 포함)는 한 번만 셉니다.
+    object 배열은 원소가 많으면 고르게 뽑은 표본의 평균 크기로 전체를 추정합니다. (복사본을 만들지 않음)
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        
+        if isinstance(o, np.ndarray):
+            # 데이터를 소유하지 않은 view는 getsizeof에 데이터 크기가 빠져 있음
+            total += sys.getsizeof(o) + (0 if o.flags.owndata else o.nbytes)
+            if o.dtype == np.object_ and o.size:
+                flat = o.reshape(-1, order='A') if o.flags.forc else o.flat
+                if o.size <= __DEEP_SIZEOF_SAMPLE:
+                    stack.extend(flat)
+                else:
+                    positions = np.linspace(0, o.size - 1, __DEEP_SIZEOF_SAMPLE).astype(np.intp)
+                    sample = sum(_deep_sizeof(flat[i]) for i in positions)
+                    total += int(sample * o.size / len(positions))
+        elif isinstance(o, pd.DataFrame):
+            total += int(o.memory_usage(index=True, deep=True).sum())
+            stack.append(o.attrs)
+        elif isinstance(o, (pd.Series, pd.Index)):
+            total += int(o.memory_usage(deep=True))
+        elif isinstance(o, dict):
+            total += sys.getsizeof(o)
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            total += sys.getsizeof(o)
+            stack.extend(o)
+        elif isinstance(o, (str, bytes, bytearray, int, float, bool, complex)) or o is None:
+            total += sys.getsizeof(o)
+        else:
+            total += sys.getsizeof(o)
+            if hasattr(o, '__dict__'):
+                stack.append(o.__dict__)
+    return total
+
 def font_download():
     """폰트를 다운로드하거나 설치합니다."""
     global __font_path
@@ -438,27 +560,282 @@ def pd_root(commit_dir=None):
     else:
         return os.path.abspath(".")
 
-def _load_commit_meta(commit_dir=None):
-    """커밋 메타데이터를 로드합니다."""
-    meta_file = os.path.join(os.path.join(pd_root(commit_dir), ".commit_pandas"), __COMMIT_META_FILE)
-    if os.path.exists(meta_file):
+def _commit_save_dir(commit_dir=None):
+    """커밋 파일이 저장되는 .commit_pandas 경로 (스테이징 중이면 로컬 경로)"""
+    return _stage_local(os.path.join(pd_root(commit_dir), ".commit_pandas"))
+
+class _CommitIndex:
+    """
+    커밋 메타데이터(pandas_df.json)의 메모리 인덱스
+    hash/msg/datetime → 레코드 조회는 O(1), 순서번호 조회는 리스트 인덱싱으로 처리합니다.
+    시간 범위/시점 조회는 시간순으로 정렬한 목록에서 이진 탐색으로 처리합니다. (처음 필요할 때 한 번 정렬)
+    """
+    def __init__(self, records):
+        self.records = list(records)
+        self._reindex()
+
+    def _reindex(self):
+        self._timeline = None
+        self.by_hash = {}
+        self.by_msg = {}
+        self.by_datetime = {}
+        self._positions = {}
+        for i, record in enumerate(self.records):
+            self._add_keys(record, i)
+
+    def _add_keys(self, record, position):
+        self.by_hash.setdefault(record["hash"], record)
+        self.by_msg.setdefault(record["msg"], record)
+        self.by_datetime.setdefault(record["datetime"], record)
+        self._positions[id(record)] = position
+
+    def __len__(self):
+        return len(self.records)
+
+    def copy(self):
+        """갱신용 사본 (레코드 dict까지 복사하므로 사본을 고쳐도 공유 인덱스는 바뀌지 않음)"""
+        return _CommitIndex(dict(record) for record in self.records)
+
+    def resolve(self, idx_or_hash):
+        """순서번호, 해시, 메시지, 시간 문자열로 (순서번호, 레코드)를 찾음. 없으면 (None, None)"""
+        if isinstance(idx_or_hash, (int, np.integer)) and not isinstance(idx_or_hash, bool):
+            if 0 <= idx_or_hash < len(self.records):
+                return int(idx_or_hash), self.records[idx_or_hash]
+            return None, None
+        try:
+            record = (self.by_hash.get(idx_or_hash) or self.by_msg.get(idx_or_hash)
+                      or self.by_datetime.get(idx_or_hash))
+        except TypeError:  # 해시 불가능한 입력
+            return None, None
+        if record is None:
+            return None, None
+        return self._positions[id(record)], record
+
+    def timeline(self):
+        """(시간 문자열 목록, 레코드 목록) — 시간순 정렬, 같은 시간이면 기록 순서"""
+        if self._timeline is None:
+            ordered = sorted(self.records, key=lambda m: m["datetime"])
+            self._timeline = ([m["datetime"] for m in ordered], ordered)
+        return self._timeline
+
+    def between(self, since=None, until=None):
+        """since 이후 until 이전(경계 포함) 레코드 목록 (시간순, 시간 문자열 인자)"""
+        times, ordered = self.timeline()
+        start = 0 if since is None else bisect.bisect_left(times, since)
+        stop = len(times) if until is None else bisect.bisect_right(times, until)
+        return ordered[start:stop]
+
+    def append(self, record):
+        self.records.append(record)
+        self._add_keys(record, len(self.records) - 1)
+        self._timeline = None
+
+    def remove(self, record):
+        position = self._positions[id(record)]
+        self.records.pop(position)
+        self._timeline = None
+        if position == len(self.records):
+            # 마지막 레코드 삭제는 인덱스 전체를 다시 만들 필요 없음
+            del self._positions[id(record)]
+            for table, key in ((self.by_hash, "hash"), (self.by_msg, "msg"), (self.by_datetime, "datetime")):
+                if table.get(record[key]) is record:
+                    del table[record[key]]
+        else:
+            self._reindex()
+
+
+def _commit_meta_file(commit_dir=None):
+    """커밋 메타데이터 파일 경로"""
+    return os.path.join(_commit_save_dir(commit_dir), __COMMIT_META_FILE)
+
+def _temp_path(path):
+    """원자적 교체용 임시 파일 경로 (프로세스/스레드마다 달라 동시 기록이 충돌하지 않음)"""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+def _lock_owner(lock_file):
+    """잠금 파일에 기록된 소유자 정보 {'pid', 'host', 'token', 'time'} (읽을 수 없으면 None)"""
+    try:
+        with open(lock_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _lock_break_stale(lock_file):
+    """
+    오래된 잠금 파일을 안전하게 제거. 제거했으면 True
+    잠금 파일을 고유한 이름으로 원자적으로 옮긴 뒤, 옮긴 파일이 처음 확인한 오래된 소유자의 것일 때만 삭제합니다.
+    그 사이 다른 프로세스가 잠금을 새로 잡았으면 되돌려 놓습니다.
+    """
+    try:
+        st = os.stat(lock_file)
+    except FileNotFoundError:
+        return True  # 그 사이 잠금이 풀림
+    if time.time() - st.st_mtime <= __COMMIT_LOCK_STALE:
+        return False
+    owner = _lock_owner(lock_file)
+    broken = f"{lock_file}.{uuid.uuid4().hex}.stale"
+    try:
+        os.rename(lock_file, broken)
+    except FileNotFoundError:
+        return True  # 다른 프로세스가 먼저 제거함
+    moved = os.stat(broken)
+    fresh = time.time() - moved.st_mtime <= __COMMIT_LOCK_STALE
+    if fresh or _lock_owner(broken) != owner:
+        # 확인과 이동 사이에 다른 프로세스가 잡은 살아 있는 잠금 → 되돌림 (그 사이 또 잡혔으면 그대로 둠)
+        try:
+            os.link(broken, lock_file)
+        except OSError:
+            pass
+        os.remove(broken)
+        return False
+    os.remove(broken)
+    owner = owner or {}
+    print(f"경고: 오래된 커밋 잠금을 제거했습니다. (pid {owner.get('pid')}, host {owner.get('host')})")
+    return True
+
+def _lock_heartbeat(lock_file, token, stop):
+    """잠금을 잡고 있는 동안 주기적으로 mtime을 갱신해 오래 걸리는 작업의 잠금이 만료되지 않게 함"""
+    while not stop.wait(__COMMIT_LOCK_HEARTBEAT):
+        owner = _lock_owner(lock_file)
+        if owner is None or owner.get("token") != token:
+            print(f"경고: 커밋 잠금을 잃었습니다: {lock_file}")
+            return
+        try:
+            os.utime(lock_file)
+        except FileNotFoundError:
+            return
+
+@contextlib.contextmanager
+def _commit_meta_lock(commit_dir=None):
+    """
+    커밋 메타데이터 갱신용 프로세스 간 잠금 (pandas_df.json.lock)
+    잠금 파일을 O_EXCL로 만들어 획득하고, 실패하면 지수 백오프로 재시도합니다.
+    잠금 파일에는 소유자(pid/host/token)를 기록하고, 잡고 있는 동안 백그라운드에서 mtime을 갱신합니다.
+    같은 스레드에서 중첩해서 잡으면 다시 잠그지 않습니다. 읽기는 잠금 없이 합니다.
+    """
+    meta_file = _commit_meta_file(commit_dir)
+    held = getattr(__commit_lock_held, "files", None)
+    if held is None:
+        held = __commit_lock_held.files = {}
+    if held.get(meta_file):
+        held[meta_file] += 1
+        try:
+            yield
+        finally:
+            held[meta_file] -= 1
+        return
+
+    lock_file = meta_file + ".lock"
+    os.makedirs(os.path.dirname(lock_file), exist_ok=True)
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + __COMMIT_LOCK_TIMEOUT
+    delay = 0.01
+    while True:
+        try:
+            fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if _lock_break_stale(lock_file):
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"커밋 메타데이터 잠금을 얻지 못했습니다: {lock_file}")
+            time.sleep(delay * (0.5 + random.random()))
+            delay = min(delay * 2, 0.5)
+            continue
+        with os.fdopen(fd, "w") as f:
+            json.dump({"pid": os.getpid(), "host": socket.gethostname(), "token": token, "time": time.time()}, f)
+        break
+
+    held[meta_file] = 1
+    stop = threading.Event()
+    heartbeat = threading.Thread(target=_lock_heartbeat, args=(lock_file, token, stop),
+                                 name="helper-commit-lock", daemon=True)
+    heartbeat.start()
+    try:
+        yield
+    finally:
+        held.pop(meta_file, None)
+        stop.set()
+        heartbeat.join()
+        owner = _lock_owner(lock_file)
+        if owner is not None and owner.get("token") == token:
+            try:
+                os.remove(lock_file)
+            except FileNotFoundError:
+                pass
+        else:
+            print(f"경고: 커밋 잠금이 작업 도중 다른 프로세스에 의해 제거되었습니다: {lock_file}")
+
+def _commit_meta_signature(meta_file):
+    """메타데이터 파일이 바뀌었는지 판단하기 위한 (inode, mtime, size)"""
+    try:
+        st = os.stat(meta_file)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _load_commit_index(commit_dir=None, for_update=False):
+    """
+    커밋 메타데이터 인덱스를 반환합니다.
+    파일이 바뀌지 않았으면 다시 파싱하지 않고 메모리의 인덱스를 그대로 사용합니다.
+    for_update=True이면 고쳐도 되는 사본을 반환합니다. (_commit_meta_lock 안에서 사용)
+    파일이 손상되었으면 .corrupt-<시각> 백업을 남기고 RuntimeError를 발생시킵니다.
+    (빈 기록으로 이어 가면 다음 저장이 기존 기록을 덮어쓰기 때문)
+    사본은 _save_commit_index가 파일 저장에 성공한 뒤에만 공유 인덱스를 대체하므로,
+    저장 도중 실패해도 다른 조회/gc가 디스크에 없는 커밋을 보지 않습니다.
+    """
+    meta_file = _stage_pull(_commit_meta_file(commit_dir))
+    signature = _commit_meta_signature(meta_file)
+    cached = __commit_index_cache.get(meta_file)
+    if cached is not None and signature is not None and cached[0] == signature:
+        return cached[1].copy() if for_update else cached[1]
+
+    records = []
+    if signature is not None:
         try:
             with open(meta_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
-    return []
-
-def _save_commit_meta(meta, commit_dir=None):
-    """커밋 메타데이터를 저장합니다."""
-    meta_file = os.path.join(os.path.join(pd_root(commit_dir), ".commit_pandas"), __COMMIT_META_FILE)
-    os.makedirs(os.path.dirname(meta_file), exist_ok=True)
-    with open(meta_file, "w", encoding="utf-8") as f:
-        json.dump(meta, f, ensure_ascii=False, indent=2)
-
-def _generate_commit_hash(dt, msg):
-    """커밋 해시를 생성합니다."""
-    base = f"{dt.strftime('%Y%m%d_%H%M%S')}_{msg}"
+                records = json.load(f)
+        except FileNotFoundError:
+            records = []
+        except json.JSONDecodeError as e:
+            # 빈 기록으로 이어 가면 다음 커밋이 파일을 덮어써서 기록 전체를 잃으므로,
+            # 백업을 남기고 복구될 때까지 읽기/쓰기를 모두 거부함
+            backup = f"{meta_file}.corrupt-{signature[1] // 1_000_000_000}"
+            if not os.path.exists(backup):
+                shutil.copy2(meta_file, backup)
+            raise RuntimeError(f"커밋 메타데이터가 손상되었습니다: {meta_file} ({e}). "
+                               f"원본 백업: {backup} — 파일을 복구하거나 백업에서 되살린 뒤 다시 시도하세요.") from e
+    index = _CommitIndex(records)
+    __commit_index_cache[meta_file] = (signature, index)
+    return index.copy() if for_update else index
+
+def _save_commit_index(index, commit_dir=None):
+    """
+    커밋 메타데이터 인덱스를 파일에 저장합니다.
+    임시 파일에 기록한 뒤 교체하므로 읽는 쪽은 항상 완전한 파일을 봅니다.
+    다른 프로세스의 갱신을 잃지 않도록 _commit_meta_lock 안에서 _load_commit_index(for_update=True)로
+    다시 읽은 사본을 수정해서 저장해야 합니다. 저장에 성공해야 사본이 공유 인덱스가 됩니다.
+    """
+    meta_file = _commit_meta_file(commit_dir)
+    temp_file = _temp_path(meta_file)
+    try:
+        os.makedirs(os.path.dirname(meta_file), exist_ok=True)
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(index.records, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, meta_file)
+    except Exception:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        # 메모리 인덱스와 파일이 어긋나지 않도록 다음 로드 때 다시 읽음
+        __commit_index_cache.pop(meta_file, None)
+        raise
+    __commit_index_cache[meta_file] = (_commit_meta_signature(meta_file), index)
+    _stage_push(meta_file)
+
+def _generate_commit_hash(fingerprint, msg):
+    """커밋 해시를 생성합니다. (내용 지문 + 메시지 기반이므로 같은 초에 커밋해도 충돌하지 않음)"""
+    base = f"{fingerprint}_{msg}"
     return hashlib.md5(base.encode("utf-8")).hexdigest()[:12]
 
 
@@ -511,6 +888,7 @@ def set_pandas_extension():
     setattr(pd.DataFrame, "commit_list", classmethod(_df_commit_list))
     setattr(pd.DataFrame, "commit_rm", classmethod(_df_commit_rm))
     setattr(pd.DataFrame, "commit_has", classmethod(_df_commit_has))
+    setattr(pd.Series, "commit", _df_commit)
 
 # =============================================================================
 # FONT MANAGEMENT FUNCTIONS
@@ -605,33 +983,44 @@ def setup():
 
 # pandas commit 시스템 DataFrame 메소드 wrappers
 
-def _df_commit(self, msg, commit_dir=None):
+def _df_commit(self, msg, commit_dir=None, background=False, compression=None, trace_memory=False):
     """
     DataFrame의 현재 상태를 커밋합니다.
     사용법:
         df.commit("커밋 메시지")
+        future = df.commit("커밋 메시지", background=True)  # 백그라운드 저장
+        df.commit("커밋 메시지", compression="fast")        # 압축 수준 지정
+        series.commit("커밋 메시지")                        # Series도 같은 방식으로 커밋
+        df.commit("커밋 메시지", trace_memory=True)         # 커밋 중 메모리 최대치 기록 (commit_stats 참고)
     """
-    return pd_commit(self, msg, commit_dir)
+    return pd_commit(self, msg, commit_dir, background=background, compression=compression, trace_memory=trace_memory)
 
 
 
 @classmethod
-def _df_checkout(cls, idx_or_hash, commit_dir=None):
+def _df_checkout(cls, idx_or_hash, commit_dir=None, columns=None, rows=None, member=None, chunksize=None, mmap=False):
     """
     DataFrame 커밋 기록에서 특정 커밋을 체크아웃합니다.
     사용법:
         pd.DataFrame.checkout(0)
+        pd.DataFrame.checkout("원본", columns=["a", "b"], rows=slice(-10000, None))
+        pd.DataFrame.checkout("분할", member="train")  # 묶음 커밋의 멤버 하나
+        for chunk in pd.DataFrame.checkout("원본", chunksize=100_000): ...
+        pd.DataFrame.checkout("원본", mmap=True)  # 숫자 컬럼을 읽기 전용 memory-map으로
     """
-    return pd_checkout(idx_or_hash, commit_dir)
+    return pd_checkout(idx_or_hash, commit_dir, columns=columns, rows=rows, member=member,
+                       chunksize=chunksize, mmap=mmap)
 
 @classmethod
-def _df_commit_list(cls, commit_dir=None):
+def _df_commit_list(cls, commit_dir=None, since=None, until=None, msg_contains=None, stats=False):
     """
     DataFrame의 커밋 목록을 반환합니다.
     사용법:
         pd.DataFrame.commit_list()
+        pd.DataFrame.commit_list(since="2025-07-01", msg_contains="전처리")
+        pd.DataFrame.commit_list(stats=True)  # 커밋별 계측값 (pd_commit_list 참고)
     """
-    return pd_commit_list(commit_dir)
+    return pd_commit_list(commit_dir, since=since, until=until, msg_contains=msg_contains, stats=stats)
 
 @classmethod
 def _df_commit_rm(cls, idx_or_hash, commit_dir=None):
@@ -687,7 +1076,7 @@ def cache_save(key, value, cache_file=None):
     Parameters:
     -----------
     key : str
-        저장할 때 사용할 키
+        저장할 때 사용할 키 ('__helper_meta__'는 내부 메타데이터용 예약 키라 사용할 수 없음)
     value : any
         저장할 데이터 (DataFrame, numpy array, 일반 객체 등)
     cache_file : str, optional
@@ -712,7 +1101,34 @@ def cache_save(key, value, cache_file=None):
     """
     return DataCatch.save(key, value, cache_file)
 
-def cache_load(key, cache_file=None):
+def cache_save_stream(key, iterable, cache_file=None):
+    """
+    청크 단위로 생성되는 데이터를 메모리에 모으지 않고 캐시에 저장
+    
+    Parameters:
+    -----------
+    key : str
+        저장할 때 사용할 키
+    iterable : iterable
+        청크를 순서대로 생성하는 이터러블 (제너레이터, pd.read_csv(chunksize=...) 등)
+    cache_file : str, optional
+        캐시 파일 경로 (cache_save와 동일)
+    
+    Returns:
+    --------
+    bool : 저장 성공 여부
+    
+    Examples:
+    ---------
+    >>> import helper.c0z0c.dev as helper
+    >>> reader = pd.read_csv("big.csv", chunksize=100_000)
+    >>> helper.cache_save_stream("big_csv", reader)
+    >>> for chunk in helper.cache_load("big_csv", stream=True):
+    >>>     process(chunk)
+    """
+    return DataCatch.save_stream(key, iterable, cache_file)
+
+def cache_load(key, cache_file=None, stream=False):
     """
     캐시에서 데이터 로드
     
@@ -727,6 +1143,11 @@ def cache_load(key, cache_file=None):
           * 로컬: cache.json
         - 상대 경로: Colab에서 /content/drive/MyDrive/ 하위에서 자동 탐색
         - 절대 경로: 지정된 경로에서 로드
+    stream : bool, optional
+        True이면 청크를 하나씩 반환하는 이터레이터를 반환 (기본값: False)
+        - cache_save_stream으로 저장한 항목: 저장된 청크 순서대로 반환
+        - 일반 항목: 값 하나만 반환
+        False일 때 스트림 항목은 하나로 결합됩니다 (DataFrame/Series/ndarray는 concat, 그 외는 리스트)
     
     Returns:
     --------
@@ -740,7 +1161,7 @@ def cache_load(key, cache_file=None):
     >>> if model:
     >>>     print("캐시에서 모델 로드됨")
     """
-    return DataCatch.load(key, cache_file)
+    return DataCatch.load(key, cache_file, stream=stream)
 
 def cache_exists(key, cache_file=None):
     """
@@ -843,6 +1264,39 @@ def cache_info(cache_file=None):
     """
     DataCatch.cache_info(cache_file)
 
+def cache_stats(cache_file=None, sort_by='memory_bytes', ascending=False):
+    """
+    캐시 항목별 크기 정보를 정렬 가능한 DataFrame으로 반환
+    
+    Parameters:
+    -----------
+    cache_file : str, optional
+        캐시 파일 경로 (기본값: cache.json)
+    sort_by : str, optional
+        정렬 기준 컬럼 (기본값: 'memory_bytes', None이면 저장 순서)
+    ascending : bool, optional
+        오름차순 정렬 여부 (기본값: False)
+    
+    Returns:
+    --------
+    pandas.DataFrame : 항목별 정보
+        - key: 캐시 키
+        - type: 저장 형태 (pandas_dataframe, numpy_array, stream, list 등)
+        - memory_bytes: 메모리 사용량 (중첩 컨테이너까지 포함한 추정치)
+        - serialized_bytes: 파일에 기록되는 크기 (stream은 청크 파일 합계)
+        - compressed_bytes: 압축 시 예상 크기
+        - compression_ratio: compressed_bytes / serialized_bytes
+        - last_access: 마지막 저장/로드 시간 (로컬 시간)
+    
+    Examples:
+    ---------
+    >>> import helper.c0z0c.dev as helper
+    >>> stats = helper.cache_stats()
+    >>> stats.head(10)  # 메모리를 가장 많이 쓰는 항목
+    >>> helper.cache_stats(sort_by='last_access', ascending=True)  # 오래 안 쓴 항목
+    """
+    return DataCatch.entry_stats(cache_file, sort_by=sort_by, ascending=ascending)
+
 def cache_list_keys(cache_file=None):
     """
     저장된 모든 키 목록 반환
@@ -898,6 +1352,97 @@ def cache_cleanup(days=30, cache_file=None):
     """
     return DataCatch.cleanup_cache(days, cache_file)
 
+def cache_verify(cache_file=None, repair=False, max_workers=None):
+    """
+    캐시 파일의 레코드별 체크섬을 스레드 풀로 병렬 검증
+    
+    저장 시에는 재파싱 없이 체크섬만 기록하고, 손상 여부는 이 함수로 필요할 때 확인합니다.
+    
+    Parameters:
+    -----------
+    cache_file : str, optional
+        캐시 파일 경로 (기본값: cache.json)
+    repair : bool, optional
+        True이면 손상된 항목만 캐시에서 제거하고 다시 저장 (기본값: False)
+    max_workers : int, optional
+        검증에 사용할 스레드 수 (기본값: ThreadPoolExecutor 기본값)
+    
+    Returns:
+    --------
+    dict : 검증 결과
+        - checked: 검사한 항목 수
+        - corrupted: 체크섬이 일치하지 않는 키 목록
+        - unchecked: 체크섬이 없는 키 목록 (이전 버전에서 저장된 항목)
+        - repaired: 손상 항목 제거 후 저장 여부
+    
+    Examples:
+    ---------
+    >>> import helper.c0z0c.dev as helper
+    >>> result = helper.cache_verify()
+    >>> if result['corrupted']:
+    >>>     helper.cache_verify(repair=True)  # 손상된 항목만 제거
+    """
+    return DataCatch.verify(cache_file, repair=repair, max_workers=max_workers)
+
+def cache_gc(max_bytes=None, cache_file=None):
+    """
+    캐시 부속 파일 정리 및 전체 용량 제한 적용
+    
+    cache.json 옆에 남는 .tmp, .corrupted, 오래된 .gz, 참조되지 않는 스트림 청크를 삭제합니다.
+    용량 제한이 있으면 .gz, .bak 순서로 삭제하고, 그래도 초과하면
+    가장 오래 접근하지 않은 항목부터 제거합니다.
+    
+    Parameters:
+    -----------
+    max_bytes : int, optional
+        캐시 파일 + 백업 + 부속 파일 전체 용량 제한 (기본값: cache_set_quota로 설정한 값)
+    cache_file : str, optional
+        캐시 파일 경로 (기본값: cache.json)
+    
+    Returns:
+    --------
+    dict : 정리 결과
+        - removed_files: 삭제된 파일/디렉토리 경로 목록
+        - evicted_keys: 용량 제한으로 제거된 키 목록
+        - reclaimed_bytes: 확보된 용량
+        - total_bytes: 정리 후 전체 용량
+        - quota_bytes: 적용된 용량 제한
+    
+    Examples:
+    ---------
+    >>> import helper.c0z0c.dev as helper
+    >>> helper.cache_gc()                           # 고아 파일만 정리
+    >>> helper.cache_gc(max_bytes=500 * 1024**2)    # 500MB 이하로 유지
+    """
+    return DataCatch.gc(max_bytes, cache_file)
+
+def cache_set_quota(max_bytes, auto_gc=False):
+    """
+    캐시 전체 용량 제한 설정
+    
+    cache_gc()를 인자 없이 호출하면 이 제한을 적용합니다.
+    기본값에서는 캐시를 열 때 제한을 넘으면 경고만 출력하고 항목을 지우지 않습니다.
+    
+    Parameters:
+    -----------
+    max_bytes : int or None
+        캐시 파일 + 백업 + 부속 파일 전체 용량 제한 (None이면 제한 해제)
+    auto_gc : bool, optional
+        True이면 설정 시점과 캐시를 열 때 제한을 넘으면 cache_gc()를 자동 실행해
+        오래 접근하지 않은 항목부터 제거합니다. 제거한 키는 출력됩니다. (기본값: False)
+    
+    Returns:
+    --------
+    dict or None : 자동 정리를 실행했으면 cache_gc 결과, 아니면 None
+    
+    Examples:
+    ---------
+    >>> import helper.c0z0c.dev as helper
+    >>> helper.cache_set_quota(1024 ** 3)                # 1GB, 정리는 cache_gc()로 직접
+    >>> helper.cache_set_quota(1024 ** 3, auto_gc=True)  # 넘으면 자동 정리
+    """
+    return DataCatch.set_quota(max_bytes, auto_gc=auto_gc)
+
 def cache_size(cache_file=None):
     """
     캐시 크기(항목 수) 반환
@@ -1734,6 +2279,695 @@ def remove_head_ext(self, columns_name):
             print(f" '{name}' 컬럼 세트를 찾을 수 없습니다.")
 
 
+# =============================================================================
+# STORAGE BACKENDS
+# =============================================================================
+
+class StorageBackend(abc.ABC):
+    """
+    스테이징 모드(enable_staging)의 원격 스토리지 백엔드 기본 클래스
+    키는 루트 기준 '/'로 구분한 상대 경로입니다. 하위 클래스는 stat/get/put/delete/list/walk를 구현하고,
+    여러 파일을 가져오는 get_many와 디렉토리 단위 get_tree/put_tree는 스레드 풀로 병렬 처리됩니다.
+    백엔드는 스테이징 동기화에만 쓰입니다. 캐시(DataCatch)와 커밋 저장소는 항상 로컬 작업 디렉토리를
+    파일 API로 읽고 쓰며, 스테이징이 필요한 파일을 백엔드에서 가져오고 변경분을 백그라운드로 올립니다.
+    """
+    max_workers = 8  # get_many/put_tree 병렬 작업 수
+
+    @abc.abstractmethod
+    def stat(self, key):
+        """{'size', 'version'} (디렉토리면 {'dir': True, 'version'}), 없으면 None"""
+
+    @abc.abstractmethod
+    def get(self, key, local_path):
+        """파일 하나를 local_path로 가져옴 (임시 파일에 받은 뒤 교체)"""
+
+    @abc.abstractmethod
+    def put(self, local_path, key):
+        """로컬 파일 하나를 key로 올림"""
+
+    @abc.abstractmethod
+    def delete(self, key):
+        """파일 또는 디렉토리(하위 전체) 삭제. 없으면 무시"""
+
+    @abc.abstractmethod
+    def list(self, key):
+        """디렉토리 바로 아래 항목 이름 집합 (한 번의 호출로 조회, 없으면 빈 집합)"""
+
+    @abc.abstractmethod
+    def walk(self, key):
+        """디렉토리 아래 모든 파일의 키 목록"""
+
+    def exists(self, key):
+        return self.stat(key) is not None
+
+    def get_many(self, items):
+        """[(키, 로컬 경로), ...]를 병렬로 가져옴"""
+        items = list(items)
+        if len(items) <= 1:
+            for key, local_path in items:
+                self.get(key, local_path)
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="helper-storage") as pool:
+            list(pool.map(lambda item: self.get(*item), items))
+
+    def get_tree(self, key, local_dir):
+        """디렉토리 key 전체를 local_dir로 가져옴"""
+        os.makedirs(local_dir, exist_ok=True)
+        prefix = key.rstrip("/") + "/"
+        self.get_many((k, os.path.join(local_dir, *k[len(prefix):].split("/"))) for k in self.walk(key))
+
+    def put_tree(self, local_dir, key):
+        """로컬 디렉토리 전체로 key를 교체"""
+        self.delete(key)
+        items = []
+        for root, _, files in os.walk(local_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                items.append((path, "/".join([key] + os.path.relpath(path, local_dir).split(os.sep))))
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="helper-storage") as pool:
+            list(pool.map(lambda item: self.put(*item), items))
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class LocalStorage(StorageBackend):
+    """로컬 파일 시스템 백엔드 (Google Drive 마운트, 로컬 NVMe 등)"""
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+
+    def _path(self, key):
+        return os.path.join(self.root, *key.split("/")) if key else self.root
+
+    def stat(self, key):
+        try:
+            st = os.stat(self._path(key))
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if os.path.isdir(self._path(key)):
+            return {"dir": True, "version": st.st_mtime_ns}
+        return {"size": st.st_size, "version": st.st_mtime_ns}
+
+    def get(self, key, local_path):
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        temp = _temp_path(local_path)
+        shutil.copy2(self._path(key), temp)
+        os.replace(temp, local_path)
+
+    def put(self, local_path, key):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp = _temp_path(path)
+        shutil.copy2(local_path, temp)
+        os.replace(temp, path)
+
+    def delete(self, key):
+        path = self._path(key)
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def list(self, key):
+        return _scandir_names(self._path(key))
+
+    def walk(self, key):
+        keys = []
+        for root, _, files in os.walk(self._path(key)):
+            rel = os.path.relpath(root, self.root)
+            prefix = "" if rel == "." else "/".join(rel.split(os.sep)) + "/"
+            keys.extend(prefix + name for name in files)
+        return keys
+
+    def __repr__(self):
+        return f"LocalStorage({self.root!r})"
+
+
+class MemoryStorage(StorageBackend):
+    """메모리 백엔드 (테스트용, 프로세스가 끝나면 사라짐)"""
+    def __init__(self):
+        self._files = {}  # 키 → (bytes, version)
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def stat(self, key):
+        with self._lock:
+            if key in self._files:
+                data, version = self._files[key]
+                return {"size": len(data), "version": version}
+            prefix = key.rstrip("/") + "/"
+            versions = [v for k, (_, v) in self._files.items() if k.startswith(prefix)]
+        return {"dir": True, "version": max(versions)} if versions else None
+
+    def get(self, key, local_path):
+        with self._lock:
+            if key not in self._files:
+                raise FileNotFoundError(key)
+            data = self._files[key][0]
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        temp = _temp_path(local_path)
+        with open(temp, "wb") as f:
+            f.write(data)
+        os.replace(temp, local_path)
+
+    def put(self, local_path, key):
+        with open(local_path, "rb") as f:
+            data = f.read()
+        with self._lock:
+            self._version += 1
+            self._files[key] = (data, self._version)
+
+    def delete(self, key):
+        prefix = key.rstrip("/") + "/"
+        with self._lock:
+            for k in [k for k in self._files if k == key or k.startswith(prefix)]:
+                del self._files[k]
+
+    def list(self, key):
+        prefix = key.rstrip("/") + "/" if key else ""
+        with self._lock:
+            return {k[len(prefix):].split("/", 1)[0] for k in self._files if k.startswith(prefix)}
+
+    def walk(self, key):
+        prefix = key.rstrip("/") + "/"
+        with self._lock:
+            return [k for k in self._files if k.startswith(prefix)]
+
+    def __repr__(self):
+        return f"MemoryStorage({len(self._files)} files)"
+
+
+class FsspecStorage(StorageBackend):
+    """
+    fsspec 백엔드 (s3://, gs://, az://, memory:// 등 fsspec이 지원하는 모든 파일 시스템)
+    fsspec과 해당 프로토콜 패키지(s3fs, gcsfs 등)가 필요합니다.
+    """
+    def __init__(self, url, **storage_options):
+        if not FSSPEC_AVAILABLE:
+            raise ImportError("FsspecStorage를 사용하려면 fsspec 패키지가 필요합니다. (pip install fsspec)")
+        self.url = url
+        self.fs, self.root = fsspec.core.url_to_fs(url, **storage_options)
+        self.root = self.root.rstrip("/")
+
+    def _path(self, key):
+        return f"{self.root}/{key}" if key else self.root
+
+    def stat(self, key):
+        try:
+            info = self.fs.info(self._path(key))
+        except FileNotFoundError:
+            return None
+        version = next((info[k] for k in ("mtime", "LastModified", "ETag", "etag", "md5Hash", "generation")
+                        if info.get(k) is not None), info.get("size"))
+        version = str(version)
+        if info.get("type") == "directory":
+            return {"dir": True, "version": version}
+        return {"size": info.get("size"), "version": version}
+
+    def get(self, key, local_path):
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        temp = _temp_path(local_path)
+        self.fs.get_file(self._path(key), temp)
+        os.replace(temp, local_path)
+
+    def put(self, local_path, key):
+        self.fs.put_file(local_path, self._path(key))
+
+    def delete(self, key):
+        try:
+            self.fs.rm(self._path(key), recursive=True)
+        except FileNotFoundError:
+            pass
+
+    def list(self, key):
+        try:
+            return {p.rstrip("/").rsplit("/", 1)[-1] for p in self.fs.ls(self._path(key), detail=False)}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+
+    def walk(self, key):
+        root = self.root + "/"
+        return [p[len(root):] if p.startswith(root) else p for p in self.fs.find(self._path(key))]
+
+    def __repr__(self):
+        return f"FsspecStorage({self.url!r})"
+
+
+def _storage_backend(spec, remote_dir):
+    """enable_staging의 backend 인자를 StorageBackend로 변환 (None이면 remote_dir 로컬 백엔드)"""
+    if spec is None:
+        return LocalStorage(remote_dir)
+    if isinstance(spec, StorageBackend):
+        return spec
+    if spec == "memory":
+        return MemoryStorage()
+    if isinstance(spec, str) and "://" in spec:
+        return FsspecStorage(spec)
+    if isinstance(spec, (str, os.PathLike)):
+        return LocalStorage(spec)
+    raise TypeError(f"backend는 StorageBackend, 'memory', URL 또는 경로여야 합니다. 현재 타입: {type(spec)}")
+
+
+# =============================================================================
+# LOCAL STAGING (WRITE-BACK TO DRIVE)
+# =============================================================================
+
+class _StagingArea:
+    """
+    원격 경로(Google Drive 등) 아래의 파일을 로컬 디렉토리에서 읽고 쓰고,
+    변경된 파일은 백그라운드 스레드에서 원격 스토리지 백엔드로 동기화합니다.
+    remote_dir은 캐시/커밋 경로의 기준(논리 경로)이고, 실제 원격 저장은 backend가 담당합니다.
+    동기화 상태는 메모리에서 갱신하고, 로컬 디렉토리의 manifest 파일에는 동기화 묶음이 끝날 때 한 번 씁니다.
+    그 사이의 push/remove는 journal 파일에 한 줄씩 덧붙여 두어 세션이 끊겨도 다음 세션에서 다시 전송합니다.
+    """
+    MANIFEST_FILE = ".staging_manifest.json"
+    JOURNAL_FILE = ".staging_manifest.journal"
+
+    def __init__(self, local_dir, remote_dir, backend=None):
+        self.local_dir = os.path.abspath(local_dir)
+        self.remote_dir = os.path.abspath(remote_dir)
+        self.backend = _storage_backend(backend, self.remote_dir)
+        os.makedirs(self.local_dir, exist_ok=True)
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="helper-staging")
+        self._queued = set()      # 동기화 대기 중인 상대 경로
+        self._draining = False    # 동기화 작업이 실행 중이거나 예약됨
+        self._futures = []
+        self._batch_depth = 0     # batch() 중첩 깊이
+        self._batch = set()       # batch() 동안 모은 상대 경로
+        self._dirty = False       # manifest 파일에 아직 쓰지 않은 변경 있음
+        self._manifest = self._load_manifest()
+        self._journal = open(os.path.join(self.local_dir, self.JOURNAL_FILE), "a", encoding="utf-8")
+
+        # 이전 세션에서 동기화되지 못한 항목 재전송
+        self._enqueue([rel for rel, entry in self._manifest.items()
+                       if entry.get('state') in ('dirty', 'deleted')])
+
+    def _load_manifest(self):
+        path = os.path.join(self.local_dir, self.MANIFEST_FILE)
+        manifest = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                print("경고: 스테이징 manifest가 손상되어 새로 만듭니다.")
+        journal = os.path.join(self.local_dir, self.JOURNAL_FILE)
+        if os.path.exists(journal):
+            with open(journal, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rel, entry = json.loads(line)
+                    except (json.JSONDecodeError, ValueError):
+                        continue  # 기록 도중 끊긴 마지막 줄
+                    manifest[rel] = entry
+                    self._dirty = True
+        return manifest
+
+    def _save_manifest(self):
+        """manifest 전체를 파일로 쓰고 journal을 비움 (변경이 있을 때만)"""
+        path = os.path.join(self.local_dir, self.MANIFEST_FILE)
+        with self._lock:
+            if not self._dirty:
+                return
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(self._manifest, f, ensure_ascii=False)
+            os.replace(path + ".tmp", path)
+            self._journal.seek(0)
+            self._journal.truncate()
+            self._dirty = False
+
+    def _record(self, rel, entry, journal=False):
+        """manifest 항목을 메모리에서 갱신 (journal=True이면 journal에도 한 줄 추가)"""
+        with self._lock:
+            self._manifest[rel] = entry
+            self._dirty = True
+            if journal:
+                self._journal.write(json.dumps([rel, entry], ensure_ascii=False) + "\n")
+                self._journal.flush()
+
+    def _rel(self, local_path):
+        """스테이징 대상 로컬 경로이면 상대 경로, 아니면 None"""
+        local_path = os.path.abspath(local_path)
+        if local_path == self.local_dir or not local_path.startswith(self.local_dir + os.sep):
+            return None
+        return os.path.relpath(local_path, self.local_dir)
+
+    @staticmethod
+    def _key(rel):
+        """상대 경로 → 백엔드 키"""
+        return "/".join(rel.split(os.sep))
+
+    def to_local(self, remote_path):
+        remote_path = os.path.abspath(remote_path)
+        if remote_path == self.remote_dir or remote_path.startswith(self.remote_dir + os.sep):
+            return os.path.join(self.local_dir, os.path.relpath(remote_path, self.remote_dir))
+        return remote_path
+
+    def to_remote(self, local_path):
+        rel = self._rel(local_path)
+        return local_path if rel is None else os.path.join(self.remote_dir, rel)
+
+    def owns(self, local_path):
+        return self._rel(local_path) is not None
+
+    def _stale(self, rel, local_path):
+        """원격에서 가져와야 하면 (키, stat), 로컬이 최신이거나 원격에 없으면 None"""
+        with self._lock:
+            entry = self._manifest.get(rel)
+            if rel in self._queued or (entry and entry.get('state') in ('dirty', 'deleted')):
+                return None  # 로컬 쪽이 더 최신
+        key = self._key(rel)
+        info = self.backend.stat(key)
+        if info is None:
+            return None
+        if entry and entry.get('version') == info.get('version') and os.path.exists(local_path):
+            return None
+        return key, info
+
+    def pull(self, local_path):
+        """원격 파일을 필요할 때만 로컬로 가져옴 (hydrate)"""
+        rel = self._rel(local_path)
+        if rel is None:
+            return
+        stale = self._stale(rel, local_path)
+        if stale is None:
+            return
+        key, info = stale
+        if info.get('dir'):
+            temp = local_path + ".staging.tmp"
+            shutil.rmtree(temp, ignore_errors=True)
+            self.backend.get_tree(key, temp)
+            shutil.rmtree(local_path, ignore_errors=True)
+            os.rename(temp, local_path)
+        else:
+            self.backend.get(key, local_path)
+        # clean 상태는 journal에 남기지 않음 (잃어버려도 다음에 버전만 다시 확인)
+        self._record(rel, {'state': 'clean', 'version': info.get('version')})
+
+    def pull_many(self, local_paths):
+        """여러 파일을 한 번에 확인하고, 가져올 파일은 백엔드에서 병렬로 가져옴"""
+        pending = []
+        for local_path in local_paths:
+            rel = self._rel(local_path)
+            stale = None if rel is None else self._stale(rel, local_path)
+            if stale is None:
+                continue
+            if stale[1].get('dir'):
+                self.pull(local_path)
+            else:
+                pending.append((rel, local_path) + stale)
+        self.backend.get_many((key, local_path) for _, local_path, key, _ in pending)
+        for rel, _, _, info in pending:
+            self._record(rel, {'state': 'clean', 'version': info.get('version')})
+
+    @contextlib.contextmanager
+    def batch(self):
+        """블록 안의 push/remove를 모아 끝날 때 한 번의 동기화 묶음으로 예약 (커밋 하나 = 묶음 하나)"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    rels, self._batch = list(self._batch), set()
+                    self._enqueue(rels)
+
+    def _changed(self, rel, entry):
+        with self._lock:
+            self._record(rel, entry, journal=True)
+            if self._batch_depth:
+                self._batch.add(rel)
+            else:
+                self._enqueue([rel])
+
+    def push(self, local_path):
+        """로컬 변경 사항을 원격으로 보내도록 예약"""
+        rel = self._rel(local_path)
+        if rel is None:
+            return
+        self._changed(rel, {'state': 'dirty'})
+
+    def remove(self, local_path, missing_ok=False):
+        """로컬 파일을 삭제하고 원격 삭제를 예약"""
+        rel = self._rel(local_path)
+        if not missing_ok and not self.exists(local_path):
+            raise FileNotFoundError(local_path)
+        if os.path.isdir(local_path):
+            shutil.rmtree(local_path, ignore_errors=True)
+        elif os.path.exists(local_path):
+            os.remove(local_path)
+        self._changed(rel, {'state': 'deleted'})
+
+    def exists(self, local_path):
+        rel = self._rel(local_path)
+        if os.path.exists(local_path):
+            return True
+        with self._lock:
+            entry = self._manifest.get(rel)
+        if entry and entry.get('state') == 'deleted':
+            return False
+        return self.backend.exists(self._key(rel))
+
+    def listdir(self, local_path):
+        """로컬 디렉토리와 원격 백엔드를 각각 한 번씩 조회해 존재하는 항목 이름 집합을 반환 (삭제 예약 항목 제외)"""
+        names = _scandir_names(local_path)
+        rel = self._rel(local_path)
+        if rel is None:
+            return names
+        names |= self.backend.list(self._key(rel))
+        with self._lock:
+            deleted = {name for name in names
+                       if self._manifest.get(os.path.join(rel, name), {}).get('state') == 'deleted'}
+        return names - deleted
+
+    def _enqueue(self, rels):
+        """동기화 대기열에 추가하고, 동기화 작업이 없으면 하나 예약"""
+        if not rels:
+            return
+        with self._lock:
+            self._queued.update(rels)
+            if not self._draining:
+                self._draining = True
+                self._futures = [f for f in self._futures if not f.done()]
+                self._futures.append(self._executor.submit(self._drain))
+
+    def _drain(self):
+        """
+        대기열을 묶음 단위로 비움: 백엔드 전송은 잠금 밖에서 병렬로 하고,
+        묶음이 끝날 때마다 manifest 파일을 한 번 씀
+        """
+        while True:
+            with self._lock:
+                rels, self._queued = list(self._queued), set()
+                if not rels:
+                    self._draining = False
+                    self._save_manifest()
+                    return
+                entries = {rel: dict(self._manifest.get(rel, {})) for rel in rels}
+            if len(rels) == 1:
+                results = [self._sync(rels[0], entries[rels[0]])]
+            else:
+                with ThreadPoolExecutor(max_workers=self.backend.max_workers,
+                                        thread_name_prefix="helper-staging-io") as pool:
+                    results = list(pool.map(lambda rel: self._sync(rel, entries[rel]), rels))
+            with self._lock:
+                for rel, result in zip(rels, results):
+                    if rel in self._queued or self._manifest.get(rel) != entries[rel]:
+                        continue  # 전송 중에 다시 바뀜 → 다음 묶음에서 처리
+                    if result == 'deleted':
+                        self._manifest.pop(rel, None)
+                        self._dirty = True
+                    elif isinstance(result, dict):
+                        self._record(rel, result)
+                self._save_manifest()
+
+    def _sync(self, rel, entry):
+        """
+        항목 하나를 백엔드에 반영 (잠금 없이 실행)
+        반환값: 'deleted', 새 manifest 항목(dict), 실패/건너뜀이면 None
+        """
+        local = os.path.join(self.local_dir, rel)
+        key = self._key(rel)
+        try:
+            if entry.get('state') == 'deleted':
+                self.backend.delete(key)
+                return 'deleted'
+            if not os.path.exists(local):
+                return None
+            if os.path.isdir(local):
+                self.backend.put_tree(local, key)
+            else:
+                self.backend.put(local, key)
+            info = self.backend.stat(key) or {}
+            return {'state': 'clean', 'version': info.get('version')}
+        except Exception as e:
+            print(f"오류: 스테이징 동기화 실패 ({rel}): {e}")
+            return None
+
+    def flush(self, timeout=None):
+        """예약된 동기화가 모두 끝날 때까지 대기"""
+        while True:
+            with self._lock:
+                futures = list(self._futures)
+                if not self._draining and not self._queued:
+                    break
+            for f in futures:
+                f.result(timeout=timeout)
+        with self._lock:
+            self._save_manifest()
+            return sum(1 for e in self._manifest.values() if e.get('state') != 'clean')
+
+    def close(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self._journal.close()
+
+    def status(self):
+        with self._lock:
+            rows = [{'path': rel, 'state': e.get('state'), 'queued': rel in self._queued}
+                    for rel, e in sorted(self._manifest.items())]
+        return pd.DataFrame(rows, columns=['path', 'state', 'queued'])
+
+
+def _stage_local(path):
+    """스테이징이 켜져 있으면 원격 경로를 로컬 스테이징 경로로 변환"""
+    if __staging is None:
+        return path
+    return __staging.to_local(path)
+
+def _stage_pull(path):
+    """스테이징 경로이면 원격 파일을 로컬로 가져옴"""
+    if __staging is not None:
+        __staging.pull(path)
+    return path
+
+def _stage_pull_many(paths):
+    """스테이징 경로의 원격 파일 여러 개를 백엔드에서 병렬로 가져옴"""
+    if __staging is not None:
+        __staging.pull_many(paths)
+
+def _stage_batch():
+    """스테이징 중이면 블록 안의 push/remove를 모아 한 번의 동기화 묶음으로 예약"""
+    if __staging is None:
+        return contextlib.nullcontext()
+    return __staging.batch()
+
+def _stage_batched(func):
+    """함수 실행 동안의 스테이징 변경을 한 묶음으로 동기화하는 데코레이터 (커밋/정리 단위)"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _stage_batch():
+            return func(*args, **kwargs)
+    return wrapper
+
+def _stage_push(path):
+    """스테이징 경로이면 원격 동기화를 예약"""
+    if __staging is not None:
+        __staging.push(path)
+
+def _stage_exists(path):
+    """로컬 또는 (스테이징 중이면) 원격에 파일이 있는지 확인"""
+    if __staging is not None and __staging.owns(path):
+        return __staging.exists(path)
+    return os.path.exists(path)
+
+def _scandir_names(path):
+    """디렉토리 항목 이름 집합 (os.scandir 한 번, 디렉토리가 없으면 빈 집합)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+def _stage_listdir(path):
+    """디렉토리 항목 이름 집합 (스테이징 중이면 원격에만 있는 항목 포함)"""
+    if __staging is not None and __staging.owns(path):
+        return __staging.listdir(path)
+    return _scandir_names(path)
+
+def _stage_remove(path, missing_ok=False):
+    """파일/디렉토리 삭제 (스테이징 중이면 원격 삭제도 예약)"""
+    if __staging is not None and __staging.owns(path):
+        __staging.remove(path, missing_ok=missing_ok)
+    elif os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.exists(path) or not missing_ok:
+        os.remove(path)
+
+def enable_staging(local_dir, remote_dir=None, backend=None):
+    """
+    로컬 SSD 스테이징 모드를 켭니다.
+    remote_dir(기본값: Colab은 /content/drive/MyDrive, 로컬은 pd_root()) 아래의
+    캐시/커밋 파일을 local_dir에서 읽고 쓰며, 변경분은 백그라운드에서 원격 스토리지로 동기화합니다.
+    원격 파일은 실제로 사용하는 시점에 필요한 것만 로컬로 가져옵니다.
+    
+    Parameters:
+    -----------
+    local_dir : str
+        로컬 스테이징 디렉토리 (예: /content/staging)
+    remote_dir : str, optional
+        캐시/커밋 경로의 기준 디렉토리
+    backend : StorageBackend or str, optional
+        원격 스토리지 백엔드. None이면 remote_dir 자체(LocalStorage),
+        "memory"이면 MemoryStorage, "s3://bucket/path" 같은 URL이면 FsspecStorage,
+        그 밖의 문자열은 LocalStorage 경로로 사용합니다.
+        캐시/커밋은 local_dir에서 파일로 읽고 쓰며, 백엔드는 가져오기/동기화에만 사용합니다.
+        (스테이징 없이 백엔드를 직접 저장소로 쓰는 기능은 없음)
+    
+    Examples:
+    ---------
+    >>> helper.enable_staging("/content/staging")
+    >>> df.commit("전처리 완료")   # 로컬에 저장 후 Drive로 백그라운드 동기화
+    >>> helper.staging_flush()     # 동기화 완료까지 대기
+    >>> helper.enable_staging("/content/staging", backend="s3://bucket/project")  # fsspec 필요
+    """
+    global __staging
+    if remote_dir is None:
+        remote_dir = "/content/drive/MyDrive" if _in_colab() else pd_root()
+    if __staging is not None:
+        disable_staging()
+    __staging = _StagingArea(local_dir, remote_dir, backend=backend)
+    DataCatch._apply_staging()
+    print(f"✅ 스테이징 활성화: {__staging.local_dir} → {__staging.backend!r}")
+
+def disable_staging():
+    """
+    스테이징 모드를 끕니다. 남은 동기화를 모두 마친 뒤 원격 경로를 직접 사용합니다.
+    """
+    global __staging
+    if __staging is None:
+        return
+    area = __staging
+    area.close()
+    __staging = None
+    if DataCatch._cache_file is not None:
+        DataCatch._cache_file = area.to_remote(DataCatch._cache_file)
+    print("✅ 스테이징 비활성화")
+
+def staging_flush(timeout=None):
+    """
+    백그라운드 동기화가 끝날 때까지 대기합니다.
+    
+    Returns:
+    --------
+    int : 아직 동기화되지 않은 항목 수 (정상 종료 시 0)
+    """
+    if __staging is None:
+        return 0
+    return __staging.flush(timeout)
+
+def staging_status():
+    """
+    스테이징 manifest의 항목별 동기화 상태를 DataFrame으로 반환합니다.
+    """
+    if __staging is None:
+        return pd.DataFrame(columns=['path', 'state', 'queued'])
+    return __staging.status()
+
+
 # =============================================================================
 # CACHE SYSTEM CORE CLASS
 # =============================================================================
@@ -1742,6 +2976,10 @@ class DataCatch:
     _default_cache_file = "cache.json"
     _cache = None
     _cache_file = None
+    _META_KEY = "__helper_meta__"  # 캐시 파일 내 예약 키 (레코드별 체크섬 등)
+    _meta = None
+    _quota_bytes = None  # 캐시 파일 + 부속 파일 전체 용량 제한 (None이면 제한 없음)
+    _auto_gc = False  # True이면 캐시를 열 때 용량 제한을 넘으면 gc()로 항목까지 자동 제거
     
     @classmethod
     def _initialize_cache(cls, cache_file=None):
@@ -1763,7 +3001,19 @@ class DataCatch:
                 else:
                     cls._cache_file = cache_file
             
-            cls._cache = cls._load_cache()
+            # 스테이징 중이면 로컬 사본을 사용 (필요 시 원격에서 가져옴)
+            cls._cache_file = _stage_pull(_stage_local(cls._cache_file))
+            cls._cache, cls._meta = cls._split_meta(cls._load_cache())
+            
+            # 용량 제한을 넘은 상태로 열리면 경고 (auto_gc를 켠 경우에만 항목까지 자동 정리)
+            if cls._quota_bytes is not None and cls._disk_usage() > cls._quota_bytes:
+                usage = (f"캐시 용량 제한 초과 ({cls._disk_usage() / 1024 / 1024:.2f}MB > "
+                         f"{cls._quota_bytes / 1024 / 1024:.2f}MB)")
+                if cls._auto_gc:
+                    print(f"{usage}: 자동 정리를 실행합니다.")
+                    cls.gc()
+                else:
+                    print(f"경고: {usage}. cache_gc()로 정리하세요.")
     
     @staticmethod
     def key(*datas, **kwargs):
@@ -1796,20 +3046,32 @@ class DataCatch:
             fallback_str = str(datas) + str(kwargs)
             return hashlib.md5(fallback_str.encode()).hexdigest()
         
+    @classmethod
+    def _reserved_key(cls, key):
+        """체크섬 등 내부 메타데이터용 예약 키인지 확인 (사용자 값으로 덮어쓰면 모든 레코드가 손상으로 판정됨)"""
+        if str(key) == cls._META_KEY:
+            print(f"오류: '{cls._META_KEY}'는 캐시 내부 메타데이터용 예약 키라 사용할 수 없습니다.")
+            return True
+        return False
+
     @classmethod
     def save(cls, key, value, cache_file=None):
         """값을 직렬화 가능한 형태로 변환하여 저장"""
         cls._initialize_cache(cache_file)
+        if cls._reserved_key(key):
+            return False
         
         try:
             # 큰 데이터 저장 시 진행 상황 표시
-            data_size = sys.getsizeof(value)
+            data_size = _deep_sizeof(value)  # entry_stats의 memory_bytes와 같은 기준
             if data_size > 10 * 1024 * 1024:  # 10MB 이상
                 print(f"대용량 데이터 저장 중... ({data_size / 1024 / 1024:.1f}MB)")
             
             # 값을 직렬화 가능한 형태로 변환
             serializable_value = cls._make_serializable(value)
+            cls._drop_stream(key)
             cls._cache[key] = serializable_value
+            cls._touch(key)
             cls._save_cache()
             
             if data_size > 10 * 1024 * 1024:
@@ -1821,41 +3083,156 @@ class DataCatch:
             return False
 
     @classmethod
-    def load(cls, key, cache_file=None):
-        """저장된 값을 원래 형태로 복원하여 반환"""
+    def load(cls, key, cache_file=None, stream=False):
+        """저장된 값을 원래 형태로 복원하여 반환 (stream=True이면 청크 제너레이터 반환)"""
         cls._initialize_cache(cache_file)
-        
+
         cached_value = cls._cache.get(key, None)
         if cached_value is None:
             return None
-        
+        cls._touch(key)
+
+        if cls._is_stream_record(cached_value):
+            chunks = cls._iter_stream(cached_value)
+            if stream:
+                return chunks
+            try:
+                return cls._concat_chunks(list(chunks))
+            except Exception as e:
+                print(f" 스트림 복원 실패: {e}")
+                return None
+
         try:
             # 저장된 값을 원래 형태로 복원
-            return cls._restore_value(cached_value)
+            value = cls._restore_value(cached_value)
         except Exception as e:
             print(f" 복원 실패: {e}")
-            return cached_value  # 실패 시 원본 반환
+            value = cached_value  # 실패 시 원본 반환
+
+        if stream:
+            return iter([value])
+        return value
 
     @classmethod
-    def _make_serializable(cls, value):
-        """값을 JSON 직렬화 가능한 형태로 변환 (NumPy 버전 호환성 개선)"""
-        if isinstance(value, np.ndarray):
-            try:
-                # dtype 호환성 처리
-                dtype_str = str(value.dtype)
-                
-                # NumPy 2.0+ 호환성: datetime64, timedelta64 특별 처리
-                if 'datetime64' in dtype_str or 'timedelta64' in dtype_str:
-                    return {
-                        '_type': 'numpy_array_special',
-                        'data': value.astype(str).tolist(),
-                        'dtype': dtype_str,
-                        'shape': value.shape,
-                        'numpy_version': np.__version__
-                    }
-                
-                # 복잡한 dtype (object, structured) 처리
-                if value.dtype == np.object_ or value.dtype.names is not None:
+    def save_stream(cls, key, iterable, cache_file=None):
+        """청크 단위 이터러블을 도착하는 대로 파일에 기록 (메모리 사용량 제한)"""
+        cls._initialize_cache(cache_file)
+        if cls._reserved_key(key):
+            return False
+
+        stream_dir = cls._stream_dir(key)
+        temp_dir = stream_dir + ".tmp"
+        try:
+            if os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir)
+            os.makedirs(temp_dir, exist_ok=True)
+
+            chunk_count = 0
+            total_bytes = 0
+            for chunk in iterable:
+                chunk_path = os.path.join(temp_dir, f"chunk_{chunk_count:06d}.pkl")
+                with open(chunk_path, "wb") as f:
+                    pickle.dump(chunk, f, protocol=pickle.HIGHEST_PROTOCOL)
+                total_bytes += os.path.getsize(chunk_path)
+                chunk_count += 1
+
+            # 기존 값(스트림 포함)을 새 스트림으로 교체
+            cls._drop_stream(key)
+            if os.path.exists(stream_dir):
+                shutil.rmtree(stream_dir)
+            os.rename(temp_dir, stream_dir)
+            _stage_push(stream_dir)
+
+            cls._cache[key] = {
+                '_type': 'stream',
+                'dir': os.path.basename(stream_dir),
+                'chunks': chunk_count,
+                'bytes': total_bytes
+            }
+            cls._touch(key)
+            cls._save_cache()
+
+            if total_bytes > 10 * 1024 * 1024:
+                print(f"스트림 저장 완료: {key[:20]}{'...' if len(key) > 20 else ''} "
+                      f"({chunk_count}개 청크, {total_bytes / 1024 / 1024:.1f}MB)")
+            return True
+        except Exception as e:
+            print(f"오류: 스트림 저장 실패: {e}")
+            if os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir, ignore_errors=True)
+            return False
+
+    @classmethod
+    def _stream_root(cls):
+        """스트림 청크 파일들이 저장되는 디렉토리"""
+        return cls._cache_file + ".stream"
+
+    @classmethod
+    def _stream_dir(cls, key):
+        """키별 스트림 청크 디렉토리 경로"""
+        return os.path.join(cls._stream_root(), hashlib.md5(str(key).encode("utf-8")).hexdigest())
+
+    @classmethod
+    def _apply_staging(cls):
+        """이미 열린 캐시를 스테이징 경로로 전환"""
+        if cls._cache_file is not None:
+            cls._cache_file = _stage_pull(_stage_local(cls._cache_file))
+
+    @classmethod
+    def _touch(cls, key):
+        """키의 마지막 접근 시간 기록 (다음 저장 시 파일에 함께 기록됨)"""
+        cls._meta.setdefault('access', {})[key] = time.time()
+
+    @staticmethod
+    def _is_stream_record(cached_value):
+        """캐시 항목이 스트림 저장 항목인지 확인"""
+        return isinstance(cached_value, dict) and cached_value.get('_type') == 'stream'
+
+    @classmethod
+    def _iter_stream(cls, record):
+        """스트림 항목의 청크를 순서대로 하나씩 읽어서 반환"""
+        stream_dir = _stage_pull(os.path.join(cls._stream_root(), record['dir']))
+        for i in range(record['chunks']):
+            with open(os.path.join(stream_dir, f"chunk_{i:06d}.pkl"), "rb") as f:
+                yield pickle.load(f)
+
+    @staticmethod
+    def _concat_chunks(chunks):
+        """청크 목록을 하나의 값으로 결합 (DataFrame/Series/ndarray 외에는 리스트 반환)"""
+        if not chunks:
+            return []
+        if all(isinstance(c, (pd.DataFrame, pd.Series)) for c in chunks):
+            return pd.concat(chunks)
+        if all(isinstance(c, np.ndarray) for c in chunks):
+            return np.concatenate(chunks)
+        return chunks
+
+    @classmethod
+    def _drop_stream(cls, key):
+        """키에 연결된 스트림 청크 디렉토리 삭제"""
+        if cls._is_stream_record(cls._cache.get(key)):
+            _stage_remove(os.path.join(cls._stream_root(), cls._cache[key]['dir']), missing_ok=True)
+
+    @classmethod
+    def _make_serializable(cls, value):
+        """값을 JSON 직렬화 가능한 형태로 변환 (NumPy 버전 호환성 개선)"""
+        if isinstance(value, np.ndarray):
+            try:
+                # dtype 호환성 처리
+                dtype_str = str(value.dtype)
+                
+                # NumPy 2.0+ 호환성: datetime64, timedelta64 특별 처리
+                if 'datetime64' in dtype_str or 'timedelta64' in dtype_str:
+                    return {
+                        '_type': 'numpy_array_special',
+                        'data': value.astype(str).tolist(),
+                        'dtype': dtype_str,
+                        'shape': value.shape,
+                        'numpy_version': np.__version__
+                    }
+                
+                # 복잡한 dtype (object, structured) 처리
+                if value.dtype == np.object_ or value.dtype.names is not None:
                     return {
                         '_type': 'numpy_array_complex',
                         'data': str(value),  # 안전한 문자열 변환
@@ -1972,7 +3349,12 @@ class DataCatch:
 
     @classmethod
     def _load_cache(cls):
-        """캐시 파일 로드 (백업 시스템 적용)"""
+        """
+        캐시 파일 로드 (레코드별 체크섬 검증, 손상된 레코드만 백업에서 복원)
+        파일 전체를 파싱할 수 없으면 온전한 레코드만 골라 읽고, 체크섬이 맞지 않거나 읽지 못한 레코드는
+        .bak에서 같은 키의 정상 레코드로 대체합니다. 백업에도 없으면 그 항목만 버립니다.
+        손상된 원본 파일은 .corrupted로 복사해 둡니다.
+        """
         backup_file = cls._cache_file + ".bak"
         
         # 메인 캐시 파일 로드 시도
@@ -1983,22 +3365,16 @@ class DataCatch:
                 if file_size > 100 * 1024 * 1024:  # 100MB 이상
                     print(f"경고: 캐시 파일이 매우 큽니다 ({file_size / 1024 / 1024:.1f}MB). 로딩에 시간이 걸릴 수 있습니다.")
                 
-                # 큰 파일을 위한 청크 단위 읽기
-                with open(cls._cache_file, "r", encoding='utf-8', buffering=8192) as f:
-                    # JSON 파일의 완전성 검증을 위해 끝까지 읽기
-                    content = f.read()
-                    if not content.strip():
-                        print("캐시 파일이 비어있습니다.")
-                        return {}
-                    
-                    # JSON 파싱
-                    cache_data = json.loads(content)
-                    print(f"캐시 로드 완료: {len(cache_data)}개 항목 ({file_size / 1024 / 1024:.2f}MB)")
-                    return cache_data
+                cache_data, intact = cls._read_records(cls._cache_file)
+                if cache_data is None:
+                    print("캐시 파일이 비어있습니다.")
+                    return {}
+                if not intact:
+                    print("오류: 캐시 파일이 손상되었습니다. 온전한 레코드만 읽고 나머지는 백업에서 복원합니다.")
+                cache_data = cls._repair_records(cache_data, intact)
+                print(f"캐시 로드 완료: {len(cache_data) - (cls._META_KEY in cache_data)}개 항목 ({file_size / 1024 / 1024:.2f}MB)")
+                return cache_data
                     
-            except json.JSONDecodeError as e:
-                print(f"오류: 캐시 파일이 손상되었습니다: {e}")
-                return cls._load_from_backup()
             except MemoryError:
                 print(f"오류: 메모리 부족으로 캐시 파일을 로드할 수 없습니다.")
                 print(f"   파일 크기: {file_size / 1024 / 1024:.1f}MB")
@@ -2013,6 +3389,107 @@ class DataCatch:
             return cls._load_from_backup()
         
         return {}
+
+    @classmethod
+    def _read_records(cls, path):
+        """
+        캐시 파일을 읽어 (레코드 dict, 파일 전체가 정상인지) 반환. 비어 있으면 (None, True)
+        JSON 파싱에 실패하면 _save_cache가 쓰는 레코드 단위('  "키": 값')로 온전한 레코드만 골라 읽습니다.
+        """
+        with open(path, "r", encoding='utf-8', buffering=8192) as f:
+            content = f.read()
+        if not content.strip():
+            return None, True
+        try:
+            cache_data = json.loads(content)
+            if isinstance(cache_data, dict):
+                return cache_data, True
+        except json.JSONDecodeError:
+            pass
+        decoder = json.JSONDecoder()
+        records = {}
+        pos = 0
+        while True:
+            start = content.find('\n  "', pos)  # 레코드 키는 들여쓰기 2칸, 레코드 내부 줄은 4칸 이상
+            if start < 0:
+                break
+            start += 3
+            try:
+                key, i = decoder.raw_decode(content, start)
+                while content[i] in ' \t':
+                    i += 1
+                if content[i] != ':':
+                    raise ValueError("키 다음에 ':'가 없습니다.")
+                i += 1
+                while content[i] in ' \t\r\n':
+                    i += 1
+                value, pos = decoder.raw_decode(content, i)
+                records[key] = value
+            except (ValueError, IndexError):
+                pos = start
+        return records, False
+
+    @classmethod
+    def _record_ok(cls, value, checksums, key):
+        """레코드 체크섬 확인 (체크섬이 없는 이전 형식 레코드는 정상으로 간주)"""
+        expected = checksums.get(key)
+        return expected is None or cls._checksum(cls._record_text(value)) == expected
+
+    @classmethod
+    def _repair_records(cls, cache_data, intact):
+        """
+        체크섬이 맞지 않는 레코드와 (파일이 손상된 경우) 읽지 못한 레코드를 백업의 정상 레코드로 대체
+        백업에도 정상 레코드가 없으면 그 항목만 제외합니다.
+        """
+        meta = cache_data.get(cls._META_KEY)
+        checksums = meta.get('checksums', {}) if isinstance(meta, dict) else {}
+        bad = [key for key, value in cache_data.items()
+               if key != cls._META_KEY and not cls._record_ok(value, checksums, key)]
+        lost = [] if intact else [key for key in checksums if key not in cache_data]
+        if intact and not bad:
+            return cache_data
+
+        backup_file = cls._cache_file + ".bak"
+        backup = {}
+        if os.path.exists(backup_file):
+            try:
+                backup, _ = cls._read_records(backup_file)
+                backup = backup or {}
+            except (OSError, MemoryError) as e:
+                print(f"경고: 백업 파일을 읽을 수 없습니다: {e}")
+        backup_meta = backup.get(cls._META_KEY)
+        backup_checksums = backup_meta.get('checksums', {}) if isinstance(backup_meta, dict) else {}
+        if not isinstance(meta, dict):
+            # 메타 레코드까지 잃었으면 어떤 키가 있었는지 알 수 없으므로 백업에만 있는 키도 복원 대상
+            lost = [key for key in backup if key != cls._META_KEY and key not in cache_data]
+            meta = backup_meta if isinstance(backup_meta, dict) else {}
+
+        restored, dropped = [], []
+        for key in bad + lost:
+            if key in backup and backup_checksums.get(key) is not None \
+                    and cls._record_ok(backup[key], backup_checksums, key):
+                cache_data[key] = backup[key]
+                restored.append(key)
+            else:
+                cache_data.pop(key, None)
+                dropped.append(key)
+        # 복원한 레코드의 체크섬은 백업 기준으로 맞춰 둠 (다음 저장 때 다시 계산)
+        meta = dict(meta)
+        meta['checksums'] = {**checksums, **{k: backup_checksums[k] for k in restored}}
+        for key in dropped:
+            meta['checksums'].pop(key, None)
+        cache_data[cls._META_KEY] = meta
+
+        corrupted_file = cls._cache_file + ".corrupted"
+        try:
+            shutil.copy2(cls._cache_file, corrupted_file)
+        except OSError:
+            corrupted_file = None
+        print(f"캐시 레코드 복구: 손상 {len(bad)}개, 읽지 못함 {len(lost)}개 → 백업에서 복원 {len(restored)}개, 제외 {len(dropped)}개"
+              + (f" (원본: {corrupted_file})" if corrupted_file else ""))
+        for key in dropped:
+            print(f"  - 제외된 항목: {key[:50]}{'...' if len(key) > 50 else ''}")
+        return cache_data
     
     @classmethod
     def _load_from_backup(cls):
@@ -2056,7 +3533,7 @@ class DataCatch:
                 print(f"백업 파일 복사 실패: {e}")
             
             backup_size = os.path.getsize(backup_file)
-            print(f"백업에서 캐시 복원 완료: {len(cache_data)}개 항목 ({backup_size / 1024 / 1024:.2f}MB)")
+            print(f"백업에서 캐시 복원 완료: {len(cache_data) - (cls._META_KEY in cache_data)}개 항목 ({backup_size / 1024 / 1024:.2f}MB)")
             return cache_data
             
         except json.JSONDecodeError as e:
@@ -2066,6 +3543,26 @@ class DataCatch:
             print(f"오류: 백업 파일 로드 실패: {e}")
             return {}
     
+    @classmethod
+    def _split_meta(cls, cache_data):
+        """파일에서 읽은 데이터를 (캐시 항목, 메타 정보)로 분리"""
+        meta = cache_data.pop(cls._META_KEY, None)
+        if not isinstance(meta, dict):
+            meta = {}
+        meta.setdefault('checksums', {})
+        meta.setdefault('access', {})
+        return cache_data, meta
+
+    @staticmethod
+    def _record_text(value):
+        """레코드를 파일에 기록되는 JSON 텍스트로 변환 (체크섬 계산 기준)"""
+        return json.dumps(value, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def _checksum(text):
+        """레코드 텍스트의 CRC32 체크섬"""
+        return format(zlib.crc32(text.encode('utf-8')) & 0xffffffff, '08x')
+
     @classmethod
     def _cleanup_temp_files(cls):
         """임시 파일들 정리"""
@@ -2078,7 +3575,7 @@ class DataCatch:
 
     @classmethod
     def _save_cache(cls):
-        """캐시를 파일에 저장 (백업 시스템 적용)"""
+        """캐시를 파일에 저장 (백업 시스템 적용, 레코드별 체크섬 기록)"""
         try:
             # 디렉토리가 존재하지 않으면 생성
             cache_dir = os.path.dirname(cls._cache_file)
@@ -2089,47 +3586,35 @@ class DataCatch:
             temp_file = cls._cache_file + ".tmp"
             backup_file = cls._cache_file + ".bak"
             
-            # 예상 파일 크기 추정
-            cache_str = json.dumps(cls._cache, indent=2, ensure_ascii=False)
-            estimated_size = len(cache_str.encode('utf-8'))
-            
-            if estimated_size > 50 * 1024 * 1024:  # 50MB 이상
-                print(f"경고: 큰 캐시 파일 저장 중... (예상 크기: {estimated_size / 1024 / 1024:.1f}MB)")
-            
-            # 임시 파일에 저장
+            # 임시 파일에 레코드 단위로 저장 (전체 문자열을 한 번에 만들지 않음)
+            checksums = {}
+            written_size = 0
             with open(temp_file, "w", encoding='utf-8', buffering=8192) as f:
-                # 대용량 JSON을 청크 단위로 작성
-                if estimated_size > 10 * 1024 * 1024:  # 10MB 이상
-                    # 스트리밍 방식으로 JSON 저장
-                    f.write('{\n')
-                    items = list(cls._cache.items())
-                    for i, (key, value) in enumerate(items):
-                        f.write(f'  {json.dumps(key, ensure_ascii=False)}: ')
-                        f.write(json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n  '))
-                        if i < len(items) - 1:
-                            f.write(',')
-                        f.write('\n')
-                        
-                        # 주기적으로 플러시
-                        if i % 100 == 0:
-                            f.flush()
-                    f.write('}')
-                else:
-                    # 일반적인 경우
-                    f.write(cache_str)
+                f.write('{\n')
+                for i, (key, value) in enumerate(cls._cache.items()):
+                    text = cls._record_text(value)
+                    checksums[key] = cls._checksum(text)
+                    key_text = json.dumps(key if isinstance(key, str) else str(key), ensure_ascii=False)
+                    chunk = f'  {key_text}: ' + text.replace('\n', '\n  ') + ',\n'
+                    f.write(chunk)
+                    written_size += len(chunk)
+                    
+                    # 주기적으로 플러시
+                    if i % 100 == 0:
+                        f.flush()
+                
+                # 메타 정보(체크섬)는 마지막 레코드로 기록
+                meta = dict(cls._meta or {})
+                meta['checksums'] = checksums
+                f.write(f'  {json.dumps(cls._META_KEY)}: {json.dumps(meta, ensure_ascii=False)}\n')
+                f.write('}')
                 
                 f.flush()  # 버퍼 강제 플러시
                 os.fsync(f.fileno())  # 디스크에 강제 동기화
             
-            # 임시 파일이 정상적으로 저장되었는지 검증
-            try:
-                with open(temp_file, "r", encoding='utf-8') as f:
-                    json.load(f)  # JSON 파싱 테스트
-            except:
-                print("오류: 임시 파일 저장 중 오류가 발생했습니다.")
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                return False
+            cls._meta = meta
+            if written_size > 50 * 1024 * 1024:  # 50MB 이상
+                print(f"경고: 큰 캐시 파일 저장 중... ({written_size / 1024 / 1024:.1f}MB)")
             
             # 백업 시스템 적용
             # 1. 기존 백업 파일 삭제
@@ -2142,10 +3627,11 @@ class DataCatch:
             
             # 3. 임시 파일을 메인 캐시 파일로 이동
             os.rename(temp_file, cls._cache_file)
+            _stage_push(cls._cache_file)
             
             # 저장 완료 확인
-            actual_size = os.path.getsize(cls._cache_file)
-            if estimated_size > 10 * 1024 * 1024:
+            if written_size > 10 * 1024 * 1024:
+                actual_size = os.path.getsize(cls._cache_file)
                 print(f"캐시 저장 완료: {len(cls._cache)}개 항목 ({actual_size / 1024 / 1024:.2f}MB)")
             
             return True
@@ -2168,13 +3654,67 @@ class DataCatch:
             cls._cleanup_temp_files()
             return False
 
+    @classmethod
+    def verify(cls, cache_file=None, repair=False, max_workers=None):
+        """저장된 캐시 파일의 레코드별 체크섬을 스레드 풀로 병렬 검증"""
+        cls._initialize_cache(cache_file)
+        
+        result = {'checked': 0, 'corrupted': [], 'unchecked': [], 'repaired': False}
+        if not os.path.exists(cls._cache_file):
+            print("검증할 캐시 파일이 없습니다.")
+            return result
+        
+        try:
+            with open(cls._cache_file, "r", encoding='utf-8', buffering=8192) as f:
+                disk_cache, disk_meta = cls._split_meta(json.loads(f.read() or '{}'))
+        except json.JSONDecodeError as e:
+            print(f"오류: 캐시 파일을 파싱할 수 없습니다: {e}")
+            result['error'] = str(e)
+            return result
+        
+        checksums = disk_meta['checksums']
+        
+        def _check(item):
+            key, value = item
+            expected = checksums.get(key)
+            if expected is None:
+                return key, None
+            return key, cls._checksum(cls._record_text(value)) == expected
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for key, ok in executor.map(_check, disk_cache.items()):
+                result['checked'] += 1
+                if ok is None:
+                    result['unchecked'].append(key)
+                elif not ok:
+                    result['corrupted'].append(key)
+        
+        print(f"캐시 검증 완료: {result['checked']}개 항목, 손상 {len(result['corrupted'])}개, "
+              f"체크섬 없음 {len(result['unchecked'])}개")
+        for key in result['corrupted']:
+            print(f"  - 손상된 항목: {key[:50]}{'...' if len(key) > 50 else ''}")
+        
+        if repair and result['corrupted']:
+            for key in result['corrupted']:
+                cls._drop_stream(key)
+                cls._cache.pop(key, None)
+                cls._meta['access'].pop(key, None)
+            result['repaired'] = cls._save_cache()
+            if result['repaired']:
+                print(f"손상된 {len(result['corrupted'])}개 항목을 제거했습니다.")
+        
+        return result
+
     @classmethod
     def clear_cache(cls, cache_file=None):
         """캐시 초기화"""
         cls._initialize_cache(cache_file)
         cls._cache = {}
-        if os.path.exists(cls._cache_file):
-            os.remove(cls._cache_file)
+        cls._meta = {'checksums': {}, 'access': {}}
+        if _stage_exists(cls._cache_file):
+            _stage_remove(cls._cache_file)
+        if _stage_exists(cls._stream_root()):
+            _stage_remove(cls._stream_root())
 
     @classmethod
     def cache_info(cls, cache_file=None):
@@ -2196,11 +3736,9 @@ class DataCatch:
             else:
                 print(f"   - 파일 크기: {file_size:,} bytes")
             
-            # 메모리 사용량 추정
+            # 메모리 사용량 추정 (중첩 컨테이너까지 포함)
             try:
-                cache_memory = sys.getsizeof(cls._cache)
-                for key, value in cls._cache.items():
-                    cache_memory += sys.getsizeof(key) + sys.getsizeof(value)
+                cache_memory = _deep_sizeof(cls._cache)
                 
                 memory_mb = cache_memory / 1024 / 1024
                 if memory_mb >= 1:
@@ -2225,13 +3763,51 @@ class DataCatch:
             mtime_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))
             print(f"   - 최근 수정: {mtime_str}")
 
+    @classmethod
+    def entry_stats(cls, cache_file=None, sort_by='memory_bytes', ascending=False):
+        """항목별 메모리/직렬화/압축 크기와 마지막 접근 시간을 DataFrame으로 반환"""
+        cls._initialize_cache(cache_file)
+        
+        rows = []
+        access = cls._meta.get('access', {})
+        for key, value in cls._cache.items():
+            text_bytes = cls._record_text(value).encode('utf-8')
+            if cls._is_stream_record(value):
+                entry_type = 'stream'
+                serialized = value.get('bytes', 0)
+                compressed = np.nan
+            else:
+                entry_type = value.get('_type', 'dict') if isinstance(value, dict) else type(value).__name__
+                serialized = len(text_bytes)
+                compressed = len(zlib.compress(text_bytes, 6))
+            last_access = access.get(key)
+            rows.append({
+                'key': key,
+                'type': entry_type,
+                'memory_bytes': _deep_sizeof(value),
+                'serialized_bytes': serialized,
+                'compressed_bytes': compressed,
+                'compression_ratio': compressed / serialized if serialized else np.nan,
+                # cache_info와 같은 로컬 시간
+                'last_access': pd.Timestamp(datetime.datetime.fromtimestamp(last_access)) if last_access else pd.NaT,
+            })
+        
+        columns = ['key', 'type', 'memory_bytes', 'serialized_bytes', 'compressed_bytes',
+                   'compression_ratio', 'last_access']
+        df = pd.DataFrame(rows, columns=columns)
+        if sort_by is not None and not df.empty:
+            df = df.sort_values(sort_by, ascending=ascending, na_position='last').reset_index(drop=True)
+        return df
+
     @classmethod
     def delete(cls, key, cache_file=None):
         """특정 키 삭제"""
         cls._initialize_cache(cache_file)
         
         if key in cls._cache:
+            cls._drop_stream(key)
             del cls._cache[key]
+            cls._meta['access'].pop(key, None)
             cls._save_cache()
             print(f" 키 '{key}' 삭제 완료")
             return True
@@ -2247,7 +3823,9 @@ class DataCatch:
         deleted_count = 0
         for key in keys:
             if key in cls._cache:
+                cls._drop_stream(key)
                 del cls._cache[key]
+                cls._meta['access'].pop(key, None)
                 deleted_count += 1
                 print(f" 키 '{key}' 삭제")
             else:
@@ -2330,7 +3908,7 @@ class DataCatch:
         try:
             large_items = []
             for key, value in cls._cache.items():
-                item_size = sys.getsizeof(value)
+                item_size = _deep_sizeof(value)
                 if item_size > 1024 * 1024:  # 1MB 이상
                     large_items.append((key, item_size))
             
@@ -2375,10 +3953,157 @@ class DataCatch:
             print(f"오류: 최적화 실패: {e}")
             return False
 
+    @staticmethod
+    def _path_size(path):
+        """파일 또는 디렉토리(하위 포함)의 전체 크기"""
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+        total = 0
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    @classmethod
+    def _side_files(cls):
+        """캐시 파일 주변의 부속 파일 목록 [(경로, 종류, 크기, 고아 여부)]"""
+        cache_mtime = os.path.getmtime(cls._cache_file) if os.path.exists(cls._cache_file) else None
+        result = []
+        for suffix in (".tmp", ".corrupted", ".gz", ".bak"):
+            path = cls._cache_file + suffix
+            if not os.path.exists(path):
+                continue
+            if suffix in (".tmp", ".corrupted"):
+                orphan = True
+            elif suffix == ".gz":
+                # 메인 파일보다 오래된 압축본은 더 이상 현재 캐시를 나타내지 않음
+                orphan = cache_mtime is None or os.path.getmtime(path) < cache_mtime
+            else:
+                orphan = cache_mtime is None
+            result.append((path, suffix[1:], os.path.getsize(path), orphan))
+        
+        # 캐시에서 참조하지 않는 스트림 청크 디렉토리
+        stream_root = cls._stream_root()
+        if os.path.isdir(stream_root):
+            referenced = {v['dir'] for v in cls._cache.values() if cls._is_stream_record(v)}
+            with os.scandir(stream_root) as it:
+                for entry in it:
+                    if entry.name not in referenced:
+                        result.append((entry.path, 'stream', cls._path_size(entry.path), True))
+        return result
+
+    @classmethod
+    def _disk_usage(cls):
+        """캐시 파일, 백업/부속 파일, 스트림 청크를 모두 포함한 디스크 사용량"""
+        total = os.path.getsize(cls._cache_file) if os.path.exists(cls._cache_file) else 0
+        for suffix in (".tmp", ".corrupted", ".gz", ".bak"):
+            if os.path.exists(cls._cache_file + suffix):
+                total += os.path.getsize(cls._cache_file + suffix)
+        if os.path.isdir(cls._stream_root()):
+            total += cls._path_size(cls._stream_root())
+        return total
+
+    @staticmethod
+    def _remove_path(path):
+        """파일 또는 디렉토리 삭제"""
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    @classmethod
+    def gc(cls, max_bytes=None, cache_file=None):
+        """고아 부속 파일 삭제 및 전체 용량 제한 적용"""
+        cls._initialize_cache(cache_file)
+        quota = max_bytes if max_bytes is not None else cls._quota_bytes
+        
+        before = cls._disk_usage()
+        removed = []
+        evicted = []
+        
+        def _remove(path):
+            # 같은 경로(재저장으로 다시 생긴 .bak 등)는 목록에 한 번만 기록
+            cls._remove_path(path)
+            if path not in removed:
+                removed.append(path)
+        
+        # 1. 고아 부속 파일 삭제 (.tmp, .corrupted, 오래된 .gz, 참조 없는 스트림)
+        side_files = cls._side_files()
+        for path, kind, size, orphan in side_files:
+            if orphan:
+                _remove(path)
+        
+        # 2. 용량 제한 초과 시 복구용 파일(.gz → .bak) 순서로 삭제
+        if quota is not None:
+            for kind in ("gz", "bak"):
+                if cls._disk_usage() <= quota:
+                    break
+                for path, side_kind, size, orphan in side_files:
+                    if side_kind == kind and not orphan:
+                        _remove(path)
+        
+        # 3. 그래도 초과하면 가장 오래 접근하지 않은 항목부터 제거
+        if quota is not None and cls._disk_usage() > quota and cls._cache:
+            access = cls._meta.get('access', {})
+            estimated = cls._disk_usage()
+            for key in sorted(cls._cache, key=lambda k: access.get(k, 0)):
+                if estimated <= quota:
+                    break
+                value = cls._cache[key]
+                if cls._is_stream_record(value):
+                    estimated -= value.get('bytes', 0)
+                estimated -= len(cls._record_text(value).encode('utf-8'))
+                cls._drop_stream(key)
+                del cls._cache[key]
+                access.pop(key, None)
+                evicted.append(key)
+            if evicted:
+                cls._save_cache()
+                # 재저장으로 새로 생긴 백업 파일도 제한에 포함
+                if cls._disk_usage() > quota and os.path.exists(cls._cache_file + ".bak"):
+                    _remove(cls._cache_file + ".bak")
+        
+        after = cls._disk_usage()
+        reclaimed = max(before - after, 0)
+        print(f"캐시 정리 완료: 파일 {len(removed)}개 삭제, 항목 {len(evicted)}개 제거, "
+              f"{reclaimed / 1024 / 1024:.2f}MB 확보 (현재 {after / 1024 / 1024:.2f}MB)")
+        if evicted:
+            print(f"  - 제거된 항목: {', '.join(str(key) for key in evicted)}")
+        if quota is not None and after > quota:
+            print(f"경고: 정리 후에도 용량 제한({quota / 1024 / 1024:.2f}MB)을 초과합니다.")
+        
+        return {
+            'removed_files': removed,
+            'evicted_keys': evicted,
+            'reclaimed_bytes': reclaimed,
+            'total_bytes': after,
+            'quota_bytes': quota
+        }
+
+    @classmethod
+    def set_quota(cls, max_bytes, auto_gc=False):
+        """캐시 전체 용량 제한 설정 (None이면 해제), auto_gc=True일 때만 초과분을 바로 정리"""
+        cls._quota_bytes = max_bytes
+        cls._auto_gc = auto_gc
+        if cls._cache is not None and max_bytes is not None and cls._disk_usage() > max_bytes:
+            if auto_gc:
+                return cls.gc()
+            print(f"경고: 캐시 용량 제한 초과 ({cls._disk_usage() / 1024 / 1024:.2f}MB > "
+                  f"{max_bytes / 1024 / 1024:.2f}MB). cache_gc()로 정리하세요.")
+        return None
+
 
-def _generate_commit_hash(dt, msg):
-    """커밋 해시를 생성합니다."""
-    base = f"{dt.strftime('%Y%m%d_%H%M%S')}_{msg}"
+def _generate_commit_hash(fingerprint, msg):
+    """커밋 해시를 생성합니다. (내용 지문 + 메시지 기반이므로 같은 초에 커밋해도 충돌하지 않음)"""
+    base = f"{fingerprint}_{msg}"
     return hashlib.md5(base.encode("utf-8")).hexdigest()[:12]
 
 def df_to_pickle(df, path):
@@ -2404,211 +4129,2447 @@ def df_read_pickle(path):
     return df
 
 
+# =============================================================================
+# PANDAS COMMIT SYSTEM: COLUMNAR STORAGE
+# =============================================================================
+#
+# 파일 구조 (*.col_helper):
+#   MAGIC | 블록들... | footer(JSON) | footer 길이(8바이트, little-endian) | MAGIC
+# 행은 row group 단위로 나뉘고, 각 row group 안에서 컬럼마다 독립된 압축 블록을 가지며,
+# footer에 스키마(컬럼/인덱스 블록 위치, dtype)와 attrs 블록 위치가 기록됩니다.
+# 체크아웃 시 필요한 컬럼/행 범위의 블록만 읽을 수 있습니다.
+
+def _columnar_encode(values):
+    """컬럼 값을 (kind, dtype, 버퍼)로 변환. 고정폭 numpy dtype은 원시 바이트, 그 외는 pickle"""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "biufcmM" and values.ndim == 1:
+        values = np.ascontiguousarray(values)
+        return "raw", values.dtype.str, values.view(np.uint8)
+    return "pickle", None, pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _columnar_decode(kind, dtype, data):
+    """_columnar_encode의 역변환"""
+    if kind == "raw":
+        return np.frombuffer(data, dtype=np.dtype(dtype)).copy()
+    return pickle.loads(data)
+
+def _columnar_block_hash(kind, dtype, buffer):
+    """블록 내용(압축 전)의 해시. 같은 내용의 블록은 커밋이 달라도 같은 객체로 저장됩니다."""
+    h = hashlib.blake2b(f"{kind}:{dtype}:".encode("utf-8"), digest_size=16)
+    h.update(buffer)
+    return h.hexdigest()
+
+def _columnar_object_path(object_dir, object_hash):
+    """객체 저장소 안의 블록 파일 경로"""
+    return os.path.join(object_dir, object_hash[:2], object_hash)
+
+def _pack_dir(object_dir):
+    """객체 팩 파일 디렉토리 (pack-*.pack + pack-*.idx)"""
+    return os.path.join(object_dir, "pack")
+
+def _pack_index(object_dir):
+    """
+    팩 파일에 들어 있는 객체의 위치 인덱스
+    팩 이름은 내용 해시이므로 .idx 파일 목록이 같으면 캐시된 인덱스를 그대로 사용합니다.
+    """
+    pack_dir = _pack_dir(object_dir)
+    names = frozenset(n for n in _stage_listdir(pack_dir) if n.endswith(".idx"))
+    cached = __pack_index_cache.get(pack_dir)
+    if cached is not None and cached[0] == names:
+        return cached[1]
+    index = {}
+    for name in sorted(names):
+        pack_path = os.path.join(pack_dir, name[:-len(".idx")] + ".pack")
+        with open(_stage_pull(os.path.join(pack_dir, name)), "r", encoding="utf-8") as f:
+            for object_hash, (offset, length) in json.load(f).items():
+                index[object_hash] = (pack_path, offset, length)
+    __pack_index_cache[pack_dir] = (names, index)
+    return index
+
+def _columnar_read_object(object_dir, object_hash):
+    """객체 블록의 압축된 내용 (개별 객체 파일이 없으면 팩 파일에서 읽음)"""
+    object_path = _stage_pull(_columnar_object_path(object_dir, object_hash))
+    if os.path.exists(object_path):
+        with open(object_path, "rb") as obj:
+            return obj.read()
+    location = _pack_index(object_dir).get(object_hash)
+    if location is None:
+        raise FileNotFoundError(object_path)
+    pack_path, offset, length = location
+    with open(_stage_pull(pack_path), "rb") as pack:
+        pack.seek(offset)
+        return pack.read(length)
+
+def _columnar_plan_block(values, blocks):
+    """값 하나를 블록으로 인코딩하고 내용 해시를 계산해 blocks에 추가 (압축/쓰기 없음)"""
+    kind, dtype, buffer = _columnar_encode(values)
+    block = {
+        "object": _columnar_block_hash(kind, dtype, buffer),
+        "size": memoryview(buffer).nbytes,
+        "kind": kind,
+        "dtype": dtype
+    }
+    blocks.append((block, kind, dtype, buffer))
+    return block
+
+def _columnar_values(column):
+    """Series의 값 (numpy dtype이면 ndarray, 확장 dtype이면 ExtensionArray, 복사 없음)"""
+    return column.to_numpy(copy=False) if isinstance(column.dtype, np.dtype) else column.array
+
+def _columnar_plan_row_groups(df, blocks):
+    """DataFrame(또는 Series)의 행을 row group으로 나눠 인덱스/컬럼 블록을 계획"""
+    nrows = int(df.shape[0])
+    if isinstance(df, pd.Series):
+        columns_values = [_columnar_values(df)]
+    else:
+        columns_values = [_columnar_values(df.iloc[:, i]) for i in range(df.shape[1])]
+
+    row_groups = []
+    for start in range(0, max(nrows, 1), __COLUMNAR_ROW_GROUP_ROWS):
+        stop = min(start + __COLUMNAR_ROW_GROUP_ROWS, nrows)
+        row_groups.append({
+            "nrows": stop - start,
+            "index": _columnar_plan_block(df.index[start:stop], blocks),
+            "columns": [_columnar_plan_block(values[start:stop], blocks) for values in columns_values]
+        })
+    return row_groups
+
+def _columnar_footer(schema, row_groups, nrows, blocks):
+    """
+    schema(DataFrame)의 컬럼/dtype/attrs와 row group 목록으로 footer 구성
+    Series는 컬럼 하나짜리로 저장하고 footer에 type='series'를 남깁니다. (컬럼 라벨 = Series 이름)
+    """
+    series = isinstance(schema, pd.Series)
+    footer = {
+        "version": 1,
+        "nrows": nrows,
+        "ncols": 1 if series else int(schema.shape[1]),
+        "dtypes": [str(schema.dtype)] if series else [str(t) for t in schema.dtypes],
+        "columns": _columnar_plan_block(pd.Index([schema.name], tupleize_cols=False) if series else schema.columns, blocks),
+        "attrs": _columnar_plan_block(dict(getattr(schema, 'attrs', {})), blocks),
+        "row_groups": row_groups
+    }
+    if series:
+        footer["type"] = "series"
+    return footer
+
+def _columnar_plan_array(arr, blocks):
+    """
+    numpy 배열 하나를 footer(type='ndarray')와 블록으로 계획
+    고정폭 dtype은 압축하지 않은 원시 버퍼 블록 하나로 저장해서 memory-map으로 다시 열 수 있게 하고,
+    그 외(object 등)는 pickle 후 압축합니다. Fortran 순서 배열은 전치해서 복사 없이 저장합니다.
+    """
+    order = "F" if arr.ndim > 1 and arr.flags.f_contiguous and not arr.flags.c_contiguous else "C"
+    if arr.dtype.kind in "biufcmM":
+        data = np.ascontiguousarray(arr.T if order == "F" else arr)
+        kind, dtype, buffer = "raw", data.dtype.str, data.reshape(-1).view(np.uint8)
+        block = {
+            "object": _columnar_block_hash(kind, dtype, buffer),
+            "size": memoryview(buffer).nbytes,
+            "kind": kind,
+            "dtype": dtype,
+            "codec": "none"
+        }
+        blocks.append((block, kind, dtype, buffer))
+    else:
+        order = "C"
+        block = _columnar_plan_block(arr, blocks)
+    return {
+        "version": 1,
+        "type": "ndarray",
+        "nrows": int(arr.shape[0]) if arr.ndim else 1,
+        "ncols": int(np.prod(arr.shape[1:])) if arr.ndim > 1 else 1,
+        "dtypes": [arr.dtype.str],
+        "shape": list(arr.shape),
+        "order": order,
+        "data": block
+    }
+
+def _columnar_plan(df):
+    """
+    DataFrame을 블록 단위로 인코딩하고 footer 골격을 만듭니다. (압축/쓰기 없음)
+    Series, numpy 배열도 받을 수 있으며 footer의 type으로 구분합니다. (없으면 DataFrame)
+    각 블록은 내용 해시로 식별되므로 footer 자체가 DataFrame 내용의 지문이 됩니다.
+    반환값: (footer, [(블록 정보, kind, dtype, 버퍼), ...])
+    """
+    blocks = []
+    if isinstance(df, np.ndarray):
+        return _columnar_plan_array(df, blocks), blocks
+    row_groups = _columnar_plan_row_groups(df, blocks)
+    return _columnar_footer(df, row_groups, int(df.shape[0]), blocks), blocks
+
+def _columnar_fingerprint(footer):
+    """footer(스키마 + 블록 해시)로 계산한 DataFrame 내용 지문"""
+    text = json.dumps(footer, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def _commit_compression(compression=None):
+    """압축 수준 이름 확인 (None이면 set_commit_compression으로 정한 기본값)"""
+    compression = __commit_compression if compression is None else compression
+    if compression not in ("fast", "balanced", "small"):
+        raise ValueError(f"compression은 'fast', 'balanced', 'small' 중 하나여야 합니다. 현재 값: {compression!r}")
+    return compression
+
+def _codec_compress(buffer, compression):
+    """
+    압축 수준에 맞는 코덱으로 블록을 압축하고 코덱 헤더(b"HCB" + 코덱 표시)를 붙임
+    zstandard가 있으면 zstd(1/3/19), 없으면 fast/balanced는 zlib(1/6), small은 lzma
+    compression이 'none'이면 압축하지 않은 원시 버퍼를 그대로 씁니다. (numpy 배열 커밋, memory-map 가능)
+    반환값: 순서대로 기록할 바이트 조각 목록 (원시 버퍼를 복사하지 않기 위해 헤더와 분리)
+    """
+    if compression == "none":
+        return [b"HCB" + __CODEC_TAGS["none"], buffer]
+    if ZSTD_AVAILABLE:
+        level = {"fast": 1, "balanced": 3, "small": 19}[compression]
+        codec, data = "zstd", zstandard.ZstdCompressor(level=level).compress(buffer)
+    elif compression == "small":
+        codec, data = "lzma", lzma.compress(buffer, preset=6)
+    else:
+        codec, data = "zlib", zlib.compress(buffer, 1 if compression == "fast" else 6)
+    return [b"HCB" + __CODEC_TAGS[codec] + data]
+
+def _codec_write(f, parts):
+    """_codec_compress 결과를 파일에 기록하고 기록한 바이트 수 반환"""
+    for part in parts:
+        f.write(part)
+    return sum(memoryview(part).nbytes for part in parts)
+
+def _codec_decompress(payload):
+    """_codec_compress의 역변환 (헤더가 없는 이전 블록은 zlib)"""
+    if payload[:3] != b"HCB":
+        return zlib.decompress(payload)
+    tag, data = payload[3:4], memoryview(payload)[4:]
+    if tag == __CODEC_TAGS["none"]:
+        return data
+    if tag == __CODEC_TAGS["zlib"]:
+        return zlib.decompress(data)
+    if tag == __CODEC_TAGS["lzma"]:
+        return lzma.decompress(data)
+    if tag == __CODEC_TAGS["zstd"]:
+        if not ZSTD_AVAILABLE:
+            raise ImportError("zstd로 압축된 블록을 읽으려면 zstandard 패키지가 필요합니다. (pip install zstandard)")
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"알 수 없는 블록 코덱: {tag!r}")
+
+def _codec_map(fn, items):
+    """블록 단위 작업을 압축 스레드 풀에서 병렬 실행 (항목이 하나 이하면 현재 스레드에서 실행)"""
+    global __codec_executor
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with __codec_lock:
+        if __codec_executor is None:
+            __codec_executor = ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1),
+                                                  thread_name_prefix="helper-codec")
+    return list(__codec_executor.map(fn, items))
+
+def set_commit_compression(level):
+    """
+    커밋 블록 압축 수준을 설정합니다.
+    'fast' (빠른 저장), 'balanced' (기본값), 'small' (작은 용량).
+    커밋마다 compression 인자로 따로 지정할 수도 있고, 수준별 소요 시간은 커밋 메타데이터(timings)에 기록됩니다.
+    """
+    global __commit_compression
+    __commit_compression = _commit_compression(level)
+
+def _columnar_store_objects(blocks, object_dir, compression=None, stats=None):
+    """
+    객체 저장소에 없는 블록만 압축해서 기록 (이미 같은 블록이 있으면 압축/쓰기를 모두 생략)
+    압축과 쓰기는 블록별로 스레드 풀에서 병렬로 처리합니다.
+    반환값: stats (new_blocks, new_bytes 누적)
+    """
+    stats = {"new_blocks": 0, "new_bytes": 0} if stats is None else stats
+    compression = _commit_compression(compression)
+    packed = _pack_index(object_dir)
+    pending = {}
+    for block, kind, dtype, buffer in blocks:
+        if block["object"] in packed or block["object"] in pending:
+            continue
+        if not _stage_exists(_columnar_object_path(object_dir, block["object"])):
+            pending[block["object"]] = (buffer, block.get("codec", compression))
+
+    def _store(item):
+        object_hash, (buffer, codec) = item
+        object_path = _columnar_object_path(object_dir, object_hash)
+        parts = _codec_compress(buffer, codec)
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        temp_path = _temp_path(object_path)
+        with open(temp_path, "wb") as obj:
+            nbytes = _codec_write(obj, parts)
+        os.replace(temp_path, object_path)
+        _stage_push(object_path)
+        return nbytes
+
+    for nbytes in _codec_map(_store, pending.items()):
+        stats["new_blocks"] += 1
+        stats["new_bytes"] += nbytes
+    return stats
+
+def _columnar_write(path, footer, blocks, object_dir=None, compression=None, stats=None):
+    """
+    _columnar_plan 결과를 파일로 기록
+    object_dir가 있으면 블록은 내용 해시 기반 공유 객체 저장소에 기록하며,
+    이미 같은 블록이 있으면 압축/쓰기를 모두 생략합니다. 없으면 블록을 파일 안에 기록합니다.
+    반환값: 블록 통계 dict (blocks, new_blocks, new_bytes). stats를 넘기면 거기에 누적합니다.
+    """
+    stats = {"blocks": 0, "new_blocks": 0, "new_bytes": 0} if stats is None else stats
+    stats["blocks"] += len(blocks)
+    compression = _commit_compression(compression)
+    if object_dir is not None:
+        _columnar_store_objects(blocks, object_dir, compression, stats)
+    temp_path = _temp_path(path)
+    with open(temp_path, "wb") as f:
+        f.write(__COLUMNAR_MAGIC)
+        if object_dir is None:
+            payloads = _codec_map(lambda b: _codec_compress(b[3], b[0].get("codec", compression)), blocks)
+            for (block, _, _, _), parts in zip(blocks, payloads):
+                del block["object"]
+                block["offset"] = f.tell()
+                block["length"] = _codec_write(f, parts)
+                stats["new_blocks"] += 1
+                stats["new_bytes"] += block["length"]
+
+        footer_bytes = json.dumps(footer, ensure_ascii=False).encode("utf-8")
+        f.write(footer_bytes)
+        f.write(len(footer_bytes).to_bytes(8, "little"))
+        f.write(__COLUMNAR_MAGIC)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    return stats
+
+def _columnar_read_block(f, block, object_dir=None, lock=None):
+    """블록 하나를 읽어서 복원 (객체 저장소 블록이면 해당 객체 파일만 읽음)"""
+    if "object" in block:
+        payload = _columnar_read_object(object_dir, block["object"])
+    else:
+        with lock or contextlib.nullcontext():
+            f.seek(block["offset"])
+            payload = f.read(block["length"])
+    return _columnar_decode(block["kind"], block["dtype"], _codec_decompress(payload))
+
+def _columnar_read_blocks(f, blocks, object_dir=None):
+    """여러 블록을 스레드 풀에서 병렬로 읽고 압축 해제 (파일 안 블록은 읽기만 순서대로)"""
+    if object_dir is not None:
+        # 스테이징 중이면 필요한 객체 파일을 백엔드에서 한 번에 병렬로 가져옴
+        _stage_pull_many(_columnar_object_path(object_dir, b["object"]) for b in blocks if "object" in b)
+    lock = threading.Lock()
+    return _codec_map(lambda block: _columnar_read_block(f, block, object_dir, lock), blocks)
+
+def _columnar_mmap_dir():
+    """
+    압축을 푼 memory-map용 컬럼 캐시 디렉토리
+    커밋 폴더(Drive)가 아닌 로컬 디스크에 둡니다. 파일 이름이 블록 내용 해시로 정해지므로 커밋 폴더와 무관하게 공유됩니다.
+    """
+    if __mmap_cache_dir is not None:
+        return __mmap_cache_dir
+    return os.path.join(tempfile.gettempdir(), "helper_mmap_cache")
+
+def _columnar_mmap_evict(keep=None):
+    """memory-map 캐시가 용량을 넘으면 가장 오래 사용하지 않은 파일(mtime 기준)부터 삭제 (keep은 남김)"""
+    entries = []
+    try:
+        with os.scandir(_columnar_mmap_dir()) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except FileNotFoundError:
+        return 0
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= __mmap_cache_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)  # 매핑 중인 파일도 POSIX에서는 매핑이 유지됨
+        except OSError:  # 다른 프로세스가 매핑 중인 파일 (Windows)
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+def _columnar_mmap_key(blocks):
+    """같은 컬럼 블록들(row group 순서)을 이어 붙인 캐시 파일 이름 (블록이 모두 객체 저장소에 있을 때만)"""
+    if not blocks or any("object" not in b for b in blocks):
+        return None
+    text = ",".join(b["object"] for b in blocks)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def _columnar_block_location(path, block, object_dir=None):
+    """블록 payload가 기록된 (파일 경로, 시작 위치, 길이)"""
+    if "object" not in block:
+        return path, block["offset"], block["length"]
+    object_path = _stage_pull(_columnar_object_path(object_dir, block["object"]))
+    if os.path.exists(object_path):
+        return object_path, 0, os.path.getsize(object_path)
+    location = _pack_index(object_dir).get(block["object"])
+    if location is None:
+        raise FileNotFoundError(object_path)
+    pack_path, offset, length = location
+    return _stage_pull(pack_path), offset, length
+
+def _columnar_mmap(path, blocks, object_dir=None):
+    """
+    같은 컬럼의 블록들(row group 순서)을 이어 붙인 1차원 배열을 읽기 전용 memory-map으로 반환
+    압축하지 않은 블록 하나면 커밋 파일/객체/팩을 그대로 매핑하고, 그 외에는 압축을 푼 캐시 파일
+    (로컬 캐시 디렉토리의 <블록 해시들의 해시>)을 한 번 만든 뒤 매핑합니다. 캐시 파일 이름은 내용으로 정해지므로
+    같은 커밋을 여는 여러 프로세스가 하나의 파일(같은 페이지 캐시)을 공유합니다.
+    캐시는 용량(mmap_cache_set_limit)을 넘으면 오래 사용하지 않은 파일부터 지웁니다.
+    고정폭 dtype이 아니거나 매핑할 수 없으면 None
+    """
+    if not blocks or any(b["kind"] != "raw" for b in blocks):
+        return None
+    dtype = np.dtype(blocks[0]["dtype"])
+    if any(b["dtype"] != blocks[0]["dtype"] for b in blocks):
+        return None
+    count = sum(b["size"] for b in blocks) // dtype.itemsize
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    if len(blocks) == 1:
+        file_path, offset, _ = _columnar_block_location(path, blocks[0], object_dir)
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            header = f.read(4)
+        if header == b"HCB" + __CODEC_TAGS["none"]:
+            return np.memmap(file_path, dtype=dtype, mode="r", offset=offset + 4, shape=(count,)).view(np.ndarray)
+    key = _columnar_mmap_key(blocks)
+    if key is None:
+        return None
+    cache_path = os.path.join(_columnar_mmap_dir(), key)
+    try:
+        os.utime(cache_path)  # LRU 순서 갱신
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = _temp_path(cache_path)
+        with open(temp_path, "wb") as out:
+            for b in blocks:  # 블록 하나씩 풀어서 기록하므로 메모리는 블록 크기만큼만 사용
+                out.write(_codec_decompress(_columnar_read_object(object_dir, b["object"])))
+        os.replace(temp_path, cache_path)
+        _columnar_mmap_evict(keep=cache_path)
+    return np.memmap(cache_path, dtype=dtype, mode="r", shape=(count,)).view(np.ndarray)
+
+def _columnar_read_footer(f):
+    """파일 끝의 footer를 읽습니다."""
+    magic_len = len(__COLUMNAR_MAGIC)
+    f.seek(-(magic_len + 8), os.SEEK_END)
+    tail = f.read(magic_len + 8)
+    if tail[8:] != __COLUMNAR_MAGIC:
+        raise ValueError("columnar 커밋 파일 형식이 아닙니다.")
+    footer_len = int.from_bytes(tail[:8], "little")
+    f.seek(-(magic_len + 8 + footer_len), os.SEEK_END)
+    return json.loads(f.read(footer_len).decode("utf-8"))
+
+def _columnar_concat(parts):
+    """row group별로 읽은 컬럼 조각을 하나로 결합"""
+    if len(parts) == 1:
+        return parts[0]
+    if all(isinstance(p, np.ndarray) for p in parts):
+        return np.concatenate(parts)
+    return pd.concat([pd.Series(p, copy=False) for p in parts], ignore_index=True).array
+
+def df_to_columnar(df, path, object_dir=None):
+    """
+    DataFrame을 컬럼별 압축 블록 형식으로 저장 (attrs 포함)
+    임시 파일에 기록한 뒤 교체하므로 저장 도중 실패해도 기존 파일이 손상되지 않습니다.
+    object_dir를 지정하면 블록은 (컬럼, row group) 단위로 내용 해시 객체 저장소에 저장되고
+    파일에는 footer만 남습니다. 이전 커밋과 같은 블록은 다시 쓰지 않습니다.
+    반환값: 블록 통계 dict (blocks, new_blocks, new_bytes, fingerprint)
+    """
+    footer, blocks = _columnar_plan(df)
+    fingerprint = _columnar_fingerprint(footer)
+    stats = _columnar_write(path, footer, blocks, object_dir=object_dir)
+    stats["fingerprint"] = fingerprint
+    return stats
+
+def _columnar_column_positions(columns, selected):
+    """요청한 컬럼 라벨들을 컬럼 위치 목록으로 변환 (요청 순서 유지, 중복 라벨 포함)"""
+    if selected is None:
+        return list(range(len(columns)))
+    if not isinstance(selected, (list, tuple, pd.Index, np.ndarray)):
+        selected = [selected]
+    positions = []
+    for label in selected:
+        loc = columns.get_loc(label)  # 없는 라벨이면 KeyError
+        if isinstance(loc, slice):
+            positions.extend(range(len(columns))[loc])
+        elif isinstance(loc, np.ndarray):
+            positions.extend(np.flatnonzero(loc).tolist())
+        else:
+            positions.append(int(loc))
+    return positions
+
+def _columnar_row_selection(nrows, rows):
+    """rows(slice)를 (읽을 시작 행, 읽을 끝 행, 읽은 범위 안에서의 선택자)로 변환"""
+    if rows is None:
+        return 0, nrows, slice(None)
+    if not isinstance(rows, slice):
+        raise TypeError(f"rows는 slice여야 합니다. 현재 타입: {type(rows)}")
+    start, stop, step = rows.indices(nrows)
+    positions = range(start, stop, step)
+    if len(positions) == 0:
+        return 0, 0, slice(None)
+    lo, hi = min(positions), max(positions) + 1
+    if step == 1:
+        return lo, hi, slice(None)
+    return lo, hi, np.asarray(positions) - lo
+
+def _columnar_read_array(f, footer, object_dir=None, rows=None, mmap_path=None):
+    """
+    type='ndarray' footer의 배열 복원 (rows는 첫 번째 축에 적용)
+    mmap_path(커밋 파일 경로)를 넘기면 고정폭 배열은 읽기 전용 memory-map으로 반환합니다.
+    """
+    data = None if mmap_path is None else _columnar_mmap(mmap_path, [footer["data"]], object_dir)
+    if data is None:
+        data = _columnar_read_block(f, footer["data"], object_dir)
+    if footer["data"]["kind"] == "raw":
+        shape = footer["shape"]
+        data = data.reshape(shape[::-1]).T if footer["order"] == "F" else data.reshape(shape)
+    if rows is not None:
+        if not isinstance(rows, slice):
+            raise TypeError(f"rows는 slice여야 합니다. 현재 타입: {type(rows)}")
+        data = data[rows]
+    return data
+
+def _columnar_check_columns(footer, columns):
+    """컬럼 선택은 DataFrame 커밋에서만 가능"""
+    if columns is not None and footer.get("type", "frame") != "frame":
+        raise ValueError(f"columns는 DataFrame 커밋에서만 지정할 수 있습니다. (커밋 타입: {footer['type']})")
+
+def _columnar_as_series(df):
+    """컬럼 하나로 읽은 type='series' 커밋을 Series로 변환"""
+    series = df.iloc[:, 0]
+    series.name = df.columns[0]
+    series.attrs = df.attrs
+    return series
+
+def df_read_columnar(path, columns=None, rows=None, mmap=False):
+    """
+    df_to_columnar로 저장한 DataFrame과 attrs를 복원
+    Series/numpy 배열 커밋이면 해당 타입으로 복원합니다. (columns는 DataFrame에서만 사용)
+    columns: 읽을 컬럼 라벨 목록 (None이면 전체)
+    rows: 읽을 행 범위 slice (None이면 전체). 필요한 row group의 블록만 읽습니다.
+    mmap: True이면 고정폭 숫자/datetime 컬럼을 읽기 전용 memory-map 배열로 둡니다. (_columnar_mmap 참고)
+          데이터는 접근할 때 페이지 단위로 읽히고, 그 외 컬럼과 인덱스는 평소처럼 읽습니다.
+    """
+    object_dir = os.path.join(os.path.dirname(os.path.abspath(path)), "objects")
+    with open(path, "rb") as f:
+        def _read(block):
+            return _columnar_read_block(f, block, object_dir)
+
+        footer = _columnar_read_footer(f)
+        _columnar_check_columns(footer, columns)
+        if footer.get("type") == "ndarray":
+            return _columnar_read_array(f, footer, object_dir, rows, mmap_path=path if mmap else None)
+        column_index = _read(footer["columns"])
+        attrs = _read(footer["attrs"])
+
+        positions = _columnar_column_positions(column_index, columns)
+        lo, hi, selector = _columnar_row_selection(footer["nrows"], rows)
+
+        # [lo, hi) 범위와 겹치는 row group만 선택
+        groups = []
+        group_start = 0
+        for g in footer["row_groups"]:
+            group_stop = group_start + g["nrows"]
+            if group_start < hi and group_stop > lo or (not groups and hi == lo and group_start == lo):
+                groups.append((group_start, g))
+            group_start = group_stop
+        base = groups[0][0] if groups else 0
+        window = slice(lo - base, hi - base)
+
+        # memory-map은 컬럼 전체(모든 row group)를 매핑한 뒤 [lo, hi) 범위를 view로 잘라 냄
+        mapped = {}
+        if mmap:
+            for i in positions:
+                if i not in mapped:
+                    mapped[i] = _columnar_mmap(path, [g["columns"][i] for g in footer["row_groups"]], object_dir)
+
+        # 필요한 블록을 한 번에 모아 병렬로 읽고 압축 해제
+        wanted = [g["index"] for _, g in groups]
+        wanted += [g["columns"][i] for i in positions if mapped.get(i) is None for _, g in groups]
+        values = iter(_columnar_read_blocks(f, wanted, object_dir))
+
+        index_parts = [next(values) for _ in groups]
+        index = index_parts[0].append(index_parts[1:]) if len(index_parts) > 1 else index_parts[0]
+        index = index[window][selector]
+        arrays = [mapped[i][lo:hi][selector] if mapped.get(i) is not None
+                  else _columnar_concat([next(values) for _ in groups])[window][selector]
+                  for i in positions]
+
+    df = pd.DataFrame(dict(enumerate(arrays)), index=index, copy=False)
+    df.columns = column_index if columns is None else column_index[positions]
+    df.attrs = attrs
+    if footer.get("type") == "series":
+        return _columnar_as_series(df)
+    return df
+
+def df_iter_columnar(path, chunksize, columns=None):
+    """
+    df_to_columnar로 저장한 DataFrame을 chunksize 행씩 나눠 읽는 iterator
+    row group을 순서대로 하나씩만 읽어 복원하므로 전체 크기와 관계없이 메모리 사용량이 일정합니다.
+    Series 커밋은 Series 조각, numpy 배열 커밋은 첫 번째 축으로 나눈 배열 조각을 반환합니다.
+    """
+    if not isinstance(chunksize, (int, np.integer)) or chunksize <= 0:
+        raise ValueError(f"chunksize는 양의 정수여야 합니다. 현재 값: {chunksize!r}")
+    object_dir = os.path.join(os.path.dirname(os.path.abspath(path)), "objects")
+    with open(path, "rb") as f:
+        def _read(block):
+            return _columnar_read_block(f, block, object_dir)
+
+        footer = _columnar_read_footer(f)
+        _columnar_check_columns(footer, columns)
+        if footer.get("type") == "ndarray":
+            data = _columnar_read_array(f, footer, object_dir)
+            for start in range(0, len(data) if data.ndim else 1, chunksize):
+                yield data[start:start + chunksize] if data.ndim else data
+            return
+        column_index = _read(footer["columns"])
+        attrs = _read(footer["attrs"])
+        positions = _columnar_column_positions(column_index, columns)
+        labels = column_index if columns is None else column_index[positions]
+
+        def _chunk(part):
+            part = part.copy(deep=False)
+            part.columns = labels
+            part.attrs = copy.deepcopy(attrs)
+            return _columnar_as_series(part) if footer.get("type") == "series" else part
+
+        pending = None
+        for g in footer["row_groups"]:
+            if g["nrows"] == 0:
+                continue
+            values = _columnar_read_blocks(f, [g["index"]] + [g["columns"][i] for i in positions], object_dir)
+            part = pd.DataFrame(dict(enumerate(values[1:])), index=values[0], copy=False)
+            pending = part if pending is None else pd.concat([pending, part])
+            while len(pending) >= chunksize:
+                yield _chunk(pending.iloc[:chunksize])
+                pending = pending.iloc[chunksize:]
+        if pending is not None and len(pending):
+            yield _chunk(pending)
+
+def _columnar_footer_blocks(footer):
+    """footer에 기록된 모든 블록 정보 목록"""
+    if footer.get("type") == "ndarray":
+        return [footer["data"]]
+    blocks = [footer["columns"], footer["attrs"]]
+    for g in footer["row_groups"]:
+        blocks.append(g["index"])
+        blocks.extend(g["columns"])
+    return blocks
+
+def _columnar_footer_refs(footer):
+    """footer가 참조하는 객체 해시 집합"""
+    return {b["object"] for b in _columnar_footer_blocks(footer) if "object" in b}
+
+def _record_files(record):
+    """커밋 레코드가 참조하는 커밋 파일 이름 목록 (묶음 커밋이면 멤버별 파일)"""
+    if "members" in record:
+        return [member["file"] for member in record["members"].values()]
+    return [record["file"]]
+
+def _record_file(record, member=None):
+    """체크아웃할 커밋 파일 이름 (묶음 커밋이면 member의 파일)"""
+    if "members" not in record:
+        return record["file"]
+    if member not in record["members"]:
+        raise KeyError(f"묶음 커밋 '{record['msg']}'의 멤버가 아닙니다: {member!r} "
+                       f"(멤버: {list(record['members'])})")
+    return record["members"][member]["file"]
+
+def _commit_footers(commit_dir=None):
+    """커밋 파일별 footer {파일 이름: footer} (이전 pickle 커밋이나 없는 파일은 None)"""
+    save_dir = _commit_save_dir(commit_dir)
+    footers = {}
+    for m in _load_commit_index(commit_dir).records:
+        for fname in _record_files(m):
+            if fname in footers:
+                continue
+            file_path = _stage_pull(os.path.join(save_dir, fname))
+            footers[fname] = None
+            if fname.endswith(".col_helper") and os.path.exists(file_path):
+                with open(file_path, "rb") as f:
+                    footers[fname] = _columnar_read_footer(f)
+    return footers
+
+def _commit_object_refs(commit_dir=None, footers=None):
+    """커밋 파일별 참조 객체 해시 집합 {파일 이름: set} (footer만 읽음)"""
+    footers = _commit_footers(commit_dir) if footers is None else footers
+    return {fname: set() if footer is None else _columnar_footer_refs(footer)
+            for fname, footer in footers.items()}
+
+def _loose_objects(object_dir):
+    """팩에 들어가지 않은 개별 객체 파일 {객체 해시: (경로, 크기)}"""
+    objects = {}
+    if not os.path.isdir(object_dir):
+        return objects
+    with os.scandir(object_dir) as prefixes:
+        for prefix in prefixes:
+            if not prefix.is_dir() or prefix.name == "pack":
+                continue
+            with os.scandir(prefix.path) as entries:
+                for obj in entries:
+                    if not obj.name.endswith(".tmp"):
+                        objects[obj.name] = (obj.path, obj.stat().st_size)
+    return objects
+
+def _commit_gc_objects(commit_dir=None):
+    """
+    어떤 커밋에서도 참조하지 않는 객체 블록을 삭제하고 삭제한 개수를 반환
+    팩 파일은 모든 객체가 참조되지 않을 때만 삭제합니다. (일부만 남은 팩은 commit_pack으로 정리)
+    """
+    save_dir = _commit_save_dir(commit_dir)
+    object_dir = os.path.join(save_dir, "objects")
+    if not os.path.isdir(object_dir):
+        return 0
+
+    referenced = set().union(*_commit_object_refs(commit_dir).values())
+
+    # 이전 버전이 커밋 폴더 안(mmap/)에 만들던 memory-map 캐시 정리 (지금은 로컬 캐시 디렉토리 사용)
+    legacy_mmap = os.path.join(save_dir, "mmap")
+    if os.path.isdir(legacy_mmap):
+        shutil.rmtree(legacy_mmap, ignore_errors=True)
+
+    removed = 0
+    for object_hash, (path, _) in _loose_objects(object_dir).items():
+        if object_hash not in referenced:
+            _stage_remove(path, missing_ok=True)
+            removed += 1
+
+    packs = {}
+    for object_hash, (pack_path, _, _) in _pack_index(object_dir).items():
+        packs.setdefault(pack_path, []).append(object_hash)
+    for pack_path, hashes in packs.items():
+        if not referenced.intersection(hashes):
+            _stage_remove(pack_path[:-len(".pack")] + ".idx", missing_ok=True)
+            _stage_remove(pack_path, missing_ok=True)
+            removed += len(hashes)
+    return removed
+
+def _project_frame(df, columns=None, rows=None):
+    """메모리에 있는 DataFrame(Series, numpy 배열)에 컬럼/행 선택을 적용 (이전 pickle 커밋, 체크아웃 캐시용)"""
+    if columns is not None:
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError(f"columns는 DataFrame 커밋에서만 지정할 수 있습니다. (커밋 타입: {type(df).__name__})")
+        df = df.iloc[:, _columnar_column_positions(df.columns, columns)]
+    if rows is not None:
+        if not isinstance(rows, slice):
+            raise TypeError(f"rows는 slice여야 합니다. 현재 타입: {type(rows)}")
+        df = df[rows] if isinstance(df, np.ndarray) else df.iloc[rows]
+    return df
+
+def _read_commit_file(path, columns=None, rows=None, mmap=False):
+    """커밋 파일 형식(.col_helper / 이전 .pkl_helper)에 맞춰 DataFrame 복원 (이전 형식은 mmap 불가)"""
+    if path.endswith(".pkl_helper"):
+        return _project_frame(df_read_pickle(path), columns, rows)
+    return df_read_columnar(path, columns=columns, rows=rows, mmap=mmap)
+
+def _iter_commit_file(path, chunksize, columns=None):
+    """커밋 파일을 chunksize 행씩 읽는 iterator (이전 .pkl_helper는 전체를 읽은 뒤 나눔)"""
+    if not path.endswith(".pkl_helper"):
+        yield from df_iter_columnar(path, chunksize, columns=columns)
+        return
+    df = _project_frame(df_read_pickle(path), columns)
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize]
+
+
+# =============================================================================
+# PANDAS COMMIT SYSTEM: CHECKOUT CACHE
+# =============================================================================
+
+class _CheckoutCache:
+    """
+    최근 체크아웃한 커밋을 메모리에 보관하는 용량 제한 LRU 캐시
+    키: (커밋 파일 경로, 커밋 해시, 파일 mtime) → 파일이 바뀌면 자동으로 다른 키가 됩니다.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key → (DataFrame, 크기)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, df, nbytes):
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return  # 용량보다 큰 커밋은 보관하지 않음
+            self._entries[key] = (df, nbytes)
+            self._bytes += nbytes
+            self._evict()
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
+
+    def discard(self, commit_hash):
+        """해당 커밋의 항목을 모두 제거"""
+        with self._lock:
+            for key in [k for k in self._entries if k[1] == commit_hash]:
+                self._bytes -= self._entries.pop(key)[1]
+
+    def resize(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes
+            }
+
+__checkout_cache = _CheckoutCache(__CHECKOUT_CACHE_BYTES)
+
+def _checkout_read(file_path, record, columns=None, rows=None):
+    """
+    체크아웃 캐시를 거쳐 커밋 파일을 읽습니다.
+    전체 커밋을 캐시에 두고, 컬럼/행 선택은 캐시된 DataFrame에서 잘라 냅니다.
+    캐시에 없을 때 부분 체크아웃은 필요한 블록만 읽고 캐시에 넣지 않습니다.
+    반환값은 항상 복사본이라 호출자가 수정해도 캐시가 바뀌지 않습니다.
+    """
+    key = (file_path, record["hash"], os.stat(file_path).st_mtime_ns)
+    df = __checkout_cache.get(key)
+    if df is None:
+        if columns is not None or rows is not None:
+            return _read_commit_file(file_path, columns, rows)
+        df = _read_commit_file(file_path)
+        nbytes = record.get("size")
+        if nbytes is None:
+            nbytes = _deep_sizeof(df)
+        __checkout_cache.put(key, df, nbytes)
+    return _commit_snapshot(_project_frame(df, columns, rows))
+
+def checkout_cache_info():
+    """
+    체크아웃 메모리 캐시 상태를 반환합니다.
+    
+    Returns:
+    --------
+    dict : hits, misses, entries, bytes, max_bytes
+    """
+    return __checkout_cache.info()
+
+def checkout_cache_set_limit(max_bytes):
+    """체크아웃 메모리 캐시 용량(바이트) 설정. 0이면 캐시를 사용하지 않습니다."""
+    __checkout_cache.resize(max_bytes)
+
+def checkout_cache_clear():
+    """체크아웃 메모리 캐시를 비우고 hit/miss 통계를 초기화합니다."""
+    __checkout_cache.clear()
+
+def mmap_cache_info():
+    """
+    checkout(mmap=True)용 로컬 memory-map 캐시 상태를 반환합니다.
+    이 캐시는 커밋 저장소 밖(로컬 디스크)에 있으므로 commit_gc(max_bytes=...) 용량 계산에 포함되지 않습니다.
+    
+    Returns:
+    --------
+    dict : dir, files, bytes, max_bytes
+    """
+    cache_dir = _columnar_mmap_dir()
+    sizes = []
+    if os.path.isdir(cache_dir):
+        with os.scandir(cache_dir) as entries:
+            sizes = [e.stat().st_size for e in entries if e.is_file() and not e.name.endswith(".tmp")]
+    return {'dir': cache_dir, 'files': len(sizes), 'bytes': sum(sizes), 'max_bytes': __mmap_cache_bytes}
+
+def mmap_cache_set_limit(max_bytes):
+    """memory-map 캐시 용량(바이트) 설정. 넘는 만큼 오래 사용하지 않은 파일부터 바로 삭제합니다."""
+    global __mmap_cache_bytes
+    __mmap_cache_bytes = int(max_bytes)
+    _columnar_mmap_evict()
+
+def mmap_cache_set_dir(cache_dir=None):
+    """memory-map 캐시 디렉토리 설정 (None이면 로컬 임시 디렉토리). 반드시 로컬 디스크 경로를 지정하세요."""
+    global __mmap_cache_dir
+    __mmap_cache_dir = None if cache_dir is None else os.path.abspath(cache_dir)
+
+def mmap_cache_clear():
+    """memory-map 캐시 파일을 모두 삭제합니다. (이미 매핑된 배열은 POSIX에서 계속 사용 가능)"""
+    cache_dir = _columnar_mmap_dir()
+    for name in _scandir_names(cache_dir):
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except OSError:
+            pass
+
+
 # =============================================================================
 # PANDAS COMMIT SYSTEM: CORE FUNCTIONS
 # =============================================================================
 
-def pd_commit(df, msg, commit_dir=None):
+def _commit_file_referenced(index, fname, exclude=None):
+    """exclude 이외의 커밋 레코드가 같은 커밋 파일을 참조하는지 확인"""
+    return any(fname in _record_files(m) and m is not exclude for m in index.records)
+
+def _commit_remove_files(index, record, save_dir, keep=()):
+    """제거된 레코드의 커밋 파일 중 keep에 없고 다른 커밋도 참조하지 않는 파일을 삭제"""
+    for fname in _record_files(record):
+        if fname not in keep and not _commit_file_referenced(index, fname, exclude=record):
+            _stage_remove(os.path.join(save_dir, fname), missing_ok=True)
+
+def _pandas_copy_on_write():
+    """pandas Copy-on-Write 활성화 여부 (pandas 3.0부터는 항상 활성화)"""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except (KeyError, AttributeError):  # Copy-on-Write 옵션이 없는 이전 버전
+        return False
+
+def _commit_snapshot(df):
+    """
+    백그라운드 커밋용 스냅샷
+    Copy-on-Write가 켜져 있으면 데이터를 복사하지 않는 얕은 복사로 충분하고,
+    아니면 이후 원본 수정이 저장 내용에 섞이지 않도록 깊은 복사를 합니다.
+    numpy 배열은 항상 복사하고, dict는 값마다 스냅샷을 만듭니다.
+    """
+    if isinstance(df, dict):
+        return {name: _commit_snapshot(value) for name, value in df.items()}
+    if isinstance(df, np.ndarray):
+        return df.copy()
+    snapshot = df.copy(deep=not _pandas_copy_on_write())
+    snapshot.attrs = copy.deepcopy(dict(getattr(df, 'attrs', {})))
+    return snapshot
+
+def _commit_run(df, msg, commit_dir, compression=None, trace_memory=False):
+    """작업 스레드에서 커밋 실행 (실패는 출력하고 Future에도 전달)"""
+    try:
+        return _pd_commit_now(df, msg, commit_dir, compression, trace_memory=trace_memory)
+    except Exception as e:
+        print(f"오류: 백그라운드 커밋 실패 ({msg}): {e}")
+        raise
+
+def _commit_submit(df, msg, commit_dir, compression=None, trace_memory=False):
+    """스냅샷을 백그라운드 커밋 작업자에 제출하고 Future 반환"""
+    global __commit_executor
+    with __commit_lock:
+        if __commit_executor is None:
+            __commit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="helper-commit")
+        __commit_futures[:] = [f for f in __commit_futures if not f.done()]
+        future = __commit_executor.submit(_commit_run, df, msg, commit_dir, compression, trace_memory)
+        __commit_futures.append(future)
+    return future
+
+def _commit_wait_pending():
+    """대기 중인 백그라운드 커밋이 모두 끝날 때까지 대기 (실패는 commit_wait에서 확인)"""
+    with __commit_lock:
+        futures = list(__commit_futures)
+    if futures:
+        wait(futures)
+
+def commit_wait(timeout=None):
+    """
+    대기 중인 백그라운드 커밋(df.commit(..., background=True))이 모두 저장될 때까지 대기합니다.
+    스테이징 모드에서 원격 동기화까지 기다리려면 이어서 staging_flush()를 호출하세요.
+    
+    Returns:
+    --------
+    int : 완료를 기다린 커밋 수
+    
+    Raises:
+    -------
+    백그라운드 커밋 중 발생한 첫 번째 예외 (대기 시간 초과 시 TimeoutError)
+    """
+    with __commit_lock:
+        futures = list(__commit_futures)
+    try:
+        for f in futures:
+            f.result(timeout=timeout)
+    finally:
+        # 끝난 커밋의 실패는 한 번만 보고
+        with __commit_lock:
+            __commit_futures[:] = [f for f in __commit_futures if not f.done()]
+    return len(futures)
+
+def pd_commit(df, msg, commit_dir=None, background=False, compression=None, trace_memory=False):
     """
     DataFrame의 현재 상태를 git처럼 커밋합니다.
-    파일명: 해시키.pkl, 메타: pandas_df.json
+    파일명: 해시키.col_helper (스키마/블록 목록), 블록: objects/ (내용 해시 기반 공유 저장소),
+    메타: pandas_df.json
+    커밋 해시는 DataFrame 내용(attrs 포함) 지문과 메시지로 결정됩니다.
+    같은 메시지의 기존 커밋이나 직전 커밋과 내용이 같으면 파일을 다시 쓰지 않습니다.
+    이전 커밋과 내용이 같은 (컬럼, row group) 블록은 다시 쓰지 않고 참조만 합니다.
     commit_dir: 저장할 폴더 지정 (None이면 기본)
     동일한 메시지가 있으면 기존 커밋을 새 커밋으로 대체(업데이트)합니다.
+    background: True이면 DataFrame 스냅샷만 만들고 즉시 Future를 반환하며, 저장은 작업 스레드에서 진행됩니다.
+                이후 checkout/commit_list 등은 대기 중인 커밋이 끝난 뒤 실행됩니다. (commit_wait 참고)
+    compression: 블록 압축 수준 'fast' | 'balanced' | 'small' (None이면 set_commit_compression 설정값)
+                 블록 압축/해제는 스레드 풀에서 병렬로 처리되며, 단계별 소요 시간은 커밋 메타데이터(timings)에 남습니다.
+    trace_memory: True이면 tracemalloc으로 커밋 중 추가 메모리 최대치(peak_memory)를 기록합니다.
+                  (할당이 느려지므로 기본값은 False, 이미 켜 둔 tracemalloc은 건드리지 않음)
+    df에는 DataFrame 외에 Series, numpy 배열, 또는 이들의 dict({이름: 값})를 넘길 수 있습니다.
+    배열은 DataFrame으로 바꾸지 않고 원시 버퍼 그대로 저장되며, dict는 묶음 커밋(commit_many)이 됩니다.
+    체크아웃하면 커밋한 타입 그대로 돌아옵니다.
     """
-    if df is None or not isinstance(df, pd.DataFrame):
-        raise ValueError("df 인자가 None이거나 유효한 DataFrame이 아닙니다.")
-    dt = datetime.datetime.now()
-    dt_str = dt.strftime("%Y-%m-%d %H:%M:%S")  # ISO8601 포맷
-    commit_hash = _generate_commit_hash(dt, msg)
-    fname = f"{commit_hash}.pkl_helper"
-    save_dir = os.path.join(pd_root(commit_dir), ".commit_pandas")
-    os.makedirs(save_dir, exist_ok=True)
+    if isinstance(df, dict):
+        for name, value in df.items():
+            _commit_check_object(value, name)
+    else:
+        _commit_check_object(df)
+    compression = _commit_compression(compression)
+    if background:
+        return _commit_submit(_commit_snapshot(df), msg, commit_dir, compression, trace_memory)
+    _commit_wait_pending()
+    return _pd_commit_now(df, msg, commit_dir, compression, trace_memory=trace_memory)
+
+def _commit_check_object(obj, name=None):
+    """커밋할 수 있는 타입(DataFrame, Series, numpy 배열)인지 확인"""
+    if not isinstance(obj, (pd.DataFrame, pd.Series, np.ndarray)):
+        where = "" if name is None else f"멤버 '{name}': "
+        raise ValueError(f"{where}DataFrame, Series, numpy 배열만 커밋할 수 있습니다. 현재 타입: {type(obj)}")
+
+def _commit_unchanged(index, msg, fingerprint, save_dir):
+    """같은 메시지의 커밋이 같은 내용으로 이미 있으면 그 레코드, 없으면 None"""
+    old = index.by_msg.get(msg)
+    if (old is not None and old.get("fingerprint") == fingerprint
+            and _stage_exists(os.path.join(save_dir, old["file"]))):
+        return old
+    return None
+
+def _commit_reusable_parent(index, msg, fingerprint, save_dir):
+    """직전 커밋(같은 메시지 제외)과 내용이 같으면 그 레코드, 아니면 None"""
+    for parent in reversed(index.records):
+        if parent["msg"] == msg:
+            continue
+        if (parent.get("fingerprint") == fingerprint
+                and _stage_exists(os.path.join(save_dir, parent["file"]))):
+            return parent
+        return None
+    return None
 
-    meta = _load_commit_meta(commit_dir)
-    # print(f"커밋 준비: {commit_hash} | {dt_str} | {msg}")
-    # print(f"meta: {meta}")
-    # 메타데이터 파일 경로
-    
-    # 동일한 메시지(msg)가 있으면 기존 파일 삭제 및 메타에서 제거
-    old_idx = None
-    for i, m in enumerate(meta):
-        if m["msg"] == msg:
-            old_file = os.path.join(save_dir, m["file"])
-            if os.path.exists(old_file):
-                os.remove(old_file)
-            old_idx = i
-            break
-    if old_idx is not None:
-        meta.pop(old_idx)
-
-    # 새 커밋 저장
-    df_to_pickle(df, os.path.join(save_dir, fname))
-    meta.append({
-        "hash": commit_hash,
-        "datetime": dt_str,
-        "msg": msg,
-        "file": fname
-    })
-    _save_commit_meta(meta, commit_dir)
-    print(f"✅ 커밋 완료: {commit_hash} | {dt_str} | {msg}")
+@contextlib.contextmanager
+def _commit_memory_trace():
+    """
+    커밋하는 동안 tracemalloc으로 메모리 할당을 추적 (최대 추가 사용량은 _commit_peak_memory로 조회)
+    사용자가 이미 켠 tracemalloc은 건드리지 않고(reset_peak/stop 없음) 최대치도 기록하지 않으며,
+    직접 켠 경우만 끝날 때 끕니다. 최대치는 프로세스 전체 값이므로 다른 커밋과 겹치면 기록하지 않습니다.
+    같은 스레드에서 중첩되면 바깥 커밋의 기준을 유지합니다.
+    """
+    depth = getattr(__commit_trace_local, "depth", 0)
+    with __commit_trace_lock:
+        if __commit_trace["users"] == 0:
+            __commit_trace["owner"] = not tracemalloc.is_tracing()
+            if __commit_trace["owner"]:
+                tracemalloc.start()
+        __commit_trace["users"] += 1
+        if depth == 0:
+            __commit_trace["starts"] += 1
+            alone = __commit_trace["owner"] and __commit_trace["users"] == 1
+            if alone:
+                tracemalloc.reset_peak()
+            __commit_trace_local.start = __commit_trace["starts"] if alone else None
+            __commit_trace_local.base = tracemalloc.get_traced_memory()[0] if alone else 0
+    __commit_trace_local.depth = depth + 1
+    try:
+        yield
+    finally:
+        __commit_trace_local.depth = depth
+        with __commit_trace_lock:
+            __commit_trace["users"] -= 1
+            if __commit_trace["users"] == 0 and __commit_trace["owner"]:
+                tracemalloc.stop()
+
+def _commit_traced(fn):
+    """
+    trace_memory=True 키워드 인자로 호출하면 커밋 함수 실행 동안 메모리 할당을 추적하는 decorator
+    (_commit_memory_trace 참고). 기본값은 추적하지 않음 (tracemalloc은 모든 할당을 느리게 하므로 필요할 때만 사용)
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not kwargs.get("trace_memory"):
+            return fn(*args, **kwargs)
+        with _commit_memory_trace():
+            return fn(*args, **kwargs)
+    return wrapper
+
+def _commit_peak_memory():
+    """
+    현재 커밋이 시작된 뒤 추가로 사용한 메모리 최대치(바이트)
+    추적하지 않았거나, 사용자가 켠 tracemalloc을 이어 썼거나, 다른 커밋과 겹쳐 나눌 수 없으면 None
+    (같은 시간에 다른 스레드가 할당한 메모리도 함께 집계되는 근사값)
+    """
+    if getattr(__commit_trace_local, "depth", 0) == 0 or getattr(__commit_trace_local, "start", None) is None:
+        return None
+    with __commit_trace_lock:
+        if __commit_trace["starts"] != __commit_trace_local.start or not tracemalloc.is_tracing():
+            return None
+        return max(0, tracemalloc.get_traced_memory()[1] - __commit_trace_local.base)
+
+def _commit_disk_bytes(object_dir, refs, file_paths):
+    """커밋이 디스크에서 차지하는 바이트 (커밋 파일 + 참조 객체의 압축 크기, 다른 커밋과 공유하는 객체 포함)"""
+    packed = _pack_index(object_dir)
+    total = 0
+    for path in file_paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    for object_hash in refs:
+        if object_hash in packed:
+            total += packed[object_hash][2]
+            continue
+        try:
+            total += os.path.getsize(_columnar_object_path(object_dir, object_hash))
+        except OSError:  # 원격에만 있는 객체
+            pass
+    return total
+
+def _commit_size_stats(size, disk_bytes):
+    """레코드에 남길 디스크 사용량/압축률 (compression_ratio = 디스크 바이트 / 원본 바이트, cache_stats와 같은 기준)"""
+    return {
+        "disk_bytes": disk_bytes,
+        "compression_ratio": round(disk_bytes / size, 4) if size else None,
+        "peak_memory": _commit_peak_memory()
+    }
+
+@_stage_batched
+@_commit_traced
+def _pd_commit_now(df, msg, commit_dir=None, compression=None, trace_memory=False):
+    """pd_commit의 실제 저장 처리 (대기 중인 백그라운드 커밋을 기다리지 않음)"""
+    if isinstance(df, dict):
+        _commit_many_now(df, msg, commit_dir, compression=compression)
+        return df
+    started = time.perf_counter()
+    footer, blocks = _columnar_plan(df)
+    stats = {"blocks": 0, "new_blocks": 0, "new_bytes": 0, "plan": time.perf_counter() - started}
+    _commit_publish(footer, blocks, msg, commit_dir, stats=stats, compression=compression, started=started)
     return df
 
+def _commit_timed_write(totals, fn, *args, **kwargs):
+    """블록 압축/기록 함수를 실행하고 걸린 시간을 totals["write"]에 누적"""
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    totals["write"] = totals.get("write", 0.0) + time.perf_counter() - t0
+    return result
+
+def _commit_timings(stats, started):
+    """커밋 메타데이터에 남길 단계별 소요 시간(초): plan(직렬화/해시), write(압축/기록), total"""
+    return {
+        "plan": round(stats.get("plan", 0.0), 4),
+        "write": round(stats.get("write", 0.0), 4),
+        "total": round(time.perf_counter() - started, 4)
+    }
 
-def pd_commit_list(commit_dir=None):
+def _commit_publish(footer, blocks, msg, commit_dir=None, stats=None, size=None, compression=None, started=None):
     """
-    커밋 리스트를 시간순으로 반환 (존재하는 파일만, 없으면 자동 삭제)
-    commit_dir: 저장 폴더 지정
-    반환값: pandas.DataFrame (순서, 해시, 시간, 메시지, 파일)
+    footer를 커밋 파일로 기록하고 메타데이터에 커밋으로 게시한 뒤 레코드를 반환
+    블록/커밋 파일은 잠금 없이 기록하고, 메타데이터 갱신만 잠금 안에서 최신 상태를 다시 읽어 처리하므로
+    여러 프로세스가 동시에 커밋해도 기록이 사라지지 않습니다.
+    blocks: 아직 객체 저장소에 없을 수 있는 블록 목록
+            (commit_stream처럼 이미 기록했으면 비우고 stats/size로 통계를 넘김)
+    started: 커밋을 시작한 time.perf_counter() 값 (timings의 total 기준, None이면 지금)
     """
-    meta = _load_commit_meta(commit_dir)
-    save_dir = os.path.join(pd_root(commit_dir), ".commit_pandas")
-    new_meta = []
-    removed_count = 0
-    
-    for m in meta:
-        file_path = os.path.join(save_dir, m["file"])
-        if os.path.exists(file_path):
-            new_meta.append(m)
+    started = time.perf_counter() if started is None else started
+    compression = _commit_compression(compression)
+    fingerprint = _columnar_fingerprint(footer)
+    commit_hash = _generate_commit_hash(fingerprint, msg)
+    fname = f"{commit_hash}.col_helper"
+    save_dir = _commit_save_dir(commit_dir)
+    object_dir = os.path.join(save_dir, "objects")
+    os.makedirs(save_dir, exist_ok=True)
+    stats = {"blocks": 0, "new_blocks": 0, "new_bytes": 0} if stats is None else stats
+    if size is None:
+        size = sum(block["size"] for block, _, _, _ in blocks)
+
+    # 같은 메시지의 커밋과 내용이 같으면 아무것도 하지 않음
+    index = _load_commit_index(commit_dir)
+    old = _commit_unchanged(index, msg, fingerprint, save_dir)
+    if old is not None:
+        print(f"✅ 변경 없음: {old['hash']} | {old['datetime']} | {msg}")
+        return old
+
+    # 직전 커밋과 내용이 같으면 그 파일을 재사용하므로, 아닐 때만 잠금 밖에서 미리 기록
+    written = False
+    if _commit_reusable_parent(index, msg, fingerprint, save_dir) is None:
+        _commit_timed_write(stats, _columnar_write, os.path.join(save_dir, fname), footer, blocks,
+                            object_dir=object_dir, compression=compression, stats=stats)
+        written = True
+
+    with _commit_meta_lock(commit_dir):
+        index = _load_commit_index(commit_dir, for_update=True)  # 그 사이 다른 프로세스가 커밋했을 수 있음
+        old = _commit_unchanged(index, msg, fingerprint, save_dir)
+        if old is not None:
+            print(f"✅ 변경 없음: {old['hash']} | {old['datetime']} | {msg}")
+            return old
+
+        parent = _commit_reusable_parent(index, msg, fingerprint, save_dir)
+        if parent is not None:
+            if written and not _commit_file_referenced(index, fname):
+                _stage_remove(os.path.join(save_dir, fname), missing_ok=True)
+            fname = parent["file"]
+            mtime = parent.get("mtime")
+            detail = f"직전 커밋 {parent['hash']}과 내용 동일, 파일 재사용"
         else:
-            print(f"경고: 누락된 파일 '{m['file']}' (메시지: {m['msg']}) 메타데이터에서 제거")
-            removed_count += 1
-    
-    # 메타데이터 정리가 필요한 경우
-    if removed_count > 0:
-        _save_commit_meta(new_meta, commit_dir)
-        print(f"✅ {removed_count}개의 누락된 커밋 항목을 정리했습니다.")
-    
-    new_meta.sort(key=lambda x: x["datetime"])
+            if not written or not os.path.exists(os.path.join(save_dir, fname)):
+                # 재사용하려던 직전 커밋이 바뀌었거나, 잠금 밖에서 기록한 파일을 다른 프로세스의 정리가 지움
+                _commit_timed_write(stats, _columnar_write, os.path.join(save_dir, fname), footer, blocks,
+                                    object_dir=object_dir, compression=compression, stats=stats)
+            else:
+                # 잠금 밖에서 기록하는 동안 다른 프로세스의 정리로 지워진 객체가 있으면 다시 기록
+                _commit_timed_write(stats, _columnar_store_objects, blocks, object_dir, compression, stats)
+            missing = [h for h in _columnar_footer_refs(footer)
+                       if not _stage_exists(_columnar_object_path(object_dir, h)) and h not in _pack_index(object_dir)]
+            if missing:
+                raise RuntimeError(f"커밋 도중 다른 프로세스의 정리로 블록 {len(missing)}개가 삭제되었습니다. 다시 커밋하세요.")
+            _stage_push(os.path.join(save_dir, fname))
+            mtime = os.stat(os.path.join(save_dir, fname)).st_mtime
+            detail = (f"블록 {stats['new_blocks']}/{stats['blocks']}개 새로 저장, "
+                      f"{stats['new_bytes'] / 1024 / 1024:.2f}MB")
+
+        # 동일한 메시지(msg)가 있으면 메타에서 제거하고, 다른 커밋이 참조하지 않는 파일은 삭제
+        old = index.by_msg.get(msg)
+        if old is not None:
+            index.remove(old)
+            __checkout_cache.discard(old["hash"])
+            _commit_remove_files(index, old, save_dir, keep=(fname,))
+
+        dt = datetime.datetime.now()
+        dt_str = dt.strftime("%Y-%m-%d %H:%M:%S")  # ISO8601 포맷
+        record = {
+            "hash": commit_hash,
+            "datetime": dt_str,
+            "msg": msg,
+            "file": fname,
+            "fingerprint": fingerprint,
+            "rows": footer["nrows"],
+            "cols": footer["ncols"],
+            "size": size,
+            "mtime": mtime,
+            "compression": compression,
+            "stored_bytes": stats["new_bytes"],
+            "timings": _commit_timings(stats, started)
+        }
+        record.update(_commit_size_stats(size, _commit_disk_bytes(
+            object_dir, _columnar_footer_refs(footer), [os.path.join(save_dir, fname)])))
+        if "type" in footer:
+            record["type"] = footer["type"]
+        index.append(record)
+        _save_commit_index(index, commit_dir)
+    print(f"✅ 커밋 완료: {commit_hash} | {dt_str} | {msg} ({detail}, {record['timings']['total']:.2f}초)")
+    return record
+
+
+def _commit_time_str(value):
+    """since/until 인자를 메타데이터 시간 문자열 형식으로 변환"""
+    if isinstance(value, str) and len(value) == 19:
+        return value
+    return pd.Timestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+
+def pd_commit_list(commit_dir=None, since=None, until=None, msg_contains=None, stats=False):
+    """
+    커밋 리스트를 시간순으로 반환 (존재하는 파일만)
+    파일이 없는 커밋은 경고만 출력하고 목록에서 제외합니다. 메타데이터 정리는 commit_fsck(repair=True)로 합니다.
+    커밋 파일을 열지 않고 메타데이터 인덱스만으로 목록을 만들며,
+    파일 존재 여부는 커밋 폴더를 한 번 읽어(os.scandir) 확인합니다.
+    commit_dir: 저장 폴더 지정
+    since, until: 이 시간 이후/이전 커밋만 (문자열, datetime, Timestamp)
+    msg_contains: 메시지에 이 문자열이 포함된 커밋만
+    stats: True이면 커밋별 계측값을 숫자 컬럼으로 정리해서 반환 (_commit_stats_frame 참고)
+    반환값: pandas.DataFrame (순서, 해시, 시간, 메시지, 파일, 행/열 수, 데이터 크기, 파일 수정 시간,
+            타입/태그가 있는 커밋이 있으면 type, tags)
+    """
+    _commit_wait_pending()
+    index = _load_commit_index(commit_dir)
+    save_dir = _commit_save_dir(commit_dir)
+    existing = _stage_listdir(save_dir)
+    missing = [m for m in index.records if not existing.issuperset(_record_files(m))]
+    for m in missing:
+        files = ", ".join(f for f in _record_files(m) if f not in existing)
+        print(f"경고: 누락된 파일 '{files}' (메시지: {m['msg']}) 목록에서 제외")
+    if missing:
+        print(f"💡 helper.commit_fsck(repair=True)로 누락된 커밋 {len(missing)}개를 메타데이터에서 정리할 수 있습니다.")
+    missing = {id(m) for m in missing}
+    
+    new_meta = list(index.timeline()[1])
+    positions = range(len(new_meta))
+    if missing or since is not None or until is not None or msg_contains is not None:
+        since = None if since is None else _commit_time_str(since)
+        until = None if until is None else _commit_time_str(until)
+        selected = [(i, m) for i, m in enumerate(new_meta)
+                    if id(m) not in missing
+                    and (since is None or m["datetime"] >= since)
+                    and (until is None or m["datetime"] <= until)
+                    and (msg_contains is None or msg_contains in str(m["msg"]))]
+        positions = [i for i, _ in selected]
+        new_meta = [m for _, m in selected]
     # DataFrame 변환
     df = pd.DataFrame(new_meta)
     if not df.empty:
         # datetime 컬럼을 pandas datetime 타입으로 변환
         df['datetime'] = pd.to_datetime(df['datetime'], errors='coerce')
-        df.insert(0, 'index', range(len(df)))
+        if 'mtime' in df.columns:
+            df['mtime'] = pd.to_datetime(df['mtime'], unit='s', errors='coerce')
+        if 'type' in df.columns or 'members' in df.columns:  # DataFrame 커밋 레코드에는 type이 없음
+            df['type'] = [m.get('type', 'bundle' if 'members' in m else 'frame') for m in new_meta]
+        df.insert(0, 'index', list(positions))
+        if stats:
+            df = _commit_stats_frame(df)
+        else:
+            df = df[[col for col in __COMMIT_LIST_COLUMNS if col in df.columns]]
     else:
         print("커밋 내역이 없습니다.")
     return df
 
-def pd_checkout(idx_or_hash, commit_dir=None):
+def _commit_stats_frame(df):
     """
-    커밋 해시, 시간정보, 메시지, 순서번호로 DataFrame 복원
-    파일이 없는 경우 메타데이터에서 자동으로 정리하고 빈 DataFrame 반환
-    commit_dir: 저장 폴더 지정
+    pd_commit_list 결과를 커밋별 계측값 표로 변환
+    plan_sec(직렬화/해시), write_sec(압축/기록), total_sec, size(원본 바이트), disk_bytes(커밋 파일 + 참조 블록),
+    stored_bytes(새로 기록한 바이트), compression_ratio(disk_bytes / size, 1보다 작으면 디스크에서 더 작음),
+    write_mb_s, peak_memory(추가 메모리 최대치),
+    read_count/read_mb_s(현재 세션에서 체크아웃한 기록)
+    기록되기 전 버전의 커밋은 해당 값이 NaN입니다.
     """
-    meta = _load_commit_meta(commit_dir)
-    save_dir = os.path.join(pd_root(commit_dir), ".commit_pandas")
+    timings = df['timings'] if 'timings' in df.columns else pd.Series([None] * len(df), index=df.index)
+    out = df[['index', 'hash', 'datetime', 'msg']].copy()
+    out['type'] = df['type'] if 'type' in df.columns else 'frame'
+    out['compression'] = df['compression'] if 'compression' in df.columns else None
+    for col in ('rows', 'cols', 'size', 'disk_bytes', 'stored_bytes', 'peak_memory'):
+        out[col] = pd.to_numeric(df[col], errors='coerce') if col in df.columns else np.nan
+    # 저장된 값 대신 다시 계산 (이전 버전은 size / disk_bytes로 기록)
+    out.insert(out.columns.get_loc('peak_memory'), 'compression_ratio',
+               out['disk_bytes'] / out['size'].where(out['size'] > 0))
+    for key in ('plan', 'write', 'total'):
+        values = [t.get(key) if isinstance(t, dict) else None for t in timings]
+        out[f'{key}_sec'] = pd.to_numeric(pd.Series(values, index=df.index, dtype=object), errors='coerce')
+    out['write_mb_s'] = out['size'] / 1024 ** 2 / out['total_sec'].where(out['total_sec'] > 0)
+    reads = [__checkout_reads.get(h, [0, 0.0, 0]) for h in out['hash']]
+    out['read_count'] = [r[0] for r in reads]
+    out['read_mb_s'] = [r[2] / 1024 ** 2 / r[1] if r[1] > 0 else np.nan for r in reads]
+    return out
+
+def commit_stats(commit_dir=None, by=None):
+    """
+    커밋 계측값을 모아 요약합니다. 어떤 단계의 체크포인트가 느리거나 큰지 확인할 때 사용합니다.
+    
+    Parameters:
+    -----------
+    by : None, str 또는 callable
+        None이면 전체를 한 행으로, 'msg' 같은 컬럼 이름이면 그 값별로,
+        callable이면 메시지에 적용한 결과별로 묶습니다. (예: lambda m: m.split()[0])
     
-    # 메타데이터 정리 플래그
-    meta_updated = False
+    Returns:
+    --------
+    pandas.DataFrame : commits, rows, size_mb, disk_mb (공유 블록 중복 포함), stored_mb, compression_ratio,
+                       plan_sec, write_sec, total_sec (합계), write_mb_s, peak_memory_mb (최대), read_count, read_mb_s
+                       compression_ratio/write_mb_s는 해당 값이 기록된 커밋만으로 계산하고, 없으면 NaN
     
-    if isinstance(idx_or_hash, int):
-        if idx_or_hash < 0 or idx_or_hash >= len(meta):
-            print(f"오류: 순서번호 {idx_or_hash}가 범위를 벗어났습니다. (0-{len(meta)-1})")
+    Examples:
+    ---------
+    >>> helper.commit_stats()
+    >>> helper.commit_stats(by=lambda m: m.split("_")[0])
+    """
+    df = pd_commit_list(commit_dir, stats=True)
+    if df.empty:
+        return df
+    if by is None:
+        keys = pd.Series("전체", index=df.index)
+    elif callable(by):
+        keys = df['msg'].map(by)
+    else:
+        keys = df[by]
+    mb = 1024 ** 2
+    df = df.assign(read_sec=[__checkout_reads.get(h, [0, 0.0, 0])[1] for h in df['hash']],
+                   read_bytes=[__checkout_reads.get(h, [0, 0.0, 0])[2] for h in df['hash']],
+                   # 계측값이 없는 이전 커밋의 크기는 비율/속도 계산에서 제외
+                   measured_size=df['size'].where(df['disk_bytes'].notna()),
+                   timed_size=df['size'].where(df['total_sec'].notna()))
+    grouped = df.groupby(keys.rename('group'), sort=False)
+    summary = pd.DataFrame({
+        'commits': grouped.size(),
+        'rows': grouped['rows'].sum(),
+        'size_mb': grouped['size'].sum() / mb,
+        'disk_mb': grouped['disk_bytes'].sum(min_count=1) / mb,
+        'stored_mb': grouped['stored_bytes'].sum(min_count=1) / mb,
+        'plan_sec': grouped['plan_sec'].sum(min_count=1),
+        'write_sec': grouped['write_sec'].sum(min_count=1),
+        'total_sec': grouped['total_sec'].sum(min_count=1),
+        'peak_memory_mb': grouped['peak_memory'].max() / mb,
+        'read_count': grouped['read_count'].sum()
+    })
+    measured = grouped['measured_size'].sum(min_count=1) / mb
+    summary['compression_ratio'] = summary['disk_mb'] / measured.where(measured > 0)
+    summary['write_mb_s'] = grouped['timed_size'].sum(min_count=1) / mb / summary['total_sec'].where(summary['total_sec'] > 0)
+    read_sec = grouped['read_sec'].sum()
+    summary['read_mb_s'] = grouped['read_bytes'].sum() / mb / read_sec.where(read_sec > 0)
+    return summary.round(4)
+
+def _resolve_commit(index, idx_or_hash):
+    """커밋을 찾고, 없으면 오류 메시지를 출력한 뒤 (None, None) 반환"""
+    position, record = index.resolve(idx_or_hash)
+    if record is None:
+        if isinstance(idx_or_hash, int):
+            print(f"오류: 순서번호 {idx_or_hash}가 범위를 벗어났습니다. (0-{len(index)-1})")
+        else:
+            print(f"오류: 커밋 '{idx_or_hash}'을(를) 찾을 수 없습니다.")
+    return position, record
+
+def pd_checkout(idx_or_hash, commit_dir=None, columns=None, rows=None, member=None, chunksize=None, mmap=False):
+    """
+    커밋 해시, 시간정보, 메시지, 순서번호로 DataFrame 복원 (Series/numpy 배열 커밋은 해당 타입으로 복원)
+    파일이 없거나 읽을 수 없으면 빈 DataFrame 반환 (메타데이터는 바꾸지 않음, commit_fsck 참고)
+    commit_dir: 저장 폴더 지정
+    columns: 읽을 컬럼 목록 (None이면 전체). 해당 컬럼 블록만 읽습니다.
+    rows: 읽을 행 범위 slice (예: slice(-10000, None)). 해당 row group만 읽습니다.
+    member: 묶음 커밋(commit_many)에서 읽을 멤버 이름. None이면 {이름: DataFrame} dict 반환
+    chunksize: 지정하면 DataFrame 대신 chunksize 행씩 나눠 읽는 iterator 반환 (row group을 하나씩만 읽음)
+    mmap: True이면 고정폭 숫자/datetime 컬럼(과 numpy 배열 커밋)을 읽기 전용 memory-map으로 반환합니다.
+          RAM에 전부 올리지 않고 접근하는 부분만 페이지 단위로 읽으며, 같은 커밋을 여는 여러 노트북이
+          같은 파일을 공유합니다. 압축된 블록은 처음 한 번 로컬 memory-map 캐시 파일로 풀어 둡니다.
+          (캐시는 커밋 저장소 크기에 포함되지 않으며 용량을 넘으면 LRU로 삭제, mmap_cache_info 참고)
+          반환된 배열은 수정할 수 없으므로 수정하려면 .copy() 하세요. (메모리 캐시는 사용하지 않음)
+    최근 체크아웃한 커밋은 메모리 캐시에서 복사본으로 반환합니다. (checkout_cache_info 참고)
+    """
+    if chunksize is not None and rows is not None:
+        raise ValueError("chunksize와 rows는 함께 사용할 수 없습니다.")
+    if chunksize is not None and mmap:
+        raise ValueError("chunksize와 mmap은 함께 사용할 수 없습니다.")
+    _commit_wait_pending()
+    index = _load_commit_index(commit_dir)
+    save_dir = _commit_save_dir(commit_dir)
+    
+    _, record = _resolve_commit(index, idx_or_hash)
+    if record is None:
+        return pd.DataFrame()  # 빈 DataFrame 반환
+    
+    if "members" in record:
+        if member is None:
+            names = list(record["members"])
+        elif member in record["members"]:
+            names = [member]
+        else:
+            print(f"오류: 묶음 커밋 '{record['msg']}'에 멤버 '{member}'이(가) 없습니다. (멤버: {list(record['members'])})")
             return pd.DataFrame()
-        
-        fname = meta[idx_or_hash]["file"]
-        file_path = os.path.join(save_dir, fname)
-        
+        targets = [(name, record["members"][name]["file"], record["members"][name].get("size")) for name in names]
+    else:
+        targets = [(None, record["file"], record.get("size"))]
+    if columns is not None:
+        entries = [record["members"][name] for name, _, _ in targets] if "members" in record else [record]
+        typed = [m["type"] for m in entries if m.get("type", "frame") != "frame"]
+        if typed:
+            raise ValueError(f"columns는 DataFrame 커밋에서만 지정할 수 있습니다. (커밋 타입: {typed[0]})")
+
+    frames = {}
+    started = time.perf_counter()
+    for name, fname, size in targets:
+        file_path = _stage_pull(os.path.join(save_dir, fname))
+
         # 파일 존재 여부 확인
         if not os.path.exists(file_path):
-            print(f"경고: 파일 '{fname}'이 존재하지 않습니다. 메타데이터에서 제거합니다.")
-            meta.pop(idx_or_hash)
-            _save_commit_meta(meta, commit_dir)
+            print(f"경고: 파일 '{fname}'이 존재하지 않습니다. (helper.commit_fsck()로 저장소를 점검하세요)")
             return pd.DataFrame()
-        
+
+        if chunksize is not None:
+            frames[name] = _iter_commit_file(file_path, chunksize, columns)
+            continue
         try:
-            return df_read_pickle(file_path)
+            if mmap:
+                frames[name] = _read_commit_file(file_path, columns, rows, mmap=True)
+                continue
+            frames[name] = _checkout_read(file_path, {"hash": record["hash"], "size": size}, columns, rows)
         except Exception as e:
-            print(f"오류: 파일 읽기 실패: {e}")
-            # 손상된 파일 정보를 메타에서 제거
-            meta.pop(idx_or_hash)
-            _save_commit_meta(meta, commit_dir)
+            print(f"오류: 파일 읽기 실패: {e} (helper.commit_fsck()로 저장소를 점검하세요)")
             return pd.DataFrame()
-    
-    # 해시, 날짜, 메시지로 검색
-    for i, m in enumerate(meta):
-        if idx_or_hash == m["hash"] or idx_or_hash == m["datetime"] or idx_or_hash == m["msg"]:
-            fname = m["file"]
-            file_path = os.path.join(save_dir, fname)
-            
-            # 파일 존재 여부 확인
-            if not os.path.exists(file_path):
-                print(f"경고: 파일 '{fname}'이 존재하지 않습니다. 메타데이터에서 제거합니다.")
-                meta.pop(i)
-                _save_commit_meta(meta, commit_dir)
-                return pd.DataFrame()
-            
-            try:
-                return df_read_pickle(file_path)
-            except Exception as e:
-                print(f"오류: 파일 읽기 실패: {e}")
-                # 손상된 파일 정보를 메타에서 제거
-                meta.pop(i)
-                _save_commit_meta(meta, commit_dir)
-                return pd.DataFrame()
-    
-    print(f"오류: 커밋 '{idx_or_hash}'을(를) 찾을 수 없습니다.")
-    return pd.DataFrame()  # 빈 DataFrame 반환
+    if chunksize is None:
+        reads = __checkout_reads.setdefault(record["hash"], [0, 0.0, 0])
+        reads[0] += 1
+        reads[1] += time.perf_counter() - started
+        reads[2] += sum(size or 0 for _, _, size in targets)
+    if "members" in record and member is None:
+        return frames
+    return frames[targets[0][0]]
 
 
+@_stage_batched
 def pd_commit_rm(idx_or_hash, commit_dir=None):
     """
     커밋을 삭제합니다.
     idx_or_hash: 삭제할 커밋의 인덱스, 해시, 날짜, 또는 메시지
     commit_dir: 저장 폴더 지정
+    커밋 파일만 삭제하고, 더 이상 참조되지 않는 객체 블록은 commit_gc()에서 정리합니다.
     """
-    meta = _load_commit_meta(commit_dir)
-    save_dir = os.path.join(pd_root(commit_dir), ".commit_pandas")
-    if isinstance(idx_or_hash, int):
-        if idx_or_hash < 0 or idx_or_hash >= len(meta):
-            print(f"오류: 순서번호 {idx_or_hash}가 범위를 벗어났습니다. (0-{len(meta)-1})")
-            return False
-        fname = meta[idx_or_hash]["file"]
-        try:
-            os.remove(os.path.join(save_dir, fname))
-            meta.pop(idx_or_hash)  # 메타에서 삭제
-            _save_commit_meta(meta, commit_dir)
+    _commit_wait_pending()
+    with _commit_meta_lock(commit_dir):
+        return _pd_commit_rm_locked(idx_or_hash, commit_dir)
+
+def _pd_commit_rm_locked(idx_or_hash, commit_dir=None):
+    """pd_commit_rm의 실제 처리 (메타데이터 잠금 안에서 실행)"""
+    index = _load_commit_index(commit_dir, for_update=True)
+    save_dir = _commit_save_dir(commit_dir)
+    _, record = _resolve_commit(index, idx_or_hash)
+    if record is None:
+        return False
+    try:
+        # 같은 파일을 참조하는 다른 커밋이 있으면 파일은 남겨둠
+        for fname in _record_files(record):
+            if not _commit_file_referenced(index, fname, exclude=record):
+                _stage_remove(os.path.join(save_dir, fname))
+        index.remove(record)  # 메타에서 삭제
+        __checkout_cache.discard(record["hash"])
+        _save_commit_index(index, commit_dir)
+        if isinstance(idx_or_hash, int):
             print(f"✅ 커밋 {idx_or_hash} 삭제 완료")
-            return True
-        except OSError as e:
-            print(f"오류: 파일 삭제 실패: {e}")
-            return False
-    for i, m in enumerate(meta):
-        if idx_or_hash == m["hash"] or idx_or_hash == m["datetime"] or idx_or_hash == m["msg"]:
-            fname = m["file"]
-            try:
-                os.remove(os.path.join(save_dir, fname))
-                meta.pop(i)  # 메타에서 삭제
-                _save_commit_meta(meta, commit_dir)
-                print(f"✅ 커밋 '{idx_or_hash}' 삭제 완료")
-                return True
-            except OSError as e:
-                print(f"오류: 파일 삭제 실패: {e}")
-                return False
-    print(f"오류: 커밋 '{idx_or_hash}'을(를) 찾을 수 없습니다.")
-    return False
+        else:
+            print(f"✅ 커밋 '{idx_or_hash}' 삭제 완료")
+        return True
+    except OSError as e:
+        print(f"오류: 파일 삭제 실패: {e}")
+        return False
 
 def pd_commit_has(idx_or_hash, commit_dir=None):
     """
     커밋 index, hash, datetime, msg 중 하나를 입력받아
     해당 커밋 파일이 존재하면 True, 없으면 False 반환
     """
-    meta = _load_commit_meta(commit_dir)
-    save_dir = os.path.join(pd_root(commit_dir), ".commit_pandas")
-    # index로 검사
-    if isinstance(idx_or_hash, int):
-        if 0 <= idx_or_hash < len(meta):
-            fname = meta[idx_or_hash]["file"]
-            if os.path.exists(os.path.join(save_dir, fname)):
-                return True
+    _commit_wait_pending()
+    index = _load_commit_index(commit_dir)
+    _, record = index.resolve(idx_or_hash)
+    if record is None:
         return False
-    # hash, datetime, msg로 검사
-    for m in meta:
-        if idx_or_hash == m["hash"] or idx_or_hash == m["datetime"] or idx_or_hash == m["msg"]:
-            fname = m["file"]
-            if os.path.exists(os.path.join(save_dir, fname)):
-                return True
-    return False
+    save_dir = _commit_save_dir(commit_dir)
+    return all(_stage_exists(os.path.join(save_dir, fname)) for fname in _record_files(record))
+
+
+def commit_many(frames, msg, commit_dir=None, max_workers=None, compression=None, trace_memory=False):
+    """
+    여러 DataFrame(Series, numpy 배열)을 하나의 커밋(묶음 커밋)으로 저장합니다.
+    멤버별 블록/커밋 파일은 스레드 풀에서 병렬로 기록하고, 메타데이터는 한 번만 갱신하므로
+    모든 멤버가 같은 커밋 해시와 시간으로 함께 나타나거나 전혀 나타나지 않습니다.
+    
+    Parameters:
+    -----------
+    frames : dict
+        {멤버 이름: DataFrame, Series 또는 numpy 배열}
+    msg : str
+        커밋 메시지 (같은 메시지가 있으면 대체)
+    max_workers : int, optional
+        기록에 사용할 스레드 수 (기본값: ThreadPoolExecutor 기본값)
+    compression : str, optional
+        블록 압축 수준 'fast' | 'balanced' | 'small' (기본값: set_commit_compression 설정값)
+    trace_memory : bool, default False
+        True이면 커밋 중 추가 메모리 최대치(peak_memory)를 기록 (pd_commit 참고)
+    
+    Examples:
+    ---------
+    >>> helper.commit_many({"train": train_df, "valid": valid_df, "test": test_df}, "분할 v1")
+    >>> parts = pd.DataFrame.checkout("분할 v1")                  # {이름: DataFrame}
+    >>> train = pd.DataFrame.checkout("분할 v1", member="train")  # 멤버 하나
+    """
+    compression = _commit_compression(compression)
+    _commit_wait_pending()
+    return _commit_many_now(frames, msg, commit_dir, max_workers, compression, trace_memory=trace_memory)
+
+@_stage_batched
+@_commit_traced
+def _commit_many_now(frames, msg, commit_dir=None, max_workers=None, compression=None, trace_memory=False):
+    """commit_many의 실제 저장 처리 (대기 중인 백그라운드 커밋을 기다리지 않음)"""
+    if not isinstance(frames, dict) or not frames:
+        raise ValueError("frames는 {이름: DataFrame} 형태의 비어 있지 않은 dict여야 합니다.")
+    for name, df in frames.items():
+        if not isinstance(name, str):
+            raise ValueError(f"멤버 '{name}': 이름은 문자열이어야 합니다.")
+        _commit_check_object(df, name)
+    compression = _commit_compression(compression)
+    started = time.perf_counter()
+    save_dir = _commit_save_dir(commit_dir)
+    object_dir = os.path.join(save_dir, "objects")
+    os.makedirs(save_dir, exist_ok=True)
+
+    def _write(item):
+        name, df = item
+        t0 = time.perf_counter()
+        footer, blocks = _columnar_plan(df)
+        plan = time.perf_counter() - t0
+        fingerprint = _columnar_fingerprint(footer)
+        fname = f"{_generate_commit_hash(fingerprint, f'{msg}/{name}')}.col_helper"
+        file_path = os.path.join(save_dir, fname)
+        if _stage_exists(file_path):  # 파일 이름이 내용으로 정해지므로 같은 멤버가 이미 기록됨
+            stats = {"blocks": len(blocks), "new_blocks": 0, "new_bytes": 0}
+        else:
+            stats = {"blocks": 0, "new_blocks": 0, "new_bytes": 0}
+            _commit_timed_write(stats, _columnar_write, file_path, footer, blocks,
+                                object_dir=object_dir, compression=compression, stats=stats)
+            _stage_push(file_path)
+        stats["plan"] = plan
+        member = {
+            "file": fname,
+            "fingerprint": fingerprint,
+            "rows": footer["nrows"],
+            "cols": footer["ncols"],
+            "size": sum(block["size"] for block, _, _, _ in blocks)
+        }
+        if "type" in footer:
+            member["type"] = footer["type"]
+        return name, member, blocks, stats
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="helper-commit-many") as pool:
+        results = list(pool.map(_write, frames.items()))
+
+    members = {name: member for name, member, _, _ in results}
+    fingerprint = _columnar_fingerprint({name: m["fingerprint"] for name, m in members.items()})
+    commit_hash = _generate_commit_hash(fingerprint, msg)
+
+    with _commit_meta_lock(commit_dir):
+        index = _load_commit_index(commit_dir, for_update=True)
+        old = index.by_msg.get(msg)
+        if (old is not None and old.get("fingerprint") == fingerprint
+                and all(_stage_exists(os.path.join(save_dir, f)) for f in _record_files(old))):
+            print(f"✅ 변경 없음: {old['hash']} | {old['datetime']} | {msg}")
+            return commit_hash
+        # 잠금 밖에서 기록하는 동안 다른 프로세스의 정리로 지워진 객체가 있으면 다시 기록
+        for _, _, blocks, stats in results:
+            _commit_timed_write(stats, _columnar_store_objects, blocks, object_dir, compression, stats)
+
+        if old is not None:
+            index.remove(old)
+            __checkout_cache.discard(old["hash"])
+            _commit_remove_files(index, old, save_dir, keep={m["file"] for m in members.values()})
+
+        dt_str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        record = {
+            "hash": commit_hash,
+            "datetime": dt_str,
+            "msg": msg,
+            "members": members,
+            "fingerprint": fingerprint,
+            "size": sum(m["size"] for m in members.values()),
+            "mtime": time.time(),
+            "compression": compression,
+            "stored_bytes": sum(stats["new_bytes"] for _, _, _, stats in results),
+            # plan/write는 멤버별 소요 시간의 합 (병렬로 기록하므로 total보다 클 수 있음)
+            "timings": _commit_timings({k: sum(stats.get(k, 0.0) for _, _, _, stats in results)
+                                        for k in ("plan", "write")}, started)
+        }
+        refs = {block["object"] for _, _, blocks, _ in results for block, _, _, _ in blocks}
+        record.update(_commit_size_stats(record["size"], _commit_disk_bytes(
+            object_dir, refs, [os.path.join(save_dir, m["file"]) for m in members.values()])))
+        index.append(record)
+        _save_commit_index(index, commit_dir)
+
+    new_blocks = sum(stats["new_blocks"] for _, _, _, stats in results)
+    total_blocks = sum(stats["blocks"] for _, _, _, stats in results)
+    new_bytes = sum(stats["new_bytes"] for _, _, _, stats in results)
+    print(f"✅ 커밋 완료: {commit_hash} | {dt_str} | {msg} (멤버 {len(members)}개: {', '.join(members)}, "
+          f"블록 {new_blocks}/{total_blocks}개 새로 저장, {new_bytes / 1024 / 1024:.2f}MB)")
+    return commit_hash
+
+def _stream_align_dtypes(chunk, schema):
+    """commit_stream 조각의 dtype을 첫 조각(schema)에 맞춤. 값 손실 없이 바꿀 수 없으면 ValueError"""
+    if chunk.dtypes.equals(schema.dtypes):
+        return chunk
+    casts = []
+    for i, (expected, actual) in enumerate(zip(schema.dtypes, chunk.dtypes)):
+        if expected == actual:
+            continue
+        if isinstance(expected, np.dtype) and isinstance(actual, np.dtype) and np.can_cast(actual, expected, "safe"):
+            casts.append((i, expected))
+            continue
+        raise ValueError(f"commit_stream: 컬럼 {schema.columns[i]!r}의 dtype({actual})이 첫 조각({expected})과 다릅니다. "
+                         f"dtypes 인자로 모든 조각의 dtype을 지정하세요. (예: dtypes={{{schema.columns[i]!r}: '{actual}'}})")
+    chunk = chunk.copy(deep=False)
+    for i, dtype in casts:
+        chunk.isetitem(i, chunk.iloc[:, i].astype(dtype))
+    return chunk
+
+@_stage_batched
+@_commit_traced
+def commit_stream(frames, msg, commit_dir=None, compression=None, dtypes=None, trace_memory=False):
+    """
+    DataFrame 조각(chunk)을 순서대로 받아 하나의 커밋으로 저장합니다.
+    조각을 row group 크기(__COLUMNAR_ROW_GROUP_ROWS 행)만큼 모은 뒤 블록을 객체 저장소에 기록하고 버리므로,
+    조각이 작아도 row group이 잘게 나뉘지 않고, 메모리에 한 번에 올릴 수 없는 크기도 커밋할 수 있습니다.
+    모든 조각은 첫 조각과 컬럼/dtype이 같아야 하며, attrs는 첫 조각 기준으로 기록됩니다.
+    이미 기록한 조각은 다시 쓰지 않으므로, 뒤 조각의 dtype은 값 손실 없이 첫 조각 dtype으로 바꿀 수 있을 때만
+    (예: int32 → int64, int → float) 맞춰 저장하고, 그렇지 않으면 ValueError를 발생시킵니다.
+    (예: 첫 조각 int, 뒤 조각에 NaN이 생겨 float → dtypes={"a": "float64"}로 모든 조각의 dtype을 지정)
+    
+    Parameters:
+    -----------
+    frames : iterable of DataFrame
+        예: pd.read_csv(..., chunksize=100_000)
+    msg : str
+        커밋 메시지 (같은 메시지가 있으면 대체)
+    compression : str, optional
+        블록 압축 수준 'fast' | 'balanced' | 'small' (기본값: set_commit_compression 설정값)
+    dtypes : dict or dtype, optional
+        모든 조각에 적용할 dtype (DataFrame.astype 인자)
+    trace_memory : bool, default False
+        True이면 커밋 중 추가 메모리 최대치(peak_memory)를 기록 (pd_commit 참고, 키워드 인자로 지정)
+    
+    Returns:
+    --------
+    str : 커밋 해시
+    
+    Examples:
+    ---------
+    >>> helper.commit_stream(pd.read_csv("big.csv", chunksize=100_000), "원본")
+    >>> helper.commit_stream(pd.read_csv("big.csv", chunksize=100_000), "원본", dtypes={"score": "float64"})
+    >>> for chunk in pd.DataFrame.checkout("원본", chunksize=100_000): ...
+    """
+    compression = _commit_compression(compression)
+    _commit_wait_pending()
+    started = time.perf_counter()
+    save_dir = _commit_save_dir(commit_dir)
+    object_dir = os.path.join(save_dir, "objects")
+    os.makedirs(save_dir, exist_ok=True)
+
+    schema = None
+    row_groups = []
+    pending, pending_rows = [], 0  # 아직 row group 하나를 채우지 못한 조각들
+    nrows = size = 0
+    stats = {"blocks": 0, "new_blocks": 0, "new_bytes": 0, "plan": 0.0}
+
+    def _store(part):
+        nonlocal size
+        blocks = []
+        t0 = time.perf_counter()
+        row_groups.extend(_columnar_plan_row_groups(part, blocks))
+        stats["plan"] += time.perf_counter() - t0
+        _commit_timed_write(stats, _columnar_store_objects, blocks, object_dir, compression, stats)
+        stats["blocks"] += len(blocks)
+        size += sum(block["size"] for block, _, _, _ in blocks)
+
+    for chunk in frames:
+        if not isinstance(chunk, pd.DataFrame):
+            raise ValueError(f"commit_stream의 조각은 DataFrame이어야 합니다. 현재 타입: {type(chunk)}")
+        if dtypes is not None:
+            chunk = chunk.astype(dtypes)
+        if schema is None:
+            schema = chunk.iloc[:0]
+            schema.attrs = copy.deepcopy(dict(getattr(chunk, 'attrs', {})))
+        elif not chunk.columns.equals(schema.columns):
+            raise ValueError("commit_stream의 모든 조각은 첫 조각과 컬럼이 같아야 합니다.")
+        else:
+            chunk = _stream_align_dtypes(chunk, schema)
+        if len(chunk) == 0:
+            continue
+        pending.append(chunk)
+        pending_rows += len(chunk)
+        nrows += len(chunk)
+        if pending_rows >= __COLUMNAR_ROW_GROUP_ROWS:
+            # 꽉 찬 row group만 기록하고 남은 행은 다음 조각과 합침
+            buffered = pending[0] if len(pending) == 1 else pd.concat(pending)
+            full = pending_rows - pending_rows % __COLUMNAR_ROW_GROUP_ROWS
+            _store(buffered.iloc[:full])
+            pending = [buffered.iloc[full:]] if full < pending_rows else []
+            pending_rows -= full
+    if schema is None:
+        raise ValueError("commit_stream에 전달된 조각이 없습니다.")
+    if pending:
+        _store(pending[0] if len(pending) == 1 else pd.concat(pending))
+
+    blocks = []
+    if not row_groups:  # 모든 조각이 비어 있으면 빈 row group 하나
+        row_groups = _columnar_plan_row_groups(schema, blocks)
+    footer = _columnar_footer(schema, row_groups, nrows, blocks)
+    size += sum(block["size"] for block, _, _, _ in blocks)
+    record = _commit_publish(footer, blocks, msg, commit_dir, stats=stats, size=size,
+                             compression=compression, started=started)
+    return record["hash"]
+
+# =============================================================================
+# PANDAS COMMIT SYSTEM: HISTORY QUERY
+# =============================================================================
+
+class CommitHandle:
+    """
+    commit_query/commit_as_of가 반환하는 커밋 참조
+    메타데이터 레코드만 들고 있으며, 데이터는 checkout()을 호출할 때 읽습니다.
+    """
+    def __init__(self, record, commit_dir=None):
+        self.record = record
+        self.commit_dir = commit_dir
+
+    @property
+    def hash(self):
+        return self.record["hash"]
+
+    @property
+    def msg(self):
+        return self.record["msg"]
+
+    @property
+    def datetime(self):
+        return pd.Timestamp(self.record["datetime"])
+
+    @property
+    def tags(self):
+        return list(self.record.get("tags", []))
+
+    @property
+    def type(self):
+        return self.record.get("type", "bundle" if "members" in self.record else "frame")
+
+    def checkout(self, **kwargs):
+        """이 커밋을 복원 (pd_checkout 인자 사용 가능: columns, rows, member, chunksize, mmap)"""
+        return pd_checkout(self.hash, commit_dir=self.commit_dir, **kwargs)
+
+    def __repr__(self):
+        tags = f" {self.tags}" if self.tags else ""
+        return f"CommitHandle({self.hash[:12]} | {self.record['datetime']} | {self.msg}{tags})"
+
+def commit_query(since=None, until=None, msg_regex=None, tag=None, commit_dir=None, limit=None):
+    """
+    메타데이터 인덱스만으로 조건에 맞는 커밋을 찾습니다. (커밋 파일은 열지 않음)
+    시간 범위는 시간순 목록에서 이진 탐색으로 잘라내고, 그 안에서만 메시지/태그를 확인합니다.
+    
+    Parameters:
+    -----------
+    since, until : str, datetime, Timestamp, optional
+        이 시간 이후/이전 커밋만 (경계 포함)
+    msg_regex : str or re.Pattern, optional
+        메시지에서 찾을 정규식 (re.search)
+    tag : str, optional
+        이 태그가 붙은 커밋만 (commit_tag 참고)
+    commit_dir : str, optional
+        저장 폴더 지정
+    limit : int, optional
+        최근 커밋부터 최대 limit개만
+    
+    Returns:
+    --------
+    list of CommitHandle (시간순)
+    
+    Examples:
+    ---------
+    >>> hs = helper.commit_query(since="2024-05-01", msg_regex=r"^epoch \d+")
+    >>> df = hs[-1].checkout()
+    """
+    _commit_wait_pending()
+    index = _load_commit_index(commit_dir)
+    since = None if since is None else _commit_time_str(since)
+    until = None if until is None else _commit_time_str(until)
+    pattern = None if msg_regex is None else re.compile(msg_regex)
+    records = [m for m in index.between(since, until)
+               if (pattern is None or pattern.search(str(m["msg"])))
+               and (tag is None or tag in m.get("tags", ()))]
+    if limit is not None:
+        records = records[-limit:] if limit > 0 else []
+    return [CommitHandle(m, commit_dir) for m in records]
+
+def commit_as_of(when=None, msg_prefix=None, commit_dir=None):
+    """
+    when 시점(포함)에 최신이었던 커밋을 이진 탐색으로 찾습니다. when이 None이면 가장 최근 커밋.
+    msg_prefix를 지정하면 그 시점 이전 커밋 중 메시지가 msg_prefix로 시작하는 가장 최근 커밋을 찾습니다.
+    반환값: CommitHandle, 없으면 None
+    """
+    _commit_wait_pending()
+    index = _load_commit_index(commit_dir)
+    times, ordered = index.timeline()
+    stop = len(times) if when is None else bisect.bisect_right(times, _commit_time_str(when))
+    for m in reversed(ordered[:stop]):
+        if msg_prefix is None or str(m["msg"]).startswith(msg_prefix):
+            return CommitHandle(m, commit_dir)
+    return None
+
+def checkout_latest(msg_prefix=None, as_of=None, commit_dir=None, **kwargs):
+    """
+    메시지가 msg_prefix로 시작하는 가장 최근 커밋을 복원합니다. (as_of를 주면 그 시점 기준)
+    나머지 인자는 pd_checkout과 같습니다. 찾지 못하면 빈 DataFrame 반환
+    
+    Examples:
+    ---------
+    >>> df = helper.checkout_latest("전처리")
+    >>> df = helper.checkout_latest(as_of="2024-05-01 12:00:00")   # 그 시점의 최신 커밋
+    """
+    handle = commit_as_of(as_of, msg_prefix, commit_dir)
+    if handle is None:
+        condition = [f"메시지 '{msg_prefix}'로 시작" if msg_prefix is not None else None,
+                     f"{as_of} 이전" if as_of is not None else None]
+        print(f"오류: 조건({', '.join(c for c in condition if c) or '전체'})에 맞는 커밋을 찾을 수 없습니다.")
+        return pd.DataFrame()
+    return handle.checkout(**kwargs)
+
+# =============================================================================
+# PANDAS COMMIT SYSTEM: RETENTION AND PACKING
+# =============================================================================
+
+def commit_tag(idx_or_hash, tag, commit_dir=None, remove=False):
+    """
+    커밋에 태그를 붙이거나(remove=False) 뗍니다(remove=True).
+    태그가 붙은 커밋은 commit_gc에서 보존됩니다. (keep_tags=True)
+    """
+    _commit_wait_pending()
+    with _commit_meta_lock(commit_dir):
+        index = _load_commit_index(commit_dir, for_update=True)
+        _, record = _resolve_commit(index, idx_or_hash)
+        if record is None:
+            return False
+        tags = [t for t in record.get("tags", []) if t != tag]
+        if not remove:
+            tags.append(tag)
+        if tags:
+            record["tags"] = tags
+        else:
+            record.pop("tags", None)
+        _save_commit_index(index, commit_dir)
+    return True
+
+def _commit_store_sizes(commit_dir=None):
+    """커밋 파일 크기 {파일 이름: 바이트}와 객체 크기 {객체 해시: 바이트}"""
+    save_dir = _commit_save_dir(commit_dir)
+    object_dir = os.path.join(save_dir, "objects")
+    file_sizes = {}
+    if os.path.isdir(save_dir):
+        with os.scandir(save_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    file_sizes[entry.name] = entry.stat().st_size
+    object_sizes = {h: length for h, (_, _, length) in _pack_index(object_dir).items()}
+    object_sizes.update({h: size for h, (_, size) in _loose_objects(object_dir).items()})
+    return file_sizes, object_sizes
+
+def commit_gc(keep_last=None, keep_daily=None, keep_tags=True, max_bytes=None, commit_dir=None):
+    """
+    보존 규칙에 맞지 않는 커밋을 한 번에 삭제합니다.
+    
+    Parameters:
+    -----------
+    keep_last : int, optional
+        최근 커밋 N개 보존
+    keep_daily : int 또는 True, optional
+        최근 N일(True면 전체 기간) 동안 하루에 가장 마지막 커밋 하나씩 보존
+    keep_tags : bool
+        태그가 붙은 커밋 보존 (commit_tag 참고)
+    max_bytes : int, optional
+        커밋 저장소(커밋 파일 + 객체) 전체 크기 제한. 넘으면 태그 없는 오래된 커밋부터 삭제
+        (로컬 memory-map 캐시는 저장소 밖에 있어 포함하지 않음, mmap_cache_set_limit으로 따로 제한)
+    
+    keep_last/keep_daily를 모두 생략하면 max_bytes 제한만 적용하고, 규칙이 하나도 없으면 커밋은 삭제하지 않습니다.
+    어느 경우든 어떤 커밋도 참조하지 않는 객체 블록을 정리합니다.
+    (커밋, pd_commit_rm, 같은 메시지 재커밋은 빠르게 끝나도록 객체를 지우지 않고 남겨 둡니다.)
+    
+    Returns:
+    --------
+    list : 삭제한 커밋 해시 목록
+    
+    Examples:
+    ---------
+    >>> helper.commit_gc(keep_last=10, keep_daily=7)
+    >>> helper.commit_gc(max_bytes=5 * 1024**3)
+    >>> helper.commit_gc()   # 미참조 객체만 정리
+    """
+    _commit_wait_pending()
+    with _commit_meta_lock(commit_dir):
+        return _commit_gc_locked(keep_last, keep_daily, keep_tags, max_bytes, commit_dir)
+
+@_stage_batched
+def _commit_gc_locked(keep_last, keep_daily, keep_tags, max_bytes, commit_dir):
+    """commit_gc의 실제 처리 (메타데이터 잠금 안에서 실행)"""
+    index = _load_commit_index(commit_dir, for_update=True)
+    save_dir = _commit_save_dir(commit_dir)
+    records = sorted(index.records, key=lambda x: x["datetime"])
+    tagged = {id(m) for m in records if keep_tags and m.get("tags")}
+
+    if keep_last is None and keep_daily is None:
+        keep = {id(m) for m in records}
+    else:
+        keep = set(tagged)
+        if keep_last:
+            keep.update(id(m) for m in records[-keep_last:])
+        if keep_daily:
+            daily = {}
+            for m in records:
+                daily[m["datetime"][:10]] = m  # 날짜별 마지막 커밋
+            days = sorted(daily)
+            if keep_daily is not True:
+                days = days[-keep_daily:]
+            keep.update(id(daily[d]) for d in days)
+
+    if max_bytes is not None:
+        refs = _commit_object_refs(commit_dir)
+        file_sizes, object_sizes = _commit_store_sizes(commit_dir)
+        kept = [m for m in records if id(m) in keep]
+        file_count = {}
+        for m in kept:
+            for fname in _record_files(m):
+                file_count[fname] = file_count.get(fname, 0) + 1
+        object_count = {}
+        for fname in file_count:
+            for h in refs.get(fname, ()):
+                object_count[h] = object_count.get(h, 0) + 1
+        total = (sum(file_sizes.get(f, 0) for f in file_count)
+                 + sum(object_sizes.get(h, 0) for h in object_count))
+        for m in kept:
+            if total <= max_bytes:
+                break
+            if id(m) in tagged:
+                continue
+            keep.discard(id(m))
+            for fname in _record_files(m):
+                file_count[fname] -= 1
+                if file_count[fname]:
+                    continue  # 같은 파일을 참조하는 다른 커밋이 남아 있음
+                total -= file_sizes.get(fname, 0)
+                for h in refs.get(fname, ()):
+                    object_count[h] -= 1
+                    if not object_count[h]:
+                        total -= object_sizes.get(h, 0)
+
+    removed = [m for m in records if id(m) not in keep]
+    for m in removed:
+        index.remove(m)
+        __checkout_cache.discard(m["hash"])
+    if removed:
+        _save_commit_index(index, commit_dir)
+    for m in removed:
+        _commit_remove_files(index, m, save_dir)
+    # 커밋/삭제 때는 객체를 정리하지 않으므로 (pd_commit_rm, 같은 메시지 재커밋) 여기서 한 번에 정리
+    swept = _commit_gc_objects(commit_dir)
+    if removed and _stage_listdir(_pack_dir(os.path.join(save_dir, "objects"))):
+        _commit_pack_locked(commit_dir)  # 팩 안에 남은 삭제 객체 정리
+    if removed or swept:
+        print(f"✅ 커밋 {len(removed)}개 삭제, 미참조 객체 {swept}개 정리 (남은 커밋 {len(index)}개)")
+    else:
+        print("삭제할 커밋이 없습니다.")
+    return [m["hash"] for m in removed]
+
+def commit_pack(commit_dir=None):
+    """
+    개별 객체 파일과 기존 팩 파일을 살아 있는 객체만 담은 팩 파일 하나로 합칩니다.
+    팩 파일(pack-*.pack)은 압축 블록을 이어 붙인 파일이고, 인덱스(pack-*.idx)에 객체별 위치가 기록됩니다.
+    커밋이 많아도 객체 디렉토리의 파일 수가 늘지 않아 목록 조회/동기화가 빨라집니다.
+    
+    Returns:
+    --------
+    dict : objects (팩에 담은 객체 수), bytes (팩 크기), removed_files (삭제한 파일 수)
+    """
+    _commit_wait_pending()
+    with _commit_meta_lock(commit_dir):
+        return _commit_pack_locked(commit_dir)
+
+@_stage_batched
+def _commit_pack_locked(commit_dir=None):
+    """commit_pack의 실제 처리 (메타데이터 잠금 안에서 실행)"""
+    save_dir = _commit_save_dir(commit_dir)
+    object_dir = os.path.join(save_dir, "objects")
+    pack_dir = _pack_dir(object_dir)
+    referenced = set().union(*_commit_object_refs(commit_dir).values())
+    loose = _loose_objects(object_dir)
+    packed = _pack_index(object_dir)
+    old_packs = {pack_path for pack_path, _, _ in packed.values()}
+    live = sorted(h for h in referenced if h in loose or h in packed)
+    if not loose and len(old_packs) <= 1 and set(packed) == set(live):
+        print("팩으로 합칠 객체가 없습니다.")
+        return {"objects": len(live), "bytes": 0, "removed_files": 0}
+
+    os.makedirs(pack_dir, exist_ok=True)
+    temp_path = _temp_path(os.path.join(pack_dir, "pack"))
+    entries = {}
+    with open(temp_path, "wb") as f:
+        for object_hash in live:
+            payload = _columnar_read_object(object_dir, object_hash)
+            entries[object_hash] = [f.tell(), len(payload)]
+            f.write(payload)
+        nbytes = f.tell()
+        f.flush()
+        os.fsync(f.fileno())
+    index_bytes = json.dumps(entries, separators=(",", ":")).encode("utf-8")
+    name = "pack-" + hashlib.blake2b(index_bytes, digest_size=16).hexdigest()
+    pack_path = os.path.join(pack_dir, name + ".pack")
+    os.replace(temp_path, pack_path)
+    _stage_push(pack_path)
+    # .idx는 팩 파일이 완성된 뒤에 만들어야 중간에 실패해도 깨진 팩을 읽지 않음
+    index_temp = _temp_path(os.path.join(pack_dir, name + ".idx"))
+    with open(index_temp, "wb") as f:
+        f.write(index_bytes)
+    os.replace(index_temp, os.path.join(pack_dir, name + ".idx"))
+    _stage_push(os.path.join(pack_dir, name + ".idx"))
+
+    removed = 0
+    for old in old_packs - {pack_path}:
+        _stage_remove(old[:-len(".pack")] + ".idx", missing_ok=True)
+        _stage_remove(old, missing_ok=True)
+        removed += 2
+    for path, _ in loose.values():
+        _stage_remove(path, missing_ok=True)
+        removed += 1
+    with os.scandir(object_dir) as prefixes:
+        for prefix in prefixes:
+            if prefix.is_dir() and prefix.name != "pack" and not os.listdir(prefix.path):
+                os.rmdir(prefix.path)
+    print(f"✅ 팩 생성: {name} (객체 {len(live)}개, {nbytes / 1024 / 1024:.2f}MB, 파일 {removed}개 정리)")
+    return {"objects": len(live), "bytes": nbytes, "removed_files": removed}
+
+
+# =============================================================================
+# PANDAS COMMIT SYSTEM: DIFF
+# =============================================================================
+
+def _diff_source(path, stack):
+    """
+    커밋 파일의 (footer, 블록 읽기 함수)
+    이전 pickle 커밋은 메모리에서 같은 블록 구조로 나눠 해시 비교가 가능하게 합니다.
+    """
+    if path.endswith(".pkl_helper"):
+        footer, blocks = _columnar_plan(df_read_pickle(path))
+        buffers = {id(block): (kind, dtype, buffer) for block, kind, dtype, buffer in blocks}
+        return footer, lambda block: _columnar_decode(*buffers[id(block)])
+    f = stack.enter_context(open(path, "rb"))
+    object_dir = os.path.join(os.path.dirname(os.path.abspath(path)), "objects")
+    return _columnar_read_footer(f), lambda block: _columnar_read_block(f, block, object_dir)
+
+def _diff_same_block(x, y):
+    """두 블록의 내용 해시가 같으면 True (파일 안에 기록된 블록은 해시가 없으므로 항상 읽어서 비교)"""
+    return "object" in x and x.get("object") == y.get("object")
+
+def _diff_changed(x, y):
+    """같은 위치의 값끼리 비교해서 다른 칸 수 (양쪽 모두 결측이면 같은 값으로 봄)"""
+    x = pd.Series(x, copy=False).reset_index(drop=True)
+    y = pd.Series(y, copy=False).reset_index(drop=True)
+    try:
+        equal = x.eq(y)
+    except (TypeError, ValueError):  # 비교할 수 없는 dtype 조합 (카테고리 불일치 등)
+        equal = x.astype(object).eq(y.astype(object))
+    equal = equal.fillna(False).to_numpy(dtype=bool) | (x.isna() & y.isna()).to_numpy()
+    return int(len(equal) - equal.sum())
+
+def commit_diff(a, b, commit_dir=None, member=None):
+    """
+    두 커밋 사이의 변경 내용을 비교합니다.
+    (컬럼, row group) 블록 해시가 같은 영역은 읽지 않고 건너뛰며,
+    해시가 다른 블록만 읽어서 벡터 연산으로 비교합니다. 한 번에 컬럼 하나씩만 읽으므로
+    전체를 메모리에 올리기 어려운 큰 커밋도 비교할 수 있습니다.
+    
+    Parameters:
+    -----------
+    a, b : int 또는 str
+        비교할 커밋 (순서번호, 해시, 메시지, 시간)
+    member : str, optional
+        묶음 커밋(commit_many)이면 비교할 멤버 이름
+    
+    Returns:
+    --------
+    dict : columns_added, columns_removed, dtype_changes {컬럼: (a dtype, b dtype)},
+           index_added, index_removed (pd.Index),
+           changed_cells (컬럼별 변경 칸 수, Int64 pd.Series — 행을 맞출 수 없으면 <NA>),
+           attrs_changed, shape (a shape, b shape), identical
+    
+    Examples:
+    ---------
+    >>> diff = helper.commit_diff("이상치 제거 전", "이상치 제거 후")
+    >>> diff["changed_cells"]
+    """
+    _commit_wait_pending()
+    index = _load_commit_index(commit_dir)
+    save_dir = _commit_save_dir(commit_dir)
+    _, ra = _resolve_commit(index, a)
+    _, rb = _resolve_commit(index, b)
+    if ra is None or rb is None:
+        return None
+
+    with contextlib.ExitStack() as stack:
+        fa, read_a = _diff_source(_stage_pull(os.path.join(save_dir, _record_file(ra, member))), stack)
+        fb, read_b = _diff_source(_stage_pull(os.path.join(save_dir, _record_file(rb, member))), stack)
+        if "ndarray" in (fa.get("type"), fb.get("type")):
+            raise ValueError("commit_diff는 DataFrame/Series 커밋만 비교할 수 있습니다.")
+        cols_a, cols_b = read_a(fa["columns"]), read_b(fb["columns"])
+
+        # 컬럼 라벨 짝짓기 (중복 라벨은 등장 순서대로)
+        positions_b = {}
+        for j, label in enumerate(cols_b):
+            positions_b.setdefault(label, []).append(j)
+        pairs, columns_removed = [], []
+        for i, label in enumerate(cols_a):
+            if positions_b.get(label):
+                pairs.append((label, i, positions_b[label].pop(0)))
+            else:
+                columns_removed.append(label)
+        columns_added = [label for label, rest in positions_b.items() for _ in rest]
+        dtype_changes = {label: (fa["dtypes"][i], fb["dtypes"][j])
+                         for label, i, j in pairs if fa["dtypes"][i] != fb["dtypes"][j]}
+
+        groups_a, groups_b = fa["row_groups"], fb["row_groups"]
+        aligned = (len(groups_a) == len(groups_b)
+                   and all(ga["nrows"] == gb["nrows"] and _diff_same_block(ga["index"], gb["index"])
+                           for ga, gb in zip(groups_a, groups_b)))
+
+        changed = []
+        if aligned:
+            # 인덱스가 같으면 row group 단위로 해시가 다른 블록만 비교
+            index_added = index_removed = pd.Index([])
+            for label, i, j in pairs:
+                count = 0
+                for ga, gb in zip(groups_a, groups_b):
+                    block_a, block_b = ga["columns"][i], gb["columns"][j]
+                    if not _diff_same_block(block_a, block_b):
+                        count += _diff_changed(read_a(block_a), read_b(block_b))
+                changed.append(count)
+        else:
+            def _full(read, groups, key_fn):
+                return _columnar_concat([read(key_fn(g)) for g in groups])
+
+            def _full_index(read, groups):
+                parts = [read(g["index"]) for g in groups]
+                return parts[0].append(parts[1:]) if len(parts) > 1 else parts[0]
+
+            index_a, index_b = _full_index(read_a, groups_a), _full_index(read_b, groups_b)
+            index_added = index_b.difference(index_a, sort=False)
+            index_removed = index_a.difference(index_b, sort=False)
+            if index_a.is_unique and index_b.is_unique:
+                common = index_a.intersection(index_b, sort=False)
+                take_a, take_b = index_a.get_indexer(common), index_b.get_indexer(common)
+            elif len(index_a) == len(index_b):
+                take_a = take_b = slice(None)  # 중복 라벨: 위치 기준 비교
+            else:
+                take_a = take_b = None
+                print("경고: 인덱스에 중복 라벨이 있어 행을 맞출 수 없습니다. 변경 칸 수는 계산하지 않습니다.")
+            for label, i, j in pairs:
+                if take_a is None:
+                    changed.append(pd.NA)
+                    continue
+                values_a = pd.Series(_full(read_a, groups_a, lambda g: g["columns"][i]), copy=False)
+                values_b = pd.Series(_full(read_b, groups_b, lambda g: g["columns"][j]), copy=False)
+                changed.append(_diff_changed(values_a.iloc[take_a], values_b.iloc[take_b]))
+
+        attrs_changed = (not _diff_same_block(fa["attrs"], fb["attrs"])
+                         and read_a(fa["attrs"]) != read_b(fb["attrs"]))
+
+    # 정렬 여부와 상관없이 같은 dtype (행을 맞출 수 없어 세지 못한 컬럼은 <NA>)
+    changed_cells = pd.Series(changed, index=[label for label, _, _ in pairs], dtype="Int64")
+    result = {
+        "columns_added": columns_added,
+        "columns_removed": columns_removed,
+        "dtype_changes": dtype_changes,
+        "index_added": index_added,
+        "index_removed": index_removed,
+        "changed_cells": changed_cells,
+        "attrs_changed": bool(attrs_changed),
+        "shape": ((fa["nrows"], fa["ncols"]), (fb["nrows"], fb["ncols"])),
+    }
+    result["identical"] = not (columns_added or columns_removed or dtype_changes or len(index_added)
+                               or len(index_removed) or changed_cells.fillna(1).any() or attrs_changed)
+    print(f"커밋 비교: {ra['hash']} → {rb['hash']} | 컬럼 +{len(columns_added)}/-{len(columns_removed)}, "
+          f"dtype 변경 {len(dtype_changes)}, 행 +{len(index_added)}/-{len(index_removed)}, "
+          f"변경 칸 {int(changed_cells.fillna(0).sum())}")
+    return result
+
+# =============================================================================
+# PANDAS COMMIT SYSTEM: INTEGRITY CHECK
+# =============================================================================
+
+def _fsck_orphan_idle(save_dir, name):
+    """
+    메타데이터에 없는 커밋 파일이 기록 중이 아닌지 확인
+    잠금 만료 시간 안에 수정되었거나, 이 컴퓨터에서 실행 중인 프로세스의 임시 파일(_temp_path)이면 False
+    """
+    try:
+        if time.time() - os.stat(os.path.join(save_dir, name)).st_mtime < __COMMIT_LOCK_STALE:
+            return False
+    except FileNotFoundError:
+        pass  # 원격에만 있는 파일
+    parts = name.split(".")
+    if os.name != "nt" and name.endswith(".tmp") and len(parts) >= 4 and parts[-3].isdigit():
+        try:
+            os.kill(int(parts[-3]), 0)
+            return False  # 기록 중인 프로세스가 살아 있음
+        except (ProcessLookupError, ValueError, OverflowError):
+            pass
+        except OSError:
+            return False  # 권한 없음 = 다른 사용자의 살아 있는 프로세스
+    return True
+
+def _fsck_check_file(save_dir, fname, fingerprint=None):
+    """
+    커밋 파일 하나 점검: (footer 또는 None, 문제 사유 또는 None)
+    columnar 파일은 footer 지문을 메타데이터의 fingerprint와 비교하고, 이전 pickle 파일은 읽어 봅니다.
+    """
+    file_path = _stage_pull(os.path.join(save_dir, fname))
+    if not os.path.exists(file_path):
+        return None, "missing"
+    try:
+        if fname.endswith(".pkl_helper"):
+            df_read_pickle(file_path)
+            return None, None
+        with open(file_path, "rb") as f:
+            footer = _columnar_read_footer(f)
+    except Exception as e:
+        return None, f"읽기 실패: {e}"
+    if fingerprint is not None and _columnar_fingerprint(footer) != fingerprint:
+        return footer, "지문 불일치"
+    return footer, None
+
+def _fsck_check_object(object_dir, object_hash, block):
+    """객체 블록 하나를 읽고 압축을 풀어 내용 해시 확인 (문제 없으면 None, 있으면 'missing' 또는 사유)"""
+    try:
+        payload = _columnar_read_object(object_dir, object_hash)
+    except FileNotFoundError:
+        return "missing"
+    try:
+        buffer = _codec_decompress(payload)
+    except Exception as e:
+        return f"압축 해제 실패: {e}"
+    if _columnar_block_hash(block["kind"], block["dtype"], buffer) != object_hash:
+        return "해시 불일치"
+    return None
+
+def commit_fsck(repair=False, commit_dir=None):
+    """
+    커밋 저장소의 무결성을 점검하고 보고서를 반환합니다.
+    - 메타데이터(pandas_df.json)가 가리키는 커밋 파일이 있는지, footer 지문이 기록된 fingerprint와 같은지
+    - 커밋이 참조하는 모든 객체 블록을 읽고 압축을 풀어 내용 해시가 맞는지 (스레드 풀에서 병렬 점검)
+    - 메타데이터에 없는 커밋 파일/임시 파일(고아 파일)과 어떤 커밋도 참조하지 않는 객체
+    점검만으로는 아무것도 바꾸지 않습니다. (checkout/commit_list도 메타데이터를 고치지 않음)
+    
+    Parameters:
+    -----------
+    repair : bool, default False
+        True이면 잠금 안에서 다음을 정리합니다.
+        파일/객체가 없거나 손상된 커밋을 메타데이터에서 제거, 손상된 개별 객체 파일 삭제,
+        고아 파일 삭제, 참조되지 않는 객체 정리.
+        고아 파일은 다른 프로세스가 기록 중일 수 있으므로 잠금 만료 시간보다 오래된 것만 대상입니다.
+    
+    Returns:
+    --------
+    dict : commits, files, objects (점검한 개수), missing_files, corrupt_files (커밋별 dict 목록),
+           missing_objects, corrupt_objects, orphan_files, orphan_objects, ok, repaired
+    
+    Examples:
+    ---------
+    >>> report = helper.commit_fsck()
+    >>> if not report["ok"]:
+    ...     helper.commit_fsck(repair=True)
+    """
+    _commit_wait_pending()
+    save_dir = _commit_save_dir(commit_dir)
+    object_dir = os.path.join(save_dir, "objects")
+    index = _load_commit_index(commit_dir)
+
+    # 커밋 파일 점검 (파일 이름 → 그 파일을 쓰는 (레코드, 기대 지문) 목록)
+    users = {}
+    for m in index.records:
+        entries = m["members"].values() if "members" in m else [m]
+        for entry in entries:
+            users.setdefault(entry["file"], []).append((m, entry.get("fingerprint")))
+    fnames = sorted(users)
+    results = dict(zip(fnames, _codec_map(
+        lambda fname: _fsck_check_file(save_dir, fname, users[fname][0][1]), fnames)))
+
+    # 객체 블록 점검 (여러 커밋이 공유하는 객체는 한 번만)
+    blocks, object_files = {}, {}
+    for fname, (footer, _) in results.items():
+        if footer is None:
+            continue
+        for block in _columnar_footer_blocks(footer):
+            if "object" in block:
+                blocks.setdefault(block["object"], block)
+                object_files.setdefault(block["object"], set()).add(fname)
+    hashes = sorted(blocks)
+    object_errors = dict(zip(hashes, _codec_map(
+        lambda h: _fsck_check_object(object_dir, h, blocks[h]), hashes)))
+    missing_objects = [h for h in hashes if object_errors[h] == "missing"]
+    corrupt_objects = [h for h in hashes if object_errors[h] not in (None, "missing")]
+
+    bad_files = {fname for fname, (_, error) in results.items() if error is not None}
+    bad_files.update(f for h in missing_objects + corrupt_objects for f in object_files[h])
+    missing_files, corrupt_files, bad_records = [], [], {}
+    for fname in sorted(bad_files):
+        error = results[fname][1]
+        if error is None:
+            error = f"객체 블록 손상/누락 {sum(fname in object_files[h] for h in missing_objects + corrupt_objects)}개"
+        for m, _ in users[fname]:
+            bad_records[id(m)] = m
+            entry = {"hash": m["hash"], "msg": m["msg"], "file": fname}
+            if error == "missing":
+                missing_files.append(entry)
+            else:
+                corrupt_files.append(dict(entry, error=error))
+
+    # 고아 파일 (기록 중인 파일을 건드리지 않도록 잠금 만료 시간보다 오래된 것만)
+    meta_name = os.path.basename(_commit_meta_file(commit_dir))
+    skip = set(users) | {meta_name, meta_name + ".lock", "objects", "mmap"}
+    orphan_files = [name for name in sorted(_stage_listdir(save_dir) - skip)
+                     if name.endswith((".col_helper", ".pkl_helper", ".tmp")) and _fsck_orphan_idle(save_dir, name)]
+    stored = set(_loose_objects(object_dir)) | set(_pack_index(object_dir))
+    orphan_objects = sorted(stored - set(hashes))
+
+    report = {
+        "commits": len(index),
+        "files": len(fnames),
+        "objects": len(hashes),
+        "missing_files": missing_files,
+        "corrupt_files": corrupt_files,
+        "missing_objects": missing_objects,
+        "corrupt_objects": corrupt_objects,
+        "orphan_files": orphan_files,
+        "orphan_objects": orphan_objects,
+        "ok": not (missing_files or corrupt_files or missing_objects or corrupt_objects),
+        "repaired": None
+    }
+    print(f"🔍 커밋 저장소 점검: 커밋 {report['commits']}개, 파일 {report['files']}개, 객체 {report['objects']}개 | "
+          f"파일 누락 {len(missing_files)}, 손상 {len(corrupt_files)}, 객체 누락 {len(missing_objects)}, "
+          f"객체 손상 {len(corrupt_objects)}, 고아 파일 {len(orphan_files)}, 미참조 객체 {len(orphan_objects)}")
+    for entry in missing_files + corrupt_files:
+        print(f"  - {entry['hash']} | {entry['msg']} | {entry['file']}: {entry.get('error', '파일 없음')}")
+
+    if repair:
+        report["repaired"] = _commit_fsck_repair(bad_records, corrupt_objects, orphan_files, commit_dir)
+    return report
+
+@_stage_batched
+def _commit_fsck_repair(bad_records, corrupt_objects, orphan_files, commit_dir=None):
+    """commit_fsck(repair=True)의 정리 작업 (메타데이터 잠금 안에서 실행)"""
+    save_dir = _commit_save_dir(commit_dir)
+    object_dir = os.path.join(save_dir, "objects")
+    with _commit_meta_lock(commit_dir):
+        index = _load_commit_index(commit_dir, for_update=True)  # 점검 이후 바뀌었을 수 있으므로 해시로 다시 찾음
+        bad_hashes = {m["hash"] for m in bad_records.values()}
+        removed_commits = []
+        for m in [m for m in index.records if m["hash"] in bad_hashes]:
+            index.remove(m)
+            __checkout_cache.discard(m["hash"])
+            _commit_remove_files(index, m, save_dir)
+            removed_commits.append(m["hash"])
+        if removed_commits:
+            _save_commit_index(index, commit_dir)
+
+        loose = _loose_objects(object_dir)
+        removed_objects = 0
+        for object_hash in corrupt_objects:
+            # 팩 안의 손상 객체는 참조하던 커밋이 모두 제거되었으므로 commit_pack으로 다시 묶을 때 빠짐
+            if object_hash in loose:
+                _stage_remove(loose[object_hash][0], missing_ok=True)
+                removed_objects += 1
+        # 점검 이후 다른 프로세스가 게시했거나 아직 기록 중인 파일은 잠금 안에서 다시 확인해 건너뜀
+        orphan_files = [name for name in orphan_files
+                        if not _commit_file_referenced(index, name) and _fsck_orphan_idle(save_dir, name)]
+        for name in orphan_files:
+            _stage_remove(os.path.join(save_dir, name), missing_ok=True)
+        removed_objects += _commit_gc_objects(commit_dir)
+    repaired = {
+        "removed_commits": removed_commits,
+        "removed_files": len(orphan_files),
+        "removed_objects": removed_objects
+    }
+    print(f"🛠️ 복구 완료: 커밋 {len(removed_commits)}개 제거, 고아 파일 {len(orphan_files)}개, "
+          f"객체 {removed_objects}개 삭제")
+    return repaired
 
 # 모듈 import 시 자동으로 setup 실행
 if __name__ != "__main__":